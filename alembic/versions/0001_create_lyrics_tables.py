@@ -0,0 +1,131 @@
+"""create lyrics tables
+
+기존에 lifespan 의 create_all 로 테이블이 만들어진 DB 는
+`alembic stamp 0001` 후 업그레이드하세요.
+
+Revision ID: 0001
+Revises:
+Create Date: 2025-11-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "store_default_info",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("store_info", sa.Text(), nullable=True),
+        sa.Column("store_name", sa.String(length=255), nullable=False),
+        sa.Column("store_category", sa.String(length=255), nullable=True),
+        sa.Column("store_region", sa.String(length=255), nullable=True),
+        sa.Column("store_address", sa.String(length=255), nullable=True),
+        sa.Column("store_phone_number", sa.String(length=255), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("store_phone_number"),
+    )
+    op.create_table(
+        "prompt_template",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("description", sa.String(length=255), nullable=True),
+        sa.Column("prompt", sa.Text(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "attribute",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("attr_category", sa.String(length=255), nullable=False),
+        sa.Column("attr_value", sa.String(length=255), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("attr_value"),
+    )
+    op.create_table(
+        "song_sample",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("ai", sa.String(length=255), nullable=False),
+        sa.Column("ai_model", sa.String(length=255), nullable=False),
+        sa.Column("season", sa.String(length=255), nullable=True),
+        sa.Column("num_of_people", sa.Integer(), nullable=True),
+        sa.Column("people_category", sa.String(length=255), nullable=True),
+        sa.Column("genre", sa.String(length=255), nullable=True),
+        sa.Column("sample_song", sa.String(length=400), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("sample_song"),
+    )
+    op.create_table(
+        "song_results_all",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("store_info", sa.String(length=255), nullable=True),
+        sa.Column("store_name", sa.String(length=255), nullable=False),
+        sa.Column("store_category", sa.String(length=255), nullable=True),
+        sa.Column("store_address", sa.String(length=255), nullable=True),
+        sa.Column("store_phone_number", sa.String(length=255), nullable=True),
+        sa.Column("description", sa.String(length=255), nullable=True),
+        sa.Column("prompt", sa.String(length=255), nullable=False),
+        sa.Column("attr_category", sa.String(length=255), nullable=False),
+        sa.Column("attr_value", sa.String(length=255), nullable=False),
+        sa.Column("ai", sa.String(length=255), nullable=False),
+        sa.Column("ai_model", sa.String(length=255), nullable=False),
+        sa.Column("season", sa.String(length=255), nullable=True),
+        sa.Column("num_of_people", sa.Integer(), nullable=True),
+        sa.Column("people_category", sa.String(length=255), nullable=True),
+        sa.Column("genre", sa.String(length=255), nullable=True),
+        sa.Column("sample_song", sa.String(length=400), nullable=False),
+        sa.Column("result_song", sa.String(length=400), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("attr_value"),
+        sa.UniqueConstraint("prompt"),
+        sa.UniqueConstraint("result_song"),
+        sa.UniqueConstraint("sample_song"),
+        sa.UniqueConstraint("store_phone_number"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("song_results_all")
+    op.drop_table("song_sample")
+    op.drop_table("attribute")
+    op.drop_table("prompt_template")
+    op.drop_table("store_default_info")
@@ -0,0 +1,75 @@
+"""add lyrics access indexes
+
+관리자 목록(기본 정렬/검색/정렬 가능 컬럼)과 커서 페이지네이션이
+사용하는 접근 경로에 맞춘 복합 인덱스.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-11-20 00:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (인덱스 이름, 테이블, 컬럼) - app/lyrics/models.py 의 __table_args__ 와 동일
+INDEXES = [
+    ("idx_store_default_info_store_name", "store_default_info", ["store_name", "id"]),
+    ("idx_store_default_info_created_at_id", "store_default_info", ["created_at", "id"]),
+    ("idx_prompt_template_created_at_id", "prompt_template", ["created_at", "id"]),
+    ("idx_attribute_created_at_id", "attribute", ["created_at", "id"]),
+    (
+        "idx_attribute_attr_category_created_at",
+        "attribute",
+        ["attr_category", "created_at"],
+    ),
+    ("idx_song_sample_created_at_id", "song_sample", ["created_at", "id"]),
+    (
+        "idx_song_sample_ai_ai_model_created_at",
+        "song_sample",
+        ["ai", "ai_model", "created_at"],
+    ),
+    ("idx_song_results_all_created_at_id", "song_results_all", ["created_at", "id"]),
+    (
+        "idx_song_results_all_store_category_genre_created_at",
+        "song_results_all",
+        ["store_category", "genre", "created_at"],
+    ),
+    (
+        "idx_song_results_all_store_name_created_at",
+        "song_results_all",
+        ["store_name", "created_at"],
+    ),
+    (
+        "idx_song_results_all_ai_ai_model_created_at",
+        "song_results_all",
+        ["ai", "ai_model", "created_at"],
+    ),
+    (
+        "idx_song_results_all_attr_category_created_at",
+        "song_results_all",
+        ["attr_category", "created_at"],
+    ),
+    ("idx_song_results_all_ai_model", "song_results_all", ["ai_model"]),
+    ("idx_song_results_all_genre", "song_results_all", ["genre"]),
+    ("idx_song_results_all_num_of_people", "song_results_all", ["num_of_people"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -1,7 +1,7 @@
 from fastapi import FastAPI
 from sqladmin import Admin
 
-from app.database.session import engine
+from app.database.session import engine, routing_sessionmaker
 from app.lyrics.api.routers.lyrics_admin import (
     LyricsAttributeAdmin,
     LyricsPromptTemplateAdmin,
@@ -22,6 +22,9 @@ def init_admin(
     admin = Admin(
         app,
         db_engine,
+        # 목록/검색 조회는 읽기 복제본, 저장/삭제는 primary
+        # (sqladmin 이 세션 팩토리 설정을 바꾸므로 전용 팩토리 사용)
+        session_maker=routing_sessionmaker(read_only=True, expire_on_commit=True),
         base_url=base_url,
     )
 
@@ -0,0 +1,57 @@
+"""
+DB 테스트 공용 픽스처 (구성은 app/database/testing.py 참고)
+
+test_engine 은 세션 이벤트 루프에서 한 번만 만들어지므로, 이를 쓰는 테스트 모듈은
+같은 루프에서 실행되도록 표시합니다.
+
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+    async def test_something(db_session):
+        db_session.add(...)
+        await db_session.commit()  # 테스트가 끝나면 롤백됨
+
+    pytest                                             # 메모리 SQLite
+    TEST_DB_URL=mysql pytest -n auto                   # MySQL, pytest-xdist 워커별 DB
+"""
+
+from typing import AsyncGenerator
+
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.database.testing import (
+    create_database,
+    create_schema,
+    create_test_engine,
+    drop_schema,
+    transactional_session,
+    transactional_sessionmaker,
+    worker_database_url,
+)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def test_engine() -> AsyncGenerator[AsyncEngine, None]:
+    """테스트 세션(워커)마다 한 번 스키마를 만드는 엔진"""
+    url = worker_database_url()
+    await create_database(url)
+    engine = create_test_engine(url)
+    await create_schema(engine)
+
+    yield engine
+
+    await drop_schema(engine)
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def db_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
+    """테스트마다 롤백되는 세션 (commit() 해도 다른 테스트에 보이지 않음)"""
+    async with transactional_session(test_engine) as session:
+        yield session
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def db_sessionmaker(db_session) -> async_sessionmaker:
+    """db_session 과 같은 트랜잭션에 붙는 세션 팩토리 (테스트가 끝나면 함께 롤백)"""
+    return transactional_sessionmaker(db_session)
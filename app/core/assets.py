@@ -0,0 +1,103 @@
+"""
+정적 파일 지문(fingerprint) 빌드와 매니페스트
+
+배포 때 static/ 의 파일을 내용 해시가 들어간 이름으로 복사하고 매니페스트를 씁니다.
+
+    python -m app.core.assets static build/static  # site.css -> site.<해시>.css
+    python -m app.utils.compression build/static   # (선택) 사전 압축
+    STATIC_BUILD_DIR=build/static
+
+템플릿에서는 static_url() 로 매니페스트의 해시 이름을 씁니다. 내용이 바뀌면 URL 이
+바뀌므로 해시 파일은 1년 immutable 로 캐시할 수 있습니다 (HashedStaticFiles).
+매니페스트가 없으면 (개발) 원래 경로를 그대로 돌려줍니다.
+
+    <link href="{{ static_url('css/site.css') }}" rel="stylesheet">
+
+CSS 안의 url() 참조는 바꾸지 않으므로 이미지 등은 템플릿에서 static_url() 로 참조합니다.
+config.py 에서 import 하므로 이 모듈은 config 를 import 하지 않습니다.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path, PurePosixPath
+
+MANIFEST_NAME = "manifest.json"
+HASH_LENGTH = 12
+
+# 사전 압축 결과와 숨김 파일(.gitkeep 등)은 지문 대상에서 제외
+_SKIP_SUFFIXES = (".gz", ".br", ".zst")
+
+
+def hashed_name(path: str, data: bytes) -> str:
+    """css/site.css -> css/site.<sha256 앞 12자>.css"""
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+    pure = PurePosixPath(path)
+    return str(pure.with_name(f"{pure.stem}.{digest}{pure.suffix}"))
+
+
+def build_assets(source: str | Path, target: str | Path) -> dict[str, str]:
+    """source 의 파일을 해시 이름으로 target 에 복사하고 매니페스트 기록"""
+    source, target = Path(source), Path(target)
+    manifest: dict[str, str] = {}
+    for path in sorted(source.rglob("*")):
+        if (
+            not path.is_file()
+            or path.name.startswith(".")
+            or path.name.endswith(_SKIP_SUFFIXES)
+        ):
+            continue
+        name = path.relative_to(source).as_posix()
+        manifest[name] = hashed_name(name, path.read_bytes())
+        output = target / manifest[name]
+        if not output.exists():
+            output.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(path, output)
+
+    # 서버가 읽는 도중 반쯤 쓰인 매니페스트를 보지 않도록 교체 방식으로 기록
+    target.mkdir(parents=True, exist_ok=True)
+    temp = target / f".{MANIFEST_NAME}.tmp"
+    temp.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    os.replace(temp, target / MANIFEST_NAME)
+    return manifest
+
+
+class AssetManifest:
+    """원래 경로 -> 해시 경로"""
+
+    def __init__(
+        self,
+        entries: dict[str, str] | None = None,
+        base_url: str = "/static",
+        directory: str | Path | None = None,
+    ):
+        self.entries = entries or {}
+        self.base_url = base_url.rstrip("/")
+        self.directory = Path(directory) if directory else None  # 해시 파일 위치
+
+    @classmethod
+    def load(cls, directory: str | Path, base_url: str = "/static") -> "AssetManifest":
+        """directory/manifest.json 읽기 (디렉터리 미지정/파일 없음이면 빈 매니페스트)"""
+        if not directory:
+            return cls(base_url=base_url)
+        path = Path(directory) / MANIFEST_NAME
+        if not path.is_file():
+            return cls(base_url=base_url)
+        return cls(json.loads(path.read_text()), base_url, directory)
+
+    def url(self, path: str) -> str:
+        """템플릿 전역 static_url()"""
+        path = path.lstrip("/")
+        return f"{self.base_url}/{self.entries.get(path, path)}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="정적 파일 지문 빌드")
+    parser.add_argument("source", help="원본 정적 파일 디렉터리 (예: static)")
+    parser.add_argument("target", help="출력 디렉터리 (STATIC_BUILD_DIR)")
+    args = parser.parse_args()
+
+    for original, hashed in build_assets(args.source, args.target).items():
+        print(f"{original} -> {hashed}")
@@ -0,0 +1,246 @@
+"""
+Redis 기반 페이지 응답 캐시
+
+- 키: 라우트 경로 템플릿 + 쿼리스트링 + vary 헤더 값 (응답 Vary 헤더에도 추가)
+- ETag / If-None-Match 처리 (일치하면 304, 본문 전송 없음)
+- 태그(읽는 테이블 이름)별로 키를 모아두고 쓰기 시 태그 단위로 삭제
+
+사용 예:
+
+    @router.get("/")
+    @response_cache.cached(tags=("song_results_all",), vary=("accept-language",))
+    async def results(request: Request): ...
+
+    # 쓰기 후
+    await response_cache.invalidate_tags("song_results_all")
+
+Redis 장애 시에는 캐시 없이 원래 핸들러 결과를 그대로 반환합니다.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+
+from fastapi import Request, Response
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.database.redis import redis_manager
+from config import cache_settings
+
+logger = logging.getLogger(__name__)
+
+# 캐시된 응답에서 재사용하지 않을 헤더 (새 응답에서 다시 계산)
+_SKIP_HEADERS = {"content-length", "etag", "set-cookie", "x-cache"}
+
+
+@dataclass(frozen=True, slots=True)
+class CachedPage:
+    body: bytes
+    etag: str
+    status_code: int
+    headers: dict[str, str]
+
+    @classmethod
+    def from_response(cls, response: Response) -> "CachedPage":
+        body = bytes(response.body)
+        headers = {
+            k: v for k, v in response.headers.items() if k.lower() not in _SKIP_HEADERS
+        }
+        etag = '"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+        return cls(body, etag, response.status_code, headers)
+
+    def to_mapping(self) -> dict[str, bytes | str | int]:
+        return {
+            "body": self.body,
+            "etag": self.etag,
+            "status": self.status_code,
+            "headers": json.dumps(self.headers),
+        }
+
+    @classmethod
+    def from_mapping(cls, data: dict[bytes, bytes]) -> "CachedPage":
+        return cls(
+            body=data[b"body"],
+            etag=data[b"etag"].decode(),
+            status_code=int(data[b"status"]),
+            headers=json.loads(data[b"headers"]),
+        )
+
+    def to_response(
+        self, request: Request, cache_status: str, vary: Iterable[str] = ()
+    ) -> Response:
+        headers = {**self.headers, "etag": self.etag, "x-cache": cache_status}
+        if vary:
+            # 키에 들어간 요청 헤더를 알려 중간 캐시가 다른 변형을 섞지 않도록
+            headers["vary"] = merge_vary(headers.get("vary"), vary)
+        if etag_matches(request.headers.get("if-none-match"), self.etag):
+            headers.pop("content-type", None)
+            return Response(status_code=304, headers=headers)
+        return Response(
+            content=self.body, status_code=self.status_code, headers=headers
+        )
+
+
+def merge_vary(current: str | None, vary: Iterable[str]) -> str:
+    """기존 Vary 값에 vary 헤더 이름을 (대소문자 무시 중복 없이) 추가"""
+    names = [name.strip() for name in (current or "").split(",") if name.strip()]
+    seen = {name.lower() for name in names}
+    for header in vary:
+        if header.lower() not in seen:
+            names.append(header)
+            seen.add(header.lower())
+    return ", ".join(names)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 헤더가 etag 와 일치하는지 (약한 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        client: Callable[[], Redis],
+        *,
+        ttl: int = 300,
+        prefix: str = "rc",
+        enabled: bool = True,
+    ):
+        # redis_manager.override() 가 반영되도록 호출 시점에 클라이언트 조회
+        self._client = client
+        self.ttl = ttl
+        self.prefix = prefix
+        self.enabled = enabled
+
+    @property
+    def redis(self) -> Redis:
+        return self._client()
+
+    def tag_key(self, tag: str) -> str:
+        return f"{self.prefix}:tag:{tag}"
+
+    def key_for(self, request: Request, vary: Iterable[str] = ()) -> str:
+        """라우트 템플릿(`/items/{id}`) + 실제 경로/쿼리 + vary 헤더로 키 생성"""
+        route = request.scope.get("route")
+        route_path = getattr(route, "path", request.url.path)
+
+        digest = hashlib.sha1()
+        digest.update(request.url.path.encode())
+        digest.update(b"?" + str(request.query_params).encode())
+        for header in vary:
+            digest.update(
+                f"\n{header.lower()}={request.headers.get(header, '')}".encode()
+            )
+        return f"{self.prefix}:page:{route_path}:{digest.hexdigest()}"
+
+    async def get(self, key: str) -> CachedPage | None:
+        try:
+            data = await self.redis.hgetall(key)
+        except (RedisError, OSError) as e:
+            logger.warning("response cache get failed: %s", e)
+            return None
+        return CachedPage.from_mapping(data) if data else None
+
+    async def set(
+        self,
+        key: str,
+        page: CachedPage,
+        *,
+        tags: Iterable[str] = (),
+        ttl: int | None = None,
+    ) -> None:
+        ttl = ttl or self.ttl
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.hset(key, mapping=page.to_mapping())
+                pipe.expire(key, ttl)
+                for tag in tags:
+                    # 태그 집합은 가장 오래 사는 페이지보다 짧게 만료되면 안 됨
+                    pipe.sadd(self.tag_key(tag), key)
+                    pipe.expire(self.tag_key(tag), ttl, gt=True)
+                    pipe.expire(self.tag_key(tag), ttl, nx=True)
+                await pipe.execute()
+        except (RedisError, OSError) as e:
+            logger.warning("response cache set failed: %s", e)
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        """태그에 묶인 페이지 키를 모두 삭제, 삭제한 키 수 반환"""
+        if not tags or not self.enabled:
+            return 0
+        tag_keys = [self.tag_key(tag) for tag in tags]
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for tag_key in tag_keys:
+                    pipe.smembers(tag_key)
+                members = await pipe.execute()
+
+            keys = set().union(*members)
+            if not keys:
+                return 0
+            return await self.redis.delete(*keys, *tag_keys)
+        except (RedisError, OSError) as e:
+            logger.warning("response cache invalidation failed for %s: %s", tags, e)
+            return 0
+
+    def cached(
+        self,
+        *,
+        tags: Iterable[str] = (),
+        vary: Iterable[str] = (),
+        ttl: int | None = None,
+    ) -> Callable:
+        """라우트 핸들러 데코레이터 (핸들러는 `request: Request` 인자를 가져야 함)
+
+        200 응답이면서 본문이 이미 렌더링된 Response(TemplateResponse 등)만
+        캐시합니다. StreamingResponse 나 dict 반환은 그대로 통과합니다.
+        """
+        tags, vary = tuple(tags), tuple(vary)
+
+        def decorator(endpoint: Callable[..., Awaitable]) -> Callable[..., Awaitable]:
+            @functools.wraps(endpoint)
+            async def wrapper(*args, **kwargs):
+                request: Request | None = kwargs.get("request")
+                if (
+                    not self.enabled
+                    or request is None
+                    or request.method not in ("GET", "HEAD")
+                ):
+                    return await endpoint(*args, **kwargs)
+
+                key = self.key_for(request, vary)
+                page = await self.get(key)
+                if page is not None:
+                    return page.to_response(request, "HIT", vary)
+
+                response = await endpoint(*args, **kwargs)
+                if (
+                    not isinstance(response, Response)
+                    or response.status_code != 200
+                    or not hasattr(response, "body")
+                    or response.background is not None
+                ):
+                    return response
+
+                page = CachedPage.from_response(response)
+                await self.set(key, page, tags=tags, ttl=ttl)
+                return page.to_response(request, "MISS", vary)
+
+            return wrapper
+
+        return decorator
+
+
+response_cache = ResponseCache(
+    lambda: redis_manager.client("response_cache"),
+    ttl=cache_settings.RESPONSE_CACHE_TTL,
+    enabled=cache_settings.RESPONSE_CACHE_ENABLED,
+)
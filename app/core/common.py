@@ -1,39 +1,107 @@
 # app/main.py
 import asyncio
+import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+logger = logging.getLogger(__name__)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """FastAPI 애플리케이션 생명주기 관리"""
     # Startup - 애플리케이션 시작 시
-    print("Starting up...")
+    logger.info("Starting up...")
 
     try:
-        # 데이터베이스 테이블 생성
-        from app.database.session import create_db_tables
+        # 데이터베이스 스키마 확인 (워커마다 실행되므로 기본은 리비전 1회 조회)
+        from app.database.session import check_db_revision, create_db_tables
+        from config import db_settings
 
-        await create_db_tables()
-        print("Database tables ready")
+        if db_settings.DB_SCHEMA_CHECK == "revision":
+            revision = await check_db_revision()
+            logger.info("Database schema at revision %s", revision)
+        elif db_settings.DB_SCHEMA_CHECK == "create_all":
+            await create_db_tables()
+            logger.info("Database tables ready")
     except asyncio.TimeoutError:
-        print("Database initialization timed out")
+        logger.error("Database initialization timed out")
         # 타임아웃 시 앱 시작 중단하려면 raise, 계속하려면 pass
         raise
     except Exception as e:
-        print(f"Database initialization failed: {e}")
+        logger.exception("Database initialization failed: %s", e)
         # 에러 시 앱 시작 중단하려면 raise, 계속하려면 pass
         raise
 
+    from app.database.redis import redis_manager
+
+    await redis_manager.startup()
+
+    # 커넥션 풀 max_overflow 자동 조절 (DB_POOL_ADAPTIVE)
+    from app.database.session import pool_controllers
+
+    for controller in pool_controllers:
+        controller.start()
+
+    # JTI 블랙리스트 로컬 Bloom 필터 동기화 (인증 시 Redis 왕복 생략)
+    from app.dependencies.auth import token_blacklist
+
+    token_blacklist.start()
+
+    # 다른 워커의 권한 캐시 무효화 알림 구독
+    from app.dependencies.permissions import permission_evaluator
+
+    permission_evaluator.start()
+
+    # 업로드 완료 후처리 태스크 풀
+    from app.media.processing import processing_pool
+
+    processing_pool.start()
+
+    # 중단된 업로드 (.uploads/*.part) 주기 정리
+    from app.media.storage import upload_store
+    from config import media_settings
+
+    upload_store.start(media_settings.MEDIA_UPLOAD_SWEEP_INTERVAL)
+
+    # 워커별 메트릭 스냅샷 주기 기록 (METRICS_MULTIPROC_DIR)
+    from app.core.metrics_multiprocess import exporter
+
+    if exporter is not None:
+        exporter.start()
+
+    # 템플릿 사전 로드 (첫 요청이 파싱/컴파일 비용을 내지 않도록)
+    from app.core.streaming import streaming_templates
+    from app.core.templating import warm_up
+    from config import template_settings, templates
+
+    if template_settings.TEMPLATE_WARMUP:
+        logger.info("Templates warmed up: %d", warm_up(templates.env))
+        warm_up(streaming_templates.env)
+
     yield  # 애플리케이션 실행 중
 
     # Shutdown - 애플리케이션 종료 시
-    print("Shutting down...")
-    from app.database.session import engine
+    logger.info("Shutting down...")
+    from app.database.session import db_router
+
+    for controller in pool_controllers:
+        await controller.stop()
+
+    if exporter is not None:
+        await exporter.stop()
+
+    await upload_store.stop()
+    await processing_pool.stop()
+    await permission_evaluator.stop()
+    await token_blacklist.stop()
+
+    await redis_manager.shutdown()
+    logger.info("Redis pools closed")
 
-    await engine.dispose()
-    print("Database engine disposed")
+    await db_router.dispose()
+    logger.info("Database engines disposed")
 
 
 # FastAPI 앱 생성 (lifespan 적용)
@@ -0,0 +1,70 @@
+"""
+요청 컨텍스트
+
+RequestContextMiddleware 가 요청마다 ASGI scope 와 요청 ID 를 contextvar 에 넣어 두면
+DB 풀 이벤트나 로그 레코드처럼 요청 객체를 받지 못하는 코드에서도 현재 라우트와
+요청 ID 를 알 수 있습니다.
+"""
+
+import re
+import uuid
+from contextvars import ContextVar
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import Message, Receive, Scope, Send
+
+from app.utils.middleware.base import ASGIMiddleware, header_value, on_response_start
+
+REQUEST_ID_HEADER = "x-request-id"
+# 프록시가 넘긴 ID 는 로그 주입을 막기 위해 형식을 검사해서만 사용
+_VALID_REQUEST_ID = re.compile(r"[A-Za-z0-9._-]{1,64}")
+
+_current_scope: ContextVar[Scope | None] = ContextVar("current_scope", default=None)
+_request_id: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+
+def route_template(scope: Scope) -> str:
+    """라우트 템플릿 (예: /lyrics/{id}), 원본 URL 은 라벨 수가 폭증하므로 쓰지 않음"""
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    # 마운트된 하위 앱 (/admin, /static 등)
+    if scope.get("root_path"):
+        return f"{scope['root_path']}/*"
+    return "unmatched"
+
+
+def current_route() -> str:
+    """현재 요청의 라우트 템플릿, 요청 밖이면 "-" """
+    scope = _current_scope.get()
+    return "-" if scope is None else route_template(scope)
+
+
+def current_request_id() -> str | None:
+    """현재 요청 ID, 요청 밖이면 None"""
+    return _request_id.get()
+
+
+def _incoming_request_id(scope: Scope) -> str | None:
+    value = header_value(scope, REQUEST_ID_HEADER.encode())
+    if value is not None:
+        request_id = value.decode("latin-1")
+        if _VALID_REQUEST_ID.fullmatch(request_id):
+            return request_id
+    return None
+
+
+class RequestContextMiddleware(ASGIMiddleware):
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        request_id = _incoming_request_id(scope) or uuid.uuid4().hex
+
+        def add_request_id(message: Message) -> None:
+            MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+
+        scope_token = _current_scope.set(scope)
+        id_token = _request_id.set(request_id)
+        try:
+            await self.app(scope, receive, on_response_start(send, add_request_id))
+        finally:
+            _request_id.reset(id_token)
+            _current_scope.reset(scope_token)
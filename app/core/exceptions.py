@@ -1,6 +1,10 @@
+import logging
+
 from fastapi import FastAPI, HTTPException, Request, Response, status
 from fastapi.responses import JSONResponse
 
+logger = logging.getLogger(__name__)
+
 
 class FastShipError(Exception):
     """Base exception for all exceptions in fastship api"""
@@ -64,16 +68,7 @@ class DeliveryPartnerCapacityExceeded(FastShipError):
 def _get_handler(status: int, detail: str):
     # Define
     def handler(request: Request, exception: Exception) -> Response:
-        # DEBUG PRINT STATEMENT 👇
-        from rich import print, panel
-        print(
-            panel.Panel(
-                exception.__class__.__name__,
-                title="Handled Exception",
-                border_style="red",
-            ),
-        )
-        # DEBUG PRINT STATEMENT 👆
+        logger.info("Handled exception: %s", exception.__class__.__name__)
         
         # Raise HTTPException with given status and detail
         # can return JSONResponse as well
@@ -0,0 +1,70 @@
+"""
+HTTP 요청 메트릭 미들웨어 (순수 ASGI)
+
+    http_requests_total{method,route,status}         완료된 요청 수
+    http_request_duration_seconds{method,route}      응답 본문 전송 완료까지 걸린 시간
+    http_requests_in_flight                          처리 중인 요청 수
+    http_response_size_bytes{route}                  응답 본문 크기
+
+route 라벨은 라우트 템플릿(/lyrics/{id})이라 URL 이 늘어도 라벨 수가 고정됩니다.
+"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.context import route_template
+from app.core.metrics import Counter, Gauge, Histogram
+from app.utils.middleware.base import ASGIMiddleware
+
+SIZE_BUCKETS = (
+    256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216,
+)  # fmt: skip
+
+requests_total = Counter(
+    "http_requests_total", "HTTP 요청 수", ("method", "route", "status")
+)
+request_duration = Histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간", ("method", "route")
+)
+requests_in_flight = Gauge("http_requests_in_flight", "처리 중인 HTTP 요청 수")
+response_size = Histogram(
+    "http_response_size_bytes", "HTTP 응답 본문 크기", ("route",), buckets=SIZE_BUCKETS
+)
+
+
+class HTTPMetricsMiddleware(ASGIMiddleware):
+    def __init__(self, app: ASGIApp, exclude_paths: tuple[str, ...] = ("/metrics",)):
+        super().__init__(app)
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500  # 응답 시작 전에 예외가 나면 500 으로 기록
+        size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        requests_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            requests_in_flight.dec()
+            # 라우팅이 끝난 뒤라 scope["route"] 가 채워져 있음
+            route = route_template(scope)
+            method = scope["method"]
+            requests_total.inc(method=method, route=route, status=str(status))
+            request_duration.observe(
+                time.perf_counter() - started, method=method, route=route
+            )
+            response_size.observe(size, route=route)
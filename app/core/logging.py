@@ -0,0 +1,150 @@
+"""
+비동기 구조화 로깅
+
+    로거 -> QueueHandler (호출 스레드, put_nowait) -> 큐 -> QueueListener (별도 스레드)
+         -> StreamHandler(stdout, JSON)
+
+이벤트 루프에서는 레코드를 큐에 넣기만 하고 포맷/쓰기는 리스너 스레드가 합니다.
+큐가 가득 차면 기다리지 않고 버립니다 (log_records_dropped_total).
+레코드에는 요청 ID / 라우트가 붙고 (RequestContextMiddleware), DEBUG 나
+extra={"sample_rate": 0.01} 을 준 대량 로그는 비율만큼만 남깁니다.
+
+    setup_logging(log_settings)  # 프로세스 시작 시 1회
+    logger.debug("cache miss %s", key, extra={"sample_rate": 0.01})
+"""
+
+import atexit
+import copy
+import json
+import logging
+import queue
+import random
+import sys
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+
+from app.core.context import current_request_id, current_route
+from app.core.metrics import Counter
+
+records_dropped = Counter("log_records_dropped_total", "큐가 가득 차 버린 로그 수")
+
+# LogRecord 기본 속성 (이 외의 속성은 extra 로 보고 JSON 에 포함)
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {
+    "message",
+    "asctime",
+    "request_id",
+    "route",
+    "sample_rate",
+}
+
+_exception_formatter = logging.Formatter()
+_listener: QueueListener | None = None
+
+
+class RequestContextFilter(logging.Filter):
+    """요청 ID / 라우트를 레코드에 추가 (contextvar 라 호출 스레드에서 읽어야 함)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = current_request_id()
+        record.route = current_route()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """sample_rate 비율만큼만 통과 (extra 로 준 값이 우선, 없으면 DEBUG 에만 적용)"""
+
+    def __init__(self, debug_rate: float = 1.0):
+        super().__init__()
+        self.debug_rate = debug_rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate = getattr(record, "sample_rate", None)
+        if rate is None:
+            rate = self.debug_rate if record.levelno <= logging.DEBUG else 1.0
+        return rate >= 1.0 or random.random() < rate
+
+
+class JSONFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, UTC).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if getattr(record, "request_id", None):
+            entry["request_id"] = record.request_id
+            entry["route"] = record.route
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 인자 병합/예외 문자열화만 하고 (다른 스레드로 넘길 수 있게) 포맷은 리스너에서
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+        record.msg, record.args, record.exc_info = record.message, None, None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            records_dropped.inc()
+
+
+def _text_formatter() -> logging.Formatter:
+    return logging.Formatter(
+        "%(asctime)s %(levelname)s [%(name)s] [%(request_id)s] %(message)s",
+        defaults={"request_id": "-"},
+    )
+
+
+def setup_logging(settings) -> QueueListener:
+    """루트 로거를 큐 파이프라인으로 교체하고 리스너 시작 (여러 번 호출해도 1회만)"""
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(
+        JSONFormatter() if settings.LOG_FORMAT == "json" else _text_formatter()
+    )
+
+    log_queue: queue.Queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+    handler = NonBlockingQueueHandler(log_queue)
+    handler.addFilter(SamplingFilter(settings.LOG_DEBUG_SAMPLE_RATE))
+    handler.addFilter(RequestContextFilter())
+
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(settings.LOG_LEVEL)
+
+    # uvicorn 로거도 같은 파이프라인으로 (자체 stdout 핸들러 제거)
+    for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers.clear()
+        uvicorn_logger.propagate = True
+
+    _listener = QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    # uvicorn 이 lifespan 이후에 남기는 종료 로그까지 쓰도록 프로세스 종료 시 정리
+    atexit.register(shutdown_logging)
+    return _listener
+
+
+def shutdown_logging() -> None:
+    """남은 레코드를 모두 쓰고 리스너 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
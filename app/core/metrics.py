@@ -0,0 +1,259 @@
+"""
+Prometheus 텍스트 형식 메트릭
+
+외부 의존성 없이 Counter/Gauge/Histogram 과 /metrics 엔드포인트를 제공합니다.
+값 갱신은 이벤트 루프 스레드에서만 일어나므로 잠금 없이 dict 로 집계합니다.
+uvicorn 워커가 여러 개면 METRICS_MULTIPROC_DIR 로 프로세스별 값을 합산합니다
+(app.core.metrics_multiprocess).
+
+    requests = Counter("http_requests_total", "요청 수", ("route", "status"))
+    requests.inc(route="/lyrics/", status="200")
+"""
+
+import math
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sequence
+from typing import Literal
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0,
+)  # fmt: skip
+
+LabelKey = tuple[str, ...]
+Sample = tuple[str, dict[str, str], float]
+# 메트릭 이름 -> {"kind", "doc", "mode", "samples": [Sample, ...]}
+Families = dict[str, dict]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    inner = ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items())
+    return "{" + inner + "}"
+
+
+class Metric:
+    kind = "untyped"
+    # 여러 프로세스 값을 합치는 방식 (Gauge 만 sum 외 선택 가능)
+    multiprocess_mode = "sum"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        registry: "Registry | None" = None,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        (registry if registry is not None else REGISTRY).register(self)
+
+    def _key(self, labels: dict[str, str]) -> LabelKey:
+        try:
+            key = tuple(str(labels[name]) for name in self.labelnames)
+        except KeyError:
+            key = None
+        if key is None or len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name}: expected labels {self.labelnames}")
+        return key
+
+    def _labels(self, key: LabelKey) -> dict[str, str]:
+        return dict(zip(self.labelnames, key, strict=True))
+
+    def samples(self) -> Iterable[Sample]:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> Iterable[Sample]:
+        for key, value in self._values.items():
+            yield self.name, self._labels(key), value
+
+    def clear(self) -> None:
+        self._values.clear()
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def __init__(
+        self,
+        *args,
+        multiprocess_mode: Literal["sum", "max", "min", "all"] = "sum",
+        **kwargs,
+    ):
+        """multiprocess_mode="all" 이면 프로세스별 값을 pid 라벨로 따로 노출"""
+        super().__init__(*args, **kwargs)
+        self.multiprocess_mode = multiprocess_mode
+        self._values: dict[LabelKey, float] = {}
+        self._functions: dict[LabelKey, Callable[[], float]] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set_function(self, fn: Callable[[], float], **labels: str) -> None:
+        """수집 시점에 fn() 값을 읽음 (풀 사용량처럼 현재 상태를 보여줄 때)"""
+        self._functions[self._key(labels)] = fn
+
+    def value(self, **labels: str) -> float:
+        key = self._key(labels)
+        if key in self._functions:
+            return self._functions[key]()
+        return self._values.get(key, 0)
+
+    def samples(self) -> Iterable[Sample]:
+        for key, value in self._values.items():
+            yield self.name, self._labels(key), value
+        for key, fn in self._functions.items():
+            yield self.name, self._labels(key), fn()
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._functions.clear()
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        registry: "Registry | None" = None,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames, registry)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨별 [버킷별 개수..., +Inf 개수], 합계
+        self._counts: dict[LabelKey, list[int]] = {}
+        self._sums: dict[LabelKey, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        counts = self._counts.get(key)
+        if counts is None:
+            counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+            self._sums[key] = 0.0
+        counts[bisect_left(self.buckets, value)] += 1
+        self._sums[key] += value
+
+    def count(self, **labels: str) -> int:
+        return sum(self._counts.get(self._key(labels), ()))
+
+    def sum(self, **labels: str) -> float:
+        return self._sums.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterable[Sample]:
+        for key, counts in self._counts.items():
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += count
+                yield (
+                    f"{self.name}_bucket",
+                    {**labels, "le": _format_value(bound)},
+                    cumulative,
+                )
+            yield f"{self.name}_sum", labels, self._sums[key]
+            yield f"{self.name}_count", labels, cumulative
+
+    def clear(self) -> None:
+        self._counts.clear()
+        self._sums.clear()
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"duplicate metric: {metric.name}")
+        self._metrics[metric.name] = metric
+
+    def get(self, name: str) -> Metric | None:
+        return self._metrics.get(name)
+
+    def collect(self) -> Iterable[Metric]:
+        return self._metrics.values()
+
+    def families(self) -> Families:
+        return {
+            metric.name: {
+                "kind": metric.kind,
+                "doc": metric.documentation,
+                "mode": metric.multiprocess_mode,
+                "samples": list(metric.samples()),
+            }
+            for metric in self._metrics.values()
+        }
+
+    def render(self) -> str:
+        return render_families(self.families())
+
+
+def render_families(families: Families) -> str:
+    lines = []
+    for name, family in families.items():
+        lines.append(f"# HELP {name} {family['doc']}")
+        lines.append(f"# TYPE {name} {family['kind']}")
+        for sample_name, labels, value in family["samples"]:
+            lines.append(
+                f"{sample_name}{_format_labels(labels)} {_format_value(value)}"
+            )
+    return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> PlainTextResponse:
+    from app.core.metrics_multiprocess import exporter
+
+    text = exporter.render() if exporter is not None else REGISTRY.render()
+    return PlainTextResponse(text, media_type=CONTENT_TYPE)
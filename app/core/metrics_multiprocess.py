@@ -0,0 +1,202 @@
+"""
+멀티 프로세스 메트릭 집계
+
+각 워커는 자기 메트릭을 메모리(잠금 없는 dict)에 집계하고, flush 주기마다
+METRICS_MULTIPROC_DIR/<pid>.mmap 에 스냅샷을 씁니다. /metrics 요청을 받은
+워커는 자기 스냅샷을 갱신한 뒤 디렉터리의 모든 파일을 읽어 합산합니다.
+
+파일 형식 (seqlock)
+    [seq: u64][length: u64][payload: JSON]
+    쓰기: seq 홀수로 증가 -> payload/length 기록 -> seq 짝수로 증가
+    읽기: seq 가 짝수이고 읽기 전후로 같을 때만 사용 (아니면 재시도)
+
+합산 규칙: counter/histogram 은 모든 파일 합계(종료된 워커 포함),
+gauge 는 살아 있는 프로세스만 multiprocess_mode(sum/max/min/all)로 합칩니다.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import mmap
+import os
+import struct
+from pathlib import Path
+
+from app.core.metrics import REGISTRY, Families, Registry, render_families
+from config import metrics_settings
+
+logger = logging.getLogger(__name__)
+
+HEADER = struct.Struct("<QQ")
+INITIAL_SIZE = 64 * 1024
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class SnapshotFile:
+    """한 프로세스만 쓰는 seqlock mmap 파일"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        size = max(os.fstat(self._fd).st_size, INITIAL_SIZE)
+        os.ftruncate(self._fd, size)
+        self._map = mmap.mmap(self._fd, size)
+        self._seq = HEADER.unpack_from(self._map, 0)[0]
+        if self._seq % 2:
+            self._seq += 1  # 이전 프로세스가 쓰는 도중 종료됨
+
+    def write(self, payload: bytes) -> None:
+        self._seq += 1
+        HEADER.pack_into(self._map, 0, self._seq, 0)
+        needed = HEADER.size + len(payload)
+        if needed > len(self._map):
+            size = 1 << math.ceil(math.log2(needed))
+            self._map.close()
+            os.ftruncate(self._fd, size)
+            self._map = mmap.mmap(self._fd, size)
+        self._map[HEADER.size : needed] = payload
+        self._seq += 1
+        HEADER.pack_into(self._map, 0, self._seq, len(payload))
+
+    def close(self) -> None:
+        self._map.close()
+        os.close(self._fd)
+
+    @staticmethod
+    def read(path: Path, retries: int = 10) -> bytes | None:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < HEADER.size:
+                return None
+            with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as view:
+                for _ in range(retries):
+                    seq, length = HEADER.unpack_from(view, 0)
+                    if seq % 2 or HEADER.size + length > size:
+                        continue
+                    payload = view[HEADER.size : HEADER.size + length]
+                    if HEADER.unpack_from(view, 0)[0] == seq:
+                        return payload
+        return None
+
+
+class MultiProcessExporter:
+    def __init__(
+        self,
+        directory: str | Path,
+        registry: Registry = REGISTRY,
+        interval: float = 1.0,
+        pid: int | None = None,
+    ):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.registry = registry
+        self.interval = interval
+        self._pid = pid  # 테스트에서 여러 워커를 흉내낼 때 지정
+        self._file: SnapshotFile | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def pid(self) -> int:
+        return self._pid if self._pid is not None else os.getpid()
+
+    def flush(self) -> None:
+        if self._file is None:
+            self._file = SnapshotFile(self.directory / f"{self.pid}.mmap")
+        payload = json.dumps(self.registry.families(), separators=(",", ":"))
+        self._file.write(payload.encode())
+
+    def collect(self) -> Families:
+        self.flush()
+        merged: Families = {}
+        # (metric, sample, labels) -> 값 / gauge 는 프로세스별 값 목록
+        values: dict[tuple, float | list[float]] = {}
+
+        for path in sorted(self.directory.glob("*.mmap")):
+            payload = SnapshotFile.read(path)
+            if payload is None:
+                logger.warning("metrics snapshot busy or empty: %s", path)
+                continue
+            pid = path.stem
+            alive = pid == str(self.pid) or _pid_alive(int(pid))
+            for name, family in json.loads(payload).items():
+                kind, mode = family["kind"], family["mode"]
+                if kind == "gauge" and not alive:
+                    continue
+                merged.setdefault(name, {**family, "samples": []})
+                for sample_name, labels, value in family["samples"]:
+                    if kind == "gauge" and mode == "all":
+                        labels = {**labels, "pid": pid}
+                    key = (name, sample_name, tuple(labels.items()))
+                    if kind == "gauge" and mode in ("max", "min"):
+                        values.setdefault(key, []).append(value)
+                    else:
+                        values[key] = values.get(key, 0) + value
+
+        for (name, sample_name, labels), value in values.items():
+            if isinstance(value, list):
+                mode = merged[name]["mode"]
+                value = max(value) if mode == "max" else min(value)
+            merged[name]["samples"].append((sample_name, dict(labels), value))
+
+        for family in merged.values():
+            family["samples"].sort(key=_sample_order)
+        return merged
+
+    def render(self) -> str:
+        return render_families(self.collect())
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                self.flush()
+            except OSError:
+                logger.exception("metrics snapshot flush failed")
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="metrics-flush")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _sample_order(sample) -> tuple:
+    """히스토그램 버킷이 라벨 묶음별로 le 순서대로 나오도록 정렬"""
+    sample_name, labels, _ = sample
+    le = labels.get("le")
+    base = tuple((k, v) for k, v in labels.items() if k != "le")
+    if sample_name.endswith("_sum"):
+        suffix = 1
+    elif sample_name.endswith("_count"):
+        suffix = 2
+    else:
+        suffix = 0
+    return base, suffix, float(le) if le is not None else 0.0
+
+
+exporter = (
+    MultiProcessExporter(
+        metrics_settings.METRICS_MULTIPROC_DIR,
+        interval=metrics_settings.METRICS_FLUSH_INTERVAL,
+    )
+    if metrics_settings.METRICS_MULTIPROC_DIR
+    else None
+)
@@ -0,0 +1,119 @@
+"""
+스트리밍 템플릿 렌더링
+
+TemplateResponse 는 페이지 전체를 메모리에 렌더링한 뒤 전송합니다. 행이 많은
+목록 페이지는 StreamingTemplates.response() 로 Jinja2 generate_async() 조각을
+바로 전송하고, 행은 RowStream 이 서버 측 커서에서 yield_per 단위로 읽어
+도착하는 대로 렌더링합니다.
+
+    rows = RowStream(select(SongResultsAll).order_by(...), AsyncSessionLocal)
+    return streaming_templates.response(
+        request, "lyrics/results.html", {"rows": rows}
+    )
+
+첫 행이 렌더링되기 전까지(레이아웃 헤더)는 조각마다 즉시 전송하고, 이후에는
+chunk_size 만큼 모아서 전송합니다.
+"""
+
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from fastapi.templating import Jinja2Templates
+from jinja2 import Environment
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.templating import async_overlay
+from config import templates
+
+
+class RowStream:
+    """서버 측 커서로 행을 yield_per 개씩 가져오는 비동기 이터러블
+
+    세션을 스스로 열고 닫으므로 응답 본문 전송이 끝날 때까지 유효합니다
+    (요청 의존성 세션의 수명과 무관).
+    """
+
+    def __init__(
+        self,
+        stmt: Select,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        yield_per: int = 500,
+    ):
+        self.stmt = stmt.execution_options(yield_per=yield_per)
+        self.session_factory = session_factory
+        self.count = 0
+
+    @property
+    def started(self) -> bool:
+        return self.count > 0
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        async with self.session_factory() as session:
+            result = await session.stream_scalars(self.stmt)
+            try:
+                async for row in result:
+                    self.count += 1
+                    yield row
+            finally:
+                await result.close()
+
+
+class StreamingTemplates:
+    def __init__(self, templates: Jinja2Templates, chunk_size: int = 16 * 1024):
+        self.templates = templates
+        self.chunk_size = chunk_size
+        self._env: Environment | None = None
+
+    @property
+    def env(self) -> Environment:
+        if self._env is None:
+            self._env = async_overlay(self.templates.env)
+        return self._env
+
+    async def _generate(
+        self, name: str, context: dict, chunk_size: int
+    ) -> AsyncIterator[str]:
+        template = self.env.get_template(name)
+        streams = [v for v in context.values() if isinstance(v, RowStream)]
+        buffer: list[str] = []
+        size = 0
+        async for fragment in template.generate_async(context):
+            if not all(stream.started for stream in streams):
+                # 헤더/첫 행 전까지는 바로 전송 (TTFB)
+                if buffer:
+                    yield "".join(buffer)
+                    buffer, size = [], 0
+                yield fragment
+                continue
+            buffer.append(fragment)
+            size += len(fragment)
+            if size >= chunk_size:
+                yield "".join(buffer)
+                buffer, size = [], 0
+        if buffer:
+            yield "".join(buffer)
+
+    def response(
+        self,
+        request: Request,
+        name: str,
+        context: dict | None = None,
+        *,
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+        chunk_size: int | None = None,
+    ) -> StreamingResponse:
+        context = {"request": request, **(context or {})}
+        return StreamingResponse(
+            self._generate(name, context, chunk_size or self.chunk_size),
+            status_code=status_code,
+            headers=headers,
+            media_type="text/html; charset=utf-8",
+        )
+
+
+streaming_templates = StreamingTemplates(templates)
@@ -0,0 +1,134 @@
+"""
+Jinja2 템플릿 환경 구성
+
+개발: 기본값 (auto_reload, 바이트코드 캐시 없음)
+운영: TEMPLATE_AUTO_RELOAD=False 로 렌더링마다 하던 mtime 확인을 끄고,
+      바이트코드 캐시(filesystem/redis)로 워커 간 파싱 결과를 공유합니다.
+      빌드 단계에서 템플릿을 모듈로 사전 컴파일하면 파싱 자체가 사라집니다.
+
+    python -m app.core.templating build/templates
+    TEMPLATE_PRECOMPILED_DIR=build/templates
+
+config.py 에서 import 하므로 이 모듈은 config 를 import 하지 않습니다.
+"""
+
+import argparse
+import logging
+from pathlib import Path
+
+from jinja2 import (
+    BaseLoader,
+    BytecodeCache,
+    ChoiceLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    MemcachedBytecodeCache,
+    ModuleLoader,
+)
+
+logger = logging.getLogger(__name__)
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+# Starlette Jinja2Templates(directory=...) 기본값과 동일 (사전 컴파일 시 코드에 반영됨)
+ENV_OPTIONS = {"autoescape": True}
+
+
+def _bytecode_cache(settings, db_settings) -> BytecodeCache | None:
+    if settings.TEMPLATE_BYTECODE_CACHE == "filesystem":
+        return FileSystemBytecodeCache(settings.TEMPLATE_BYTECODE_CACHE_DIR or None)
+
+    if settings.TEMPLATE_BYTECODE_CACHE == "redis":
+        # 템플릿 컴파일은 시작 시 warm-up 에서만 일어나므로 동기 클라이언트 사용
+        # Redis 오류는 무시하고 직접 컴파일 (ignore_memcache_errors)
+        from redis import Redis
+
+        client = Redis(
+            host=db_settings.REDIS_HOST,
+            port=db_settings.REDIS_PORT,
+            db=settings.TEMPLATE_BYTECODE_REDIS_DB,
+            socket_timeout=db_settings.REDIS_SOCKET_TIMEOUT,
+        )
+        return MemcachedBytecodeCache(client, prefix="jinja2:bytecode:")
+
+    return None
+
+
+def build_template_env(
+    directory: str | Path, settings, db_settings=None
+) -> Environment:
+    """설정에 맞춘 Jinja2 Environment (Jinja2Templates(env=...) 에 전달)"""
+    loader: BaseLoader = FileSystemLoader(directory)
+    if settings.TEMPLATE_PRECOMPILED_DIR:
+        precompiled = Path(settings.TEMPLATE_PRECOMPILED_DIR)
+        if precompiled.is_dir():
+            # 사전 컴파일된 모듈 우선, 없는 템플릿은 파일에서 로드
+            loader = ChoiceLoader([ModuleLoader(precompiled), loader])
+        else:
+            logger.warning("precompiled templates not found: %s", precompiled)
+
+    return Environment(
+        **ENV_OPTIONS,
+        loader=loader,
+        auto_reload=settings.TEMPLATE_AUTO_RELOAD,
+        bytecode_cache=_bytecode_cache(settings, db_settings),
+    )
+
+
+def async_overlay(env: Environment, cache_size: int = 400) -> Environment:
+    """generate_async() 용 비동기 환경
+
+    비동기 모드는 생성 코드가 달라 동기 환경의 캐시/바이트코드/사전 컴파일 모듈을
+    함께 쓸 수 없으므로 별도 캐시로 파일에서 직접 컴파일합니다.
+    """
+    loader = env.loader
+    if isinstance(loader, ChoiceLoader):
+        loader = ChoiceLoader(
+            [item for item in loader.loaders if not isinstance(item, ModuleLoader)]
+        )
+    return env.overlay(
+        enable_async=True, loader=loader, bytecode_cache=None, cache_size=cache_size
+    )
+
+
+def template_names(env: Environment) -> list[str]:
+    """목록을 지원하는 로더(FileSystemLoader)의 템플릿 이름 (ModuleLoader 는 미지원)"""
+    loaders = getattr(env.loader, "loaders", [env.loader])
+    names: set[str] = set()
+    for loader in loaders:
+        try:
+            names.update(loader.list_templates())
+        except TypeError:
+            continue
+    return sorted(names)
+
+
+def warm_up(env: Environment) -> int:
+    """모든 템플릿을 미리 로드해 첫 요청이 컴파일 비용을 내지 않도록 함"""
+    names = template_names(env)
+    for name in names:
+        env.get_template(name)
+    return len(names)
+
+
+def compile_templates(
+    target: str | Path, directory: str | Path = TEMPLATES_DIR
+) -> list[str]:
+    """빌드 단계: directory 의 템플릿을 target 디렉터리에 파이썬 모듈로 컴파일"""
+    env = Environment(**ENV_OPTIONS, loader=FileSystemLoader(directory))
+    compiled: list[str] = []
+    env.compile_templates(
+        str(target), zip=None, log_function=compiled.append, ignore_errors=False
+    )
+    return compiled
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Jinja2 템플릿 사전 컴파일")
+    parser.add_argument("target", help="출력 디렉터리 (TEMPLATE_PRECOMPILED_DIR)")
+    parser.add_argument("--source", default=str(TEMPLATES_DIR))
+    args = parser.parse_args()
+
+    for line in compile_templates(args.target, args.source):
+        print(line)
@@ -0,0 +1,5 @@
+"""
+Core Tests 패키지
+
+캐시/템플릿 등 공통 기능 테스트를 제공합니다.
+"""
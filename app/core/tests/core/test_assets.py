@@ -0,0 +1,41 @@
+import json
+
+from app.core.assets import MANIFEST_NAME, AssetManifest, build_assets, hashed_name
+
+
+def test_build_assets_writes_hashed_copies_and_manifest(tmp_path):
+    source, target = tmp_path / "static", tmp_path / "build"
+    (source / "css").mkdir(parents=True)
+    (source / "css" / "site.css").write_text("body { color: red; }")
+    (source / "css" / "site.css.gz").write_bytes(b"skip")
+    (source / ".gitkeep").write_text("")
+
+    manifest = build_assets(source, target)
+
+    hashed = manifest["css/site.css"]
+    assert list(manifest) == ["css/site.css"]
+    assert hashed == hashed_name("css/site.css", b"body { color: red; }")
+    assert hashed.startswith("css/site.") and hashed.endswith(".css")
+    assert (target / hashed).read_text() == "body { color: red; }"
+    assert json.loads((target / MANIFEST_NAME).read_text()) == manifest
+
+    # 내용이 바뀌면 이름도 바뀜
+    (source / "css" / "site.css").write_text("body { color: blue; }")
+    assert build_assets(source, target)["css/site.css"] != hashed
+
+
+def test_manifest_url(tmp_path):
+    build_dir = tmp_path / "build"
+    build_dir.mkdir()
+    (build_dir / MANIFEST_NAME).write_text(
+        json.dumps({"css/site.css": "css/site.abc.css"})
+    )
+
+    manifest = AssetManifest.load(build_dir, "/static/")
+    assert manifest.url("css/site.css") == "/static/css/site.abc.css"
+    assert manifest.url("/img/logo.png") == "/static/img/logo.png"
+
+    # 빌드 전 (개발): 원래 경로
+    assert (
+        AssetManifest.load("", "/static").url("css/site.css") == "/static/css/site.css"
+    )
@@ -0,0 +1,120 @@
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse
+from httpx import ASGITransport, AsyncClient
+
+from app.core.cache import ResponseCache, etag_matches, merge_vary
+from app.database.tests.fake_redis import FakeRedis
+
+
+@pytest.fixture
+def cache():
+    redis = FakeRedis()
+    return ResponseCache(lambda: redis, ttl=60)
+
+
+@pytest.fixture
+def app(cache):
+    app = FastAPI()
+    app.state.renders = []
+
+    @app.get("/results")
+    @cache.cached(tags=("song_results_all",), vary=("accept-language",))
+    async def results(request: Request):
+        app.state.renders.append("results")
+        language = request.headers.get("accept-language", "ko")
+        return HTMLResponse(
+            f"<p>{language} {len(app.state.renders)}</p>",
+            headers={"vary": "Accept-Encoding"},
+        )
+
+    @app.get("/samples")
+    @cache.cached(tags=("song_sample",))
+    async def samples(request: Request):
+        app.state.renders.append("samples")
+        return HTMLResponse(f"<p>{len(app.state.renders)}</p>")
+
+    return app
+
+
+@pytest.fixture
+async def client(app):
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as http:
+        yield http
+
+
+def test_etag_matches():
+    assert etag_matches('"a"', '"a"')
+    assert etag_matches('"b", W/"a"', '"a"')
+    assert etag_matches("*", '"a"')
+    assert not etag_matches('"b"', '"a"')
+    assert not etag_matches(None, '"a"')
+
+
+def test_merge_vary():
+    assert merge_vary(None, ("accept-language",)) == "accept-language"
+    assert (
+        merge_vary("Accept-Encoding, Accept-Language", ("accept-language", "cookie"))
+        == "Accept-Encoding, Accept-Language, cookie"
+    )
+
+
+async def test_etag_and_not_modified(client, app):
+    first = await client.get("/results")
+    assert first.headers["x-cache"] == "MISS"
+    etag = first.headers["etag"]
+
+    second = await client.get("/results")
+    assert second.headers["x-cache"] == "HIT"
+    assert second.headers["etag"] == etag
+    assert second.text == first.text
+    assert app.state.renders == ["results"]
+
+    not_modified = await client.get("/results", headers={"if-none-match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+    assert "content-type" not in not_modified.headers
+
+    weak = await client.get("/results", headers={"if-none-match": f'"x", W/{etag}'})
+    assert weak.status_code == 304
+    stale = await client.get("/results", headers={"if-none-match": '"other"'})
+    assert stale.status_code == 200
+
+
+async def test_vary_header_and_variants(client, app):
+    korean = await client.get("/results", headers={"accept-language": "ko"})
+    english = await client.get("/results", headers={"accept-language": "en"})
+    assert korean.text == "<p>ko 1</p>"
+    assert english.text == "<p>en 2</p>"
+    assert korean.headers["etag"] != english.headers["etag"]
+    # 핸들러의 Vary 는 유지하고 키에 쓴 헤더를 추가
+    assert korean.headers["vary"] == "Accept-Encoding, accept-language"
+
+    hit = await client.get("/results", headers={"accept-language": "en"})
+    assert hit.headers["x-cache"] == "HIT"
+    assert hit.headers["vary"] == "Accept-Encoding, accept-language"
+    not_modified = await client.get(
+        "/results",
+        headers={"accept-language": "ko", "if-none-match": korean.headers["etag"]},
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.headers["vary"] == "Accept-Encoding, accept-language"
+    assert "vary" not in (await client.get("/samples")).headers
+
+
+async def test_invalidate_tags_only_drops_tagged_pages(client, app, cache):
+    await client.get("/results", headers={"accept-language": "ko"})
+    await client.get("/results", headers={"accept-language": "en"})
+    await client.get("/samples")
+    assert len(app.state.renders) == 3
+
+    # 페이지 키 2개 + 태그 집합 1개
+    assert await cache.invalidate_tags("song_results_all") == 3
+    assert await cache.invalidate_tags("song_results_all") == 0
+
+    assert (await client.get("/results")).headers["x-cache"] == "MISS"
+    assert (await client.get("/samples")).headers["x-cache"] == "HIT"
+    assert app.state.renders == ["results", "results", "samples", "results"]
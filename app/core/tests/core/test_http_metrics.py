@@ -0,0 +1,112 @@
+import os
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.core.http_metrics import (
+    HTTPMetricsMiddleware,
+    request_duration,
+    requests_in_flight,
+    requests_total,
+    response_size,
+)
+from app.core.metrics import Counter, Gauge, Histogram, Registry
+from app.core.metrics_multiprocess import MultiProcessExporter, SnapshotFile
+
+
+@pytest.fixture
+def client():
+    for metric in (requests_total, request_duration, requests_in_flight, response_size):
+        metric.clear()
+
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int):
+        return {"id": item_id, "body": "x" * 100}
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    app.add_middleware(HTTPMetricsMiddleware)
+    return AsyncClient(
+        transport=ASGITransport(app=app, raise_app_exceptions=False),
+        base_url="http://test",
+    )
+
+
+async def test_route_template_labels(client):
+    async with client:
+        for item_id in (1, 2, 3):
+            assert (await client.get(f"/items/{item_id}")).status_code == 200
+        assert (await client.get("/items/abc")).status_code == 422
+        assert (await client.get("/nope")).status_code == 404
+        assert (await client.get("/boom")).status_code == 500
+
+    route = "/items/{item_id}"
+    assert requests_total.value(method="GET", route=route, status="200") == 3
+    assert requests_total.value(method="GET", route=route, status="422") == 1
+    assert requests_total.value(method="GET", route="unmatched", status="404") == 1
+    assert requests_total.value(method="GET", route="/boom", status="500") == 1
+    assert request_duration.count(method="GET", route=route) == 4
+    assert response_size.sum(route=route) > 300
+    assert requests_in_flight.value() == 0
+
+
+def _worker_registry(requests: int, in_flight: float, latency: float) -> Registry:
+    registry = Registry()
+    Counter("jobs_total", "작업 수", ("queue",), registry=registry).inc(
+        requests, queue="a"
+    )
+    Gauge("in_flight", "처리 중", registry=registry).set(in_flight)
+    Gauge("peak", "최대", registry=registry, multiprocess_mode="max").set(in_flight)
+    Gauge("per_worker", "워커별", registry=registry, multiprocess_mode="all").set(
+        in_flight
+    )
+    Histogram("latency", "지연", registry=registry, buckets=(0.1, 1)).observe(latency)
+    return registry
+
+
+def test_multiprocess_aggregation(tmp_path):
+    me = os.getpid()
+    # 부모 pid 는 살아 있고, 존재하지 않는 큰 pid 는 종료된 워커로 취급
+    alive, dead = os.getppid(), 2**22 + 12345
+    workers = [
+        MultiProcessExporter(tmp_path, _worker_registry(1, 1, 0.05), pid=me),
+        MultiProcessExporter(tmp_path, _worker_registry(2, 5, 0.5), pid=alive),
+        MultiProcessExporter(tmp_path, _worker_registry(4, 7, 5), pid=dead),
+    ]
+    for worker in workers[1:]:
+        worker.flush()
+
+    text = workers[0].render()
+    # counter/histogram 은 종료된 워커 값까지 합산
+    assert 'jobs_total{queue="a"} 7' in text
+    assert 'latency_bucket{le="0.1"} 1' in text
+    assert 'latency_bucket{le="1"} 2' in text
+    assert 'latency_bucket{le="+Inf"} 3' in text
+    assert "latency_count 3" in text
+    # gauge 는 살아 있는 프로세스만
+    assert "in_flight 6" in text
+    assert "peak 5" in text
+    assert f'per_worker{{pid="{me}"}} 1' in text
+    assert f'per_worker{{pid="{alive}"}} 5' in text
+    assert str(dead) not in text
+    # 버킷은 le 순서 유지
+    assert text.index('le="0.1"') < text.index('le="1"') < text.index('le="+Inf"')
+
+
+def test_snapshot_grows_and_rejects_torn_write(tmp_path):
+    path = tmp_path / "1.mmap"
+    snapshot = SnapshotFile(path)
+    payload = b"x" * (256 * 1024)
+    snapshot.write(payload)
+    assert SnapshotFile.read(path) == payload
+
+    # 쓰는 도중(seq 홀수)에는 읽지 않음
+    snapshot._seq += 1
+    snapshot._map[:8] = snapshot._seq.to_bytes(8, "little")
+    assert SnapshotFile.read(path, retries=2) is None
+    snapshot.close()
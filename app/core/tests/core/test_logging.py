@@ -0,0 +1,91 @@
+import json
+import logging
+import queue
+from logging.handlers import QueueListener
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.core.context import RequestContextMiddleware
+from app.core.logging import (
+    JSONFormatter,
+    NonBlockingQueueHandler,
+    RequestContextFilter,
+    SamplingFilter,
+    records_dropped,
+)
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.setFormatter(JSONFormatter())
+        self.lines: list[dict] = []
+
+    def emit(self, record):
+        self.lines.append(json.loads(self.format(record)))
+
+
+def _pipeline(maxsize: int = 100, debug_rate: float = 1.0):
+    log_queue = queue.Queue(maxsize=maxsize)
+    handler = NonBlockingQueueHandler(log_queue)
+    handler.addFilter(SamplingFilter(debug_rate))
+    handler.addFilter(RequestContextFilter())
+    output = ListHandler()
+    logger = logging.getLogger(f"test.logging.{id(log_queue)}")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+    return logger, log_queue, output
+
+
+async def test_request_id_in_json_records():
+    logger, log_queue, output = _pipeline()
+    listener = QueueListener(log_queue, output)
+    listener.start()
+
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int):
+        logger.info("loaded %s", item_id, extra={"user": "u1"})
+        return {}
+
+    app.add_middleware(RequestContextMiddleware)
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        generated = await client.get("/items/1")
+        forwarded = await client.get("/items/2", headers={"x-request-id": "abc-123"})
+        rejected = await client.get("/items/3", headers={"x-request-id": "bad id\n"})
+    try:
+        logger.error("failed", exc_info=ZeroDivisionError("x"))
+    finally:
+        listener.stop()
+
+    first, second, third, outside = output.lines
+    assert first["request_id"] == generated.headers["x-request-id"]
+    assert first["route"] == "/items/{item_id}"
+    assert first["message"] == "loaded 1"
+    assert first["user"] == "u1"
+    assert second["request_id"] == forwarded.headers["x-request-id"] == "abc-123"
+    assert third["request_id"] == rejected.headers["x-request-id"] != "bad id\n"
+    assert "request_id" not in outside
+    assert "ZeroDivisionError" in outside["exc_info"]
+
+
+def test_sampling_and_drop_on_full_queue():
+    logger, log_queue, _ = _pipeline(maxsize=5, debug_rate=0.0)
+
+    for _ in range(50):
+        logger.debug("noisy")
+    logger.info("kept", extra={"sample_rate": 1.0})
+    logger.info("never", extra={"sample_rate": 0.0})
+    assert log_queue.qsize() == 1
+
+    before = records_dropped.value()
+    for _ in range(10):
+        logger.info("burst")
+    # 큐(5)가 가득 차면 기다리지 않고 버림
+    assert log_queue.qsize() == 5
+    assert records_dropped.value() - before == 6
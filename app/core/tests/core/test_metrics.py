@@ -0,0 +1,49 @@
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.core.metrics import Counter, Gauge, Histogram, Registry
+from app.core.metrics import router as metrics_router
+
+
+def test_text_exposition():
+    registry = Registry()
+    requests = Counter("requests_total", "요청 수", ("route",), registry=registry)
+    in_flight = Gauge("in_flight", "처리 중", registry=registry)
+    latency = Histogram(
+        "latency_seconds", "지연", ("route",), registry=registry, buckets=(0.1, 1)
+    )
+
+    requests.inc(route="/a")
+    requests.inc(2, route='/b"x')
+    in_flight.set_function(lambda: 3)
+    for value in (0.05, 0.1, 0.5, 2):
+        latency.observe(value, route="/a")
+
+    text = registry.render()
+    assert "# TYPE requests_total counter" in text
+    assert 'requests_total{route="/a"} 1' in text
+    assert 'requests_total{route="/b\\"x"} 2' in text
+    assert "in_flight 3" in text
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 2' in text
+    assert 'latency_seconds_bucket{route="/a",le="1"} 3' in text
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 4' in text
+    assert 'latency_seconds_count{route="/a"} 4' in text
+    assert latency.sum(route="/a") == pytest.approx(2.65)
+
+    with pytest.raises(ValueError):
+        requests.inc(path="/a")
+    with pytest.raises(ValueError):
+        Counter("requests_total", "중복", registry=registry)
+
+
+async def test_metrics_endpoint():
+    app = FastAPI()
+    app.include_router(metrics_router)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
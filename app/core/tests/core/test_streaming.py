@@ -0,0 +1,79 @@
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import insert, select
+
+from app.core.streaming import RowStream, StreamingTemplates
+from app.lyrics.models import SongResultsAll
+from config import templates
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def session_factory(db_session, db_sessionmaker):
+    await db_session.execute(
+        insert(SongResultsAll),
+        [
+            {
+                "store_name": f"store-{i}",
+                "prompt": f"prompt-{i}",
+                "attr_category": "mood",
+                "attr_value": f"value-{i}",
+                "ai": "stub",
+                "ai_model": "stub-v1",
+                "sample_song": f"sample-{i}",
+                "result_song": f"가사-{i:04d} " + "라" * 380,
+            }
+            for i in range(300)
+        ],
+    )
+    await db_session.commit()
+    return db_sessionmaker
+
+
+async def test_header_flushes_before_rows(session_factory):
+    streaming = StreamingTemplates(templates, chunk_size=4096)
+    rows = RowStream(
+        select(SongResultsAll).order_by(SongResultsAll.id),
+        session_factory,
+        yield_per=50,
+    )
+    chunks = streaming._generate(
+        "lyrics/results.html", {"request": None, "rows": rows}, 4096
+    )
+
+    first = await anext(chunks)
+    # 레이아웃 헤더는 첫 행을 읽기 전에 전송됨
+    assert "<!DOCTYPE html>" in first
+    assert rows.count == 0
+
+    rest = [chunk async for chunk in chunks]
+    body = first + "".join(rest)
+    assert rows.count == 300
+    assert "가사-0000" in body and "가사-0299" in body
+    assert body.rstrip().endswith("</html>")
+    # 이후 행은 chunk_size 단위로 묶어서 전송
+    assert 10 < len(rest) < 300
+    assert all(len(chunk) < 4096 + 2048 for chunk in rest)
+
+
+async def test_streaming_response(session_factory):
+    app = FastAPI()
+    streaming = StreamingTemplates(templates)
+
+    @app.get("/results")
+    async def results(request: Request):
+        stmt = select(SongResultsAll).order_by(SongResultsAll.id.desc()).limit(5)
+        rows = RowStream(stmt, session_factory)
+        return streaming.response(request, "lyrics/results.html", {"rows": rows})
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/results")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert "content-length" not in response.headers
+    assert response.text.count("<tr>") == 6  # 헤더 1 + 행 5
@@ -0,0 +1,59 @@
+from types import SimpleNamespace
+
+from jinja2 import ChoiceLoader, FileSystemBytecodeCache
+
+from app.core.templating import (
+    TEMPLATES_DIR,
+    build_template_env,
+    compile_templates,
+    template_names,
+    warm_up,
+)
+
+
+def _settings(**overrides):
+    values = {
+        "TEMPLATE_AUTO_RELOAD": True,
+        "TEMPLATE_BYTECODE_CACHE": "none",
+        "TEMPLATE_BYTECODE_CACHE_DIR": "",
+        "TEMPLATE_BYTECODE_REDIS_DB": 4,
+        "TEMPLATE_PRECOMPILED_DIR": "",
+        "TEMPLATE_WARMUP": True,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def test_production_env_with_bytecode_cache(tmp_path):
+    env = build_template_env(
+        TEMPLATES_DIR,
+        _settings(
+            TEMPLATE_AUTO_RELOAD=False,
+            TEMPLATE_BYTECODE_CACHE="filesystem",
+            TEMPLATE_BYTECODE_CACHE_DIR=str(tmp_path),
+        ),
+    )
+    assert env.auto_reload is False
+    assert isinstance(env.bytecode_cache, FileSystemBytecodeCache)
+
+    assert warm_up(env) == len(template_names(env)) > 0
+    assert "index.html" in template_names(env)
+    # 다른 워커는 캐시 파일에서 바로 로드
+    assert list(tmp_path.iterdir())
+
+
+def test_precompiled_templates_render_like_source(tmp_path):
+    compiled = compile_templates(tmp_path)
+    assert compiled
+
+    env = build_template_env(
+        TEMPLATES_DIR, _settings(TEMPLATE_PRECOMPILED_DIR=str(tmp_path))
+    )
+    assert isinstance(env.loader, ChoiceLoader)
+    source_env = build_template_env(TEMPLATES_DIR, _settings())
+
+    context = {"request": None, "url_for": lambda *a, **k: "/static/x"}
+    for name in template_names(source_env):
+        assert env.get_template(name).render(context) == source_env.get_template(
+            name
+        ).render(context)
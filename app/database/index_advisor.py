@@ -0,0 +1,194 @@
+"""
+인덱스 어드바이저
+
+관리자 화면(sqladmin ModelView)과 커서 페이지네이션이 실제로 만드는 쿼리 형태에
+EXPLAIN 을 실행해 풀 스캔/filesort 를 찾아냅니다. CI 에서 돌려 인덱스 누락을
+배포 전에 잡는 용도입니다.
+
+    python -m app.database.index_advisor
+    python -m app.database.index_advisor --url "sqlite+aiosqlite:///./poc.db" --json
+
+옵티마이저는 통계 기반이므로 실제 데이터량과 비슷한 DB 에서 실행해야 의미가 있습니다.
+발견 항목이 있으면 종료 코드 1 을 반환합니다.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from starlette.requests import Request
+
+from app.dependencies.pagination import Cursor, seek_predicate
+from app.lyrics.api.routers.lyrics_admin import (
+    LyricsAttributeAdmin,
+    LyricsPromptTemplateAdmin,
+    LyricsSongResultsAllAdmin,
+    LyricsSongSampleAdmin,
+    LyricsStoreDefaultInfoAdmin,
+)
+from config import db_settings
+
+ADMIN_VIEWS = (
+    LyricsStoreDefaultInfoAdmin,
+    LyricsAttributeAdmin,
+    LyricsSongSampleAdmin,
+    LyricsPromptTemplateAdmin,
+    LyricsSongResultsAllAdmin,
+)
+
+
+@dataclass(slots=True)
+class QueryShape:
+    view: str
+    name: str
+    stmt: Select
+    # 앞쪽 와일드카드 검색(LIKE '%x%')처럼 B-tree 로는 피할 수 없는 스캔
+    expect_scan: bool = False
+
+
+@dataclass(slots=True)
+class Finding:
+    view: str
+    shape: str
+    status: str  # ok | scan | expected
+    problems: list[str] = field(default_factory=list)
+    plan: list[str] = field(default_factory=list)
+
+
+def _request(query_string: str = "") -> Request:
+    return Request(
+        {"type": "http", "query_string": query_string.encode(), "headers": []}
+    )
+
+
+def _list_stmt(view, query_string: str = "") -> Select:
+    request = _request(query_string)
+    stmt = view.sort_query(view.list_query(request), request)
+    return stmt.limit(view.page_size)
+
+
+def collect_shapes() -> list[QueryShape]:
+    """ModelView 의 list/sort/search/count 쿼리와 커서 페이지 쿼리를 생성"""
+    shapes = []
+    for view_class in ADMIN_VIEWS:
+        view = view_class()
+        model = view.model
+        name = view_class.__name__
+
+        shapes.append(QueryShape(name, "list:default", _list_stmt(view)))
+        for sort_field in view._sort_fields:
+            for order in ("asc", "desc"):
+                shapes.append(
+                    QueryShape(
+                        name,
+                        f"list:sort={sort_field}:{order}",
+                        _list_stmt(view, f"sortBy={sort_field}&sort={order}"),
+                    )
+                )
+
+        if view._search_fields:
+            shapes.append(
+                QueryShape(
+                    name,
+                    "list:search",
+                    view.search_query(_list_stmt(view), "term"),
+                    expect_scan=True,
+                )
+            )
+
+        shapes.append(QueryShape(name, "count", view.count_query(_request())))
+
+        cursor = Cursor(datetime(2025, 1, 1), 1)
+        shapes.append(
+            QueryShape(
+                name,
+                "keyset:next",
+                view.list_query(_request())
+                .where(seek_predicate(model, cursor, greater=False))
+                .order_by(model.created_at.desc(), model.id.desc())
+                .limit(view.page_size + 1),
+            )
+        )
+    return shapes
+
+
+async def explain(conn: AsyncConnection, stmt: Select) -> tuple[list[str], list[str]]:
+    """(실행 계획 요약 줄, 문제 목록) 반환"""
+    dialect = conn.dialect
+    compiled = stmt.compile(dialect=dialect)
+    params = compiled.construct_params()
+    if compiled.positional:
+        params = tuple(params[key] for key in compiled.positiontup)
+
+    if dialect.name == "sqlite":
+        result = await conn.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {compiled.string}", params
+        )
+        plan = [row[-1] for row in result]
+        problems = []
+        for detail in plan:
+            if detail.startswith("SCAN ") and " USING " not in detail:
+                problems.append(f"full scan: {detail}")
+            if "TEMP B-TREE FOR ORDER BY" in detail:
+                problems.append("filesort")
+        return plan, problems
+
+    if dialect.name in ("mysql", "mariadb"):
+        result = await conn.exec_driver_sql(f"EXPLAIN {compiled.string}", params)
+        plan, problems = [], []
+        for row in result.mappings():
+            plan.append(
+                f"{row['table']}: type={row['type']} key={row['key']} "
+                f"rows={row['rows']} extra={row['Extra']}"
+            )
+            if row["type"] == "ALL":
+                problems.append(f"full scan: {row['table']}")
+            if row["Extra"] and "Using filesort" in row["Extra"]:
+                problems.append(f"filesort: {row['table']}")
+        return plan, problems
+
+    raise NotImplementedError(f"unsupported dialect: {dialect.name}")
+
+
+async def analyze(url: str) -> list[Finding]:
+    engine = create_async_engine(url)
+    findings = []
+    try:
+        async with engine.connect() as conn:
+            for shape in collect_shapes():
+                plan, problems = await explain(conn, shape.stmt)
+                if not problems:
+                    status = "ok"
+                else:
+                    status = "expected" if shape.expect_scan else "scan"
+                findings.append(Finding(shape.view, shape.name, status, problems, plan))
+    finally:
+        await engine.dispose()
+    return findings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="관리자 쿼리 EXPLAIN 인덱스 점검")
+    parser.add_argument("--url", default=db_settings.DATABASE_URL, help="async DB URL")
+    parser.add_argument("--json", action="store_true", help="JSON 으로 출력")
+    args = parser.parse_args()
+
+    findings = asyncio.run(analyze(args.url))
+
+    if args.json:
+        print(json.dumps([asdict(f) for f in findings], ensure_ascii=False, indent=2))
+    else:
+        for f in findings:
+            detail = "; ".join(f.problems)
+            print(f"{f.status.upper():<9} {f.view:<30} {f.shape:<40} {detail}")
+
+    return 1 if any(f.status == "scan" for f in findings) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+"""
+DB 커넥션 풀 계측 / 적응형 overflow 조절
+
+InstrumentedAsyncQueuePool 을 poolclass 로 쓰고 instrument_engine() 으로
+풀 이벤트를 연결하면 /metrics 에 다음이 노출됩니다.
+
+    db_pool_wait_seconds{pool}                       풀에서 연결을 얻기까지 대기 시간
+    db_pool_checkout_duration_seconds{pool,route}    연결을 잡고 있던 시간 (라우트별)
+    db_pool_in_use / overflow / size / max_overflow  현재 풀 상태
+    db_pool_timeouts_total, connections_total, invalidations_total
+
+AdaptivePoolController 는 최근 대기 시간이 목표를 넘으면 max_overflow 를 늘리고,
+대기가 없고 여유가 있으면 줄입니다 (DB_POOL_ADAPTIVE).
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.context import current_route
+from app.core.metrics import Counter, Gauge, Histogram
+
+logger = logging.getLogger(__name__)
+
+WAIT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+)  # fmt: skip
+
+pool_wait = Histogram(
+    "db_pool_wait_seconds", "커넥션 풀 대기 시간", ("pool",), buckets=WAIT_BUCKETS
+)
+pool_checkout_duration = Histogram(
+    "db_pool_checkout_duration_seconds", "커넥션 점유 시간", ("pool", "route")
+)
+pool_in_use = Gauge("db_pool_in_use", "사용 중인 커넥션 수", ("pool",))
+pool_overflow = Gauge("db_pool_overflow", "pool_size 를 넘어 연 커넥션 수", ("pool",))
+pool_size = Gauge("db_pool_size", "기본 풀 크기", ("pool",))
+pool_max_overflow = Gauge("db_pool_max_overflow", "현재 max_overflow", ("pool",))
+pool_timeouts = Counter("db_pool_timeouts_total", "pool_timeout 초과 횟수", ("pool",))
+pool_connections = Counter("db_pool_connections_total", "새 DB 연결 수", ("pool",))
+pool_invalidations = Counter(
+    "db_pool_invalidations_total", "무효화된 연결 수", ("pool",)
+)
+
+
+def _pool_name(pool: QueuePool) -> str:
+    return pool._orig_logging_name or "default"
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """연결 획득(_do_get) 시간과 타임아웃을 기록하는 비동기 큐 풀
+
+    엔진 생성 시 pool_logging_name 이 메트릭의 pool 라벨이 됩니다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 적응형 조절용 최근 대기 시간 (초)
+        self.recent_waits: deque[float] = deque(maxlen=1024)
+        self.peak_in_use = 0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        name = _pool_name(self)
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            waited = time.perf_counter() - started
+            pool_timeouts.inc(pool=name)
+            pool_wait.observe(waited, pool=name)
+            self.recent_waits.append(waited)
+            raise
+        waited = time.perf_counter() - started
+        pool_wait.observe(waited, pool=name)
+        self.recent_waits.append(waited)
+        self.peak_in_use = max(self.peak_in_use, self.checkedout())
+        return record
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """풀 이벤트 리스너와 상태 게이지 등록 (엔진당 1회)"""
+    sync_engine = engine.sync_engine
+    name = _pool_name(sync_engine.pool)
+
+    @event.listens_for(sync_engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        pool_connections.inc(pool=name)
+
+    @event.listens_for(sync_engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checkout"] = (time.perf_counter(), current_route())
+
+    @event.listens_for(sync_engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        checkout = connection_record.info.pop("checkout", None)
+        if checkout is not None:
+            started, route = checkout
+            pool_checkout_duration.observe(
+                time.perf_counter() - started, pool=name, route=route
+            )
+
+    @event.listens_for(sync_engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        pool_invalidations.inc(pool=name)
+
+    # dispose() 로 풀이 교체되어도 현재 풀을 읽도록 엔진을 통해 조회
+    pool_in_use.set_function(lambda: sync_engine.pool.checkedout(), pool=name)
+    pool_overflow.set_function(lambda: max(sync_engine.pool.overflow(), 0), pool=name)
+    pool_size.set_function(lambda: sync_engine.pool.size(), pool=name)
+    pool_max_overflow.set_function(lambda: sync_engine.pool._max_overflow, pool=name)
+
+
+class AdaptivePoolController:
+    """최근 대기 시간 p95 로 max_overflow 조절
+
+    - p95 > target_wait: step 만큼 증가 (max_limit 까지)
+    - 그 외 최대 사용량이 pool_size + max_overflow/2 미만: step 만큼 감소
+      (min_limit 까지)
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        *,
+        target_wait: float = 0.05,
+        min_limit: int = 0,
+        max_limit: int = 50,
+        step: int = 5,
+        interval: float = 10.0,
+    ):
+        self.engine = engine
+        self.target_wait = target_wait
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.step = step
+        self.interval = interval
+        self._task: asyncio.Task | None = None
+
+    @property
+    def pool(self) -> InstrumentedAsyncQueuePool:
+        return self.engine.sync_engine.pool
+
+    def adjust(self) -> int:
+        """한 번 조절하고 새 max_overflow 반환"""
+        pool = self.pool
+        waits = sorted(pool.recent_waits)
+        pool.recent_waits.clear()
+        peak, pool.peak_in_use = pool.peak_in_use, pool.checkedout()
+        current = pool._max_overflow
+        p95 = waits[min(len(waits) - 1, int(len(waits) * 0.95))] if waits else 0.0
+        new = current
+        if p95 > self.target_wait:
+            new = min(self.max_limit, current + self.step)
+        elif peak < pool.size() + current / 2:
+            new = max(self.min_limit, current - self.step)
+
+        if new != current:
+            logger.info(
+                "pool %s max_overflow %d -> %d (p95 wait %.3fs, peak %d)",
+                _pool_name(pool),
+                current,
+                new,
+                p95,
+                peak,
+            )
+            pool._max_overflow = new
+        return new
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                self.adjust()
+            except Exception:
+                logger.exception("adaptive pool adjustment failed")
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="adaptive-pool")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
@@ -1,30 +1,185 @@
+"""
+Redis 연결 관리
+
+논리 DB 마다 명시적인 ConnectionPool 을 하나씩 두고 lifespan 에서 시작/종료합니다.
+여러 키를 다루는 작업은 MGET/MSET/파이프라인으로 한 번의 왕복에 처리합니다.
+
+    client = redis_manager.client("token_blacklist")
+
+테스트에서는 `redis_manager.override(name, FakeRedis())` 로 교체하고
+`redis_manager.clear_overrides()` 로 되돌립니다 (app/database/tests/fake_redis.py).
+"""
+
+import logging
+from collections.abc import Iterable, Mapping
 from uuid import UUID
-from redis.asyncio import Redis
 
-from app.config import db_settings
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.exceptions import RedisError
+
+from config import cache_settings, db_settings, rate_limit_settings, worker_settings
+
+logger = logging.getLogger(__name__)
+
+
+class RedisManager:
+    def __init__(self):
+        # 이름 -> (db 번호, decode_responses)
+        self._databases: dict[str, tuple[int, bool]] = {}
+        self._pools: dict[str, BlockingConnectionPool] = {}
+        self._clients: dict[str, Redis] = {}
+        # override() 한 이름 -> 교체 전 실제 클라이언트 (없으면 None)
+        self._overridden: dict[str, Redis | None] = {}
+
+    @property
+    def databases(self) -> dict[str, tuple[int, bool]]:
+        """등록된 이름 -> (db 번호, decode_responses)"""
+        return dict(self._databases)
+
+    def register(self, name: str, db: int, *, decode_responses: bool = False) -> None:
+        self._databases[name] = (db, decode_responses)
+
+    def client(self, name: str) -> Redis:
+        """이름에 해당하는 클라이언트 (최초 호출 시 풀 생성, 실제 연결은 지연)"""
+        client = self._clients.get(name)
+        if client is not None:
+            return client
+
+        db, decode_responses = self._databases[name]
+        pool = BlockingConnectionPool.from_url(
+            db_settings.REDIS_URL(db),
+            max_connections=db_settings.REDIS_MAX_CONNECTIONS,
+            timeout=db_settings.REDIS_POOL_TIMEOUT,
+            socket_timeout=db_settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=db_settings.REDIS_SOCKET_TIMEOUT,
+            health_check_interval=db_settings.REDIS_HEALTH_CHECK_INTERVAL,
+            decode_responses=decode_responses,
+        )
+        client = Redis(connection_pool=pool)
+        self._pools[name] = pool
+        self._clients[name] = client
+        return client
+
+    def override(self, name: str, client) -> None:
+        """테스트 더블 등으로 클라이언트 교체 (clear_overrides() 로 되돌림)"""
+        if name not in self._databases:
+            raise KeyError(f"unknown redis database: {name!r}")
+        # 이미 만든 실제 클라이언트/풀은 버리지 않고 clear_overrides() 때 복원
+        if name not in self._overridden:
+            self._overridden[name] = self._clients.get(name)
+        self._clients[name] = client
+
+    def clear_overrides(self) -> None:
+        """override() 이전 클라이언트로 복원 (없었으면 다음 client() 호출 때 생성)"""
+        for name, original in self._overridden.items():
+            if original is None:
+                self._clients.pop(name, None)
+            else:
+                self._clients[name] = original
+        self._overridden.clear()
+
+    async def health(self) -> dict[str, bool]:
+        """등록된 논리 DB 별 PING 결과"""
+        result = {}
+        for name in self._databases:
+            try:
+                result[name] = bool(await self.client(name).ping())
+            except (RedisError, OSError):
+                result[name] = False
+        return result
+
+    async def startup(self) -> None:
+        # Redis 는 캐시/보조 저장소라 연결 실패해도 앱 기동은 계속
+        for name, ok in (await self.health()).items():
+            if not ok:
+                logger.warning("redis '%s' is not reachable", name)
+
+    async def shutdown(self) -> None:
+        originals = [c for c in self._overridden.values() if c is not None]
+        for client in [*self._clients.values(), *originals]:
+            await client.aclose()
+        for pool in self._pools.values():
+            await pool.aclose()
+        self._clients.clear()
+        self._pools.clear()
+        self._overridden.clear()
 
 
-_token_blacklist = Redis(
-    host=db_settings.REDIS_HOST,
-    port=db_settings.REDIS_PORT,
-    db=0,
-)
-_shipment_verification_codes = Redis(
-    host=db_settings.REDIS_HOST,
-    port=db_settings.REDIS_PORT,
-    db=1,
-    decode_responses=True,
-)
+redis_manager = RedisManager()
+redis_manager.register("token_blacklist", 0)
+redis_manager.register("verification_codes", 1, decode_responses=True)
+redis_manager.register("response_cache", cache_settings.RESPONSE_CACHE_REDIS_DB)
+redis_manager.register("worker_queue", worker_settings.WORKER_REDIS_DB)
+redis_manager.register("rate_limit", rate_limit_settings.RATE_LIMIT_REDIS_DB)
 
-async def add_jti_to_blacklist(jti: str):
-    await _token_blacklist.set(jti, "blacklisted")
+
+# 다른 워커의 로컬 Bloom 필터에 새 JTI 를 알리는 채널 (메시지: 줄바꿈으로 구분한 JTI)
+BLACKLIST_CHANNEL = "jti_blacklist"
+
+
+async def add_jti_to_blacklist(jti: str, ttl: int | None = None):
+    await add_jtis_to_blacklist([jti], ttl)
+
+
+async def add_jtis_to_blacklist(jtis: Iterable[str], ttl: int | None = None):
+    """여러 JTI 를 한 번의 왕복으로 등록하고 다른 워커에 알림 (ttl: 남은 수명, 초)"""
+    jtis = list(jtis)
+    if not jtis:
+        return
+    client = redis_manager.client("token_blacklist")
+    async with client.pipeline(transaction=False) as pipe:
+        if ttl is None:
+            pipe.mset(dict.fromkeys(jtis, "blacklisted"))
+        else:
+            for jti in jtis:
+                pipe.set(jti, "blacklisted", ex=ttl)
+        pipe.publish(BLACKLIST_CHANNEL, "\n".join(jtis))
+        await pipe.execute()
 
 
 async def is_jti_blacklisted(jti: str) -> bool:
-    return await _token_blacklist.exists(jti)
+    return bool(await redis_manager.client("token_blacklist").exists(jti))
+
+
+async def are_jtis_blacklisted(jtis: Iterable[str]) -> list[bool]:
+    """JTI 목록의 블랙리스트 여부 (MGET 1회)"""
+    jtis = list(jtis)
+    if not jtis:
+        return []
+    values = await redis_manager.client("token_blacklist").mget(jtis)
+    return [value is not None for value in values]
+
+
+# 사용자별 권한 캐시 무효화 알림 채널 (메시지: 줄바꿈으로 구분한 사용자 ID, "*" 는 전체)
+# Pub/Sub 채널은 논리 DB 와 무관하므로 블랙리스트 연결을 같이 사용
+PERMISSION_CHANNEL = "permission_invalidate"
+
+
+async def publish_permission_invalidation(user_ids: Iterable[str]) -> None:
+    await redis_manager.client("token_blacklist").publish(
+        PERMISSION_CHANNEL, "\n".join(user_ids)
+    )
+
 
 async def add_shipment_verification_code(id: UUID, code: int):
-    await _shipment_verification_codes.set(str(id), code)
+    await redis_manager.client("verification_codes").set(str(id), code)
+
+
+async def add_shipment_verification_codes(codes: Mapping[UUID, int]):
+    """여러 인증 코드를 MSET 1회로 저장"""
+    if codes:
+        await redis_manager.client("verification_codes").mset(
+            {str(id): code for id, code in codes.items()}
+        )
+
 
 async def get_shipment_verification_code(id: UUID) -> str:
-    return str(await _shipment_verification_codes.get(str(id)))
\ No newline at end of file
+    return str(await redis_manager.client("verification_codes").get(str(id)))
+
+
+async def get_shipment_verification_codes(ids: Iterable[UUID]) -> list[str | None]:
+    """여러 인증 코드를 MGET 1회로 조회 (없는 항목은 None)"""
+    keys = [str(id) for id in ids]
+    if not keys:
+        return []
+    return await redis_manager.client("verification_codes").mget(keys)
@@ -0,0 +1,181 @@
+"""
+읽기/쓰기 분리 라우팅
+
+    primary 엔진 1개 + 읽기 복제본 엔진 N개 (MYSQL_REPLICA_HOSTS)
+
+RoutingSession.get_bind() 가 세션마다 연결할 엔진을 고릅니다.
+- 쓰기 세션(기본): 항상 primary
+- 읽기 세션(info["read_only"]): 복제본 (round_robin / least_connections)
+  단, flush/INSERT/UPDATE/DELETE 는 primary 로, 최근에 쓰기를 커밋했으면
+  sticky 구간 동안 읽기도 primary 로 보냅니다 (read-your-writes).
+
+sticky 구간은 요청 단위로 관리합니다. ReadYourWritesMiddleware 가 쓰기 후 응답에
+만료 시각 쿠키를 붙이고, 다음 요청에서 쿠키가 유효하면 primary 로 고정합니다.
+요청 밖(워커/스크립트)에서는 라우터 전역 상태를 사용합니다.
+"""
+
+import itertools
+import math
+import time
+from collections.abc import Sequence
+from contextvars import ContextVar
+from dataclasses import dataclass
+from http.cookies import SimpleCookie
+from typing import Literal
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.middleware.base import ASGIMiddleware, on_response_start
+
+
+@dataclass(slots=True)
+class StickyState:
+    pinned_until: float = 0.0  # time.monotonic() 기준
+    wrote: bool = False
+
+    def pinned(self) -> bool:
+        return time.monotonic() < self.pinned_until
+
+
+_sticky_state: ContextVar[StickyState | None] = ContextVar(
+    "db_sticky_state", default=None
+)
+
+
+class ReplicaRouter:
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: Sequence[AsyncEngine] = (),
+        *,
+        strategy: Literal["round_robin", "least_connections"] = "round_robin",
+        sticky_seconds: float = 3.0,
+    ):
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.strategy = strategy
+        self.sticky_seconds = sticky_seconds
+        self._counter = itertools.count()
+        self._global_state = StickyState()
+
+    @property
+    def state(self) -> StickyState:
+        return _sticky_state.get() or self._global_state
+
+    def choose_replica(self) -> AsyncEngine:
+        if not self.replicas:
+            return self.primary
+        if self.strategy == "least_connections":
+            return min(self.replicas, key=_checked_out)
+        return self.replicas[next(self._counter) % len(self.replicas)]
+
+    def mark_write(self) -> None:
+        state = self.state
+        state.wrote = True
+        state.pinned_until = time.monotonic() + self.sticky_seconds
+
+    def is_pinned(self) -> bool:
+        return self.state.pinned()
+
+    async def dispose(self) -> None:
+        for engine in (self.primary, *self.replicas):
+            await engine.dispose()
+
+
+def _checked_out(engine: AsyncEngine) -> int:
+    checkedout = getattr(engine.sync_engine.pool, "checkedout", None)
+    return checkedout() if checkedout else 0
+
+
+class RoutingSession(Session):
+    """info["router"] 의 ReplicaRouter 로 바인드를 고르는 세션
+
+    async_sessionmaker(sync_session_class=RoutingSession, info={...}) 로 사용합니다.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw) -> Engine:
+        router: ReplicaRouter | None = self.info.get("router")
+        if router is None:
+            return super().get_bind(mapper, clause=clause, **kw)
+
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info["wrote"] = True
+            return router.primary.sync_engine
+        if not self.info.get("read_only") or router.is_pinned():
+            return router.primary.sync_engine
+
+        # 한 세션 안에서는 같은 복제본 사용 (연결/스냅샷 일관성)
+        replica = self.info.get("replica")
+        if replica is None:
+            replica = self.info["replica"] = router.choose_replica()
+        return replica.sync_engine
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _pin_after_write(session: Session) -> None:
+    if session.info.pop("wrote", False):
+        session.info.pop("replica", None)
+        session.info["router"].mark_write()
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def _forget_rolled_back_write(session: Session) -> None:
+    session.info.pop("wrote", None)
+
+
+class ReadYourWritesMiddleware(ASGIMiddleware):
+    """요청마다 sticky 상태를 만들고 쿠키로 다음 요청까지 이어줌"""
+
+    def __init__(
+        self, app: ASGIApp, router: ReplicaRouter, cookie_name: str = "db_primary"
+    ):
+        super().__init__(app)
+        self.router = router
+        self.cookie_name = cookie_name
+
+    def _restore(self, scope: Scope) -> StickyState:
+        state = StickyState()
+        for name, value in scope["headers"]:
+            if name != b"cookie":
+                continue
+            morsel = SimpleCookie(value.decode("latin-1")).get(self.cookie_name)
+            if morsel is None:
+                continue
+            try:
+                remaining = float(morsel.value) - time.time()
+            except ValueError:
+                continue
+            # 위조된 먼 미래 쿠키로 primary 에 계속 묶이지 않도록 상한 적용
+            remaining = min(remaining, self.router.sticky_seconds)
+            if remaining > 0:
+                state.pinned_until = time.monotonic() + remaining
+        return state
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self.router.replicas:
+            await self.app(scope, receive, send)
+            return
+
+        state = self._restore(scope)
+        token = _sticky_state.set(state)
+
+        def set_cookie(message: Message) -> None:
+            if state.wrote:
+                expires = time.time() + self.router.sticky_seconds
+                MutableHeaders(scope=message).append(
+                    "set-cookie",
+                    f"{self.cookie_name}={expires:.0f}; "
+                    f"Max-Age={math.ceil(self.router.sticky_seconds)}; "
+                    "Path=/; HttpOnly; SameSite=Lax",
+                )
+
+        try:
+            await self.app(scope, receive, on_response_start(send, set_cookie))
+        finally:
+            _sticky_state.reset(token)
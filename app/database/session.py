@@ -1,22 +1,39 @@
+import asyncio
+import logging
 from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
 
-from config import db_settings
+from app.database.pool_metrics import (
+    AdaptivePoolController,
+    InstrumentedAsyncQueuePool,
+    instrument_engine,
+)
+from app.database.routing import ReplicaRouter, RoutingSession
+from config import PROJECT_DIR, db_settings
+
+logger = logging.getLogger(__name__)
 
 
 class Base(DeclarativeBase):
     pass
 
 
-# 데이터베이스 엔진 생성
-engine = create_async_engine(
-    url=db_settings.MYSQL_URL,
+# 데이터베이스 엔진 생성 (primary 와 읽기 복제본 공통 옵션)
+ENGINE_OPTIONS = dict(
     echo=False,
-    pool_size=10,
-    max_overflow=10,
-    pool_timeout=5,
+    poolclass=InstrumentedAsyncQueuePool,
+    pool_size=db_settings.DB_POOL_SIZE,
+    max_overflow=db_settings.DB_MAX_OVERFLOW,
+    pool_timeout=db_settings.DB_POOL_TIMEOUT,
     pool_recycle=3600,
     pool_pre_ping=True,
     pool_reset_on_return="rollback",
@@ -27,31 +44,119 @@ engine = create_async_engine(
     },
 )
 
-# Async sessionmaker 생성
-AsyncSessionLocal = async_sessionmaker(
-    bind=engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
+
+def engine_options(url: str) -> dict:
+    """connect_args 는 asyncmy 전용이라 다른 드라이버(DB_URL)에는 넘기지 않음"""
+    if url.startswith("mysql"):
+        return ENGINE_OPTIONS
+    return {k: v for k, v in ENGINE_OPTIONS.items() if k != "connect_args"}
+
+
+# pool_logging_name 은 풀 메트릭의 pool 라벨
+engine = create_async_engine(
+    url=db_settings.DATABASE_URL,
+    pool_logging_name="primary",
+    **engine_options(db_settings.DATABASE_URL),
+)
+
+replica_engines = [
+    create_async_engine(url=url, pool_logging_name=f"replica-{i}", **ENGINE_OPTIONS)
+    for i, url in enumerate(db_settings.MYSQL_REPLICA_URLS)
+]
+
+for _engine in (engine, *replica_engines):
+    instrument_engine(_engine)
+
+pool_controllers = [
+    AdaptivePoolController(
+        _engine,
+        target_wait=db_settings.DB_POOL_TARGET_WAIT,
+        min_limit=db_settings.DB_MAX_OVERFLOW,
+        max_limit=db_settings.DB_POOL_MAX_OVERFLOW_LIMIT,
+    )
+    for _engine in (engine, *replica_engines)
+    if db_settings.DB_POOL_ADAPTIVE
+]
+
+db_router = ReplicaRouter(
+    engine,
+    replica_engines,
+    strategy=db_settings.DB_READ_STRATEGY,
+    sticky_seconds=db_settings.DB_STICKY_SECONDS,
 )
 
 
-async def create_db_tables():
-    async with engine.begin() as connection:
-        from app.lyrics.models import (  # noqa: F401
-            Attribute,
-            PromptTemplate,
-            SongResultsAll,
-            SongSample,
-            StoreDefaultInfo,
-        )
+def routing_sessionmaker(
+    *, read_only: bool = False, router: ReplicaRouter = db_router, **kw
+) -> async_sessionmaker[AsyncSession]:
+    """read_only=True 면 SELECT 를 복제본으로 보내는 세션 팩토리"""
+    kw.setdefault("expire_on_commit", False)
+    return async_sessionmaker(
+        bind=router.primary,
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        info={"router": router, "read_only": read_only},
+        **kw,
+    )
 
-        print("Creating database tables...")
 
-        import asyncio
+# Async sessionmaker 생성 (쓰기/기본: primary)
+AsyncSessionLocal = routing_sessionmaker()
 
-        async with asyncio.timeout(10):
-            async with engine.begin() as connection:
-                await connection.run_sync(Base.metadata.create_all)
+# 읽기 전용 (목록/조회 화면, 복제본이 없으면 primary)
+ReadSessionLocal = routing_sessionmaker(read_only=True)
+
+
+async def create_db_tables():
+    from app.lyrics.models import (  # noqa: F401
+        Attribute,
+        PromptTemplate,
+        SongResultsAll,
+        SongSample,
+        StoreDefaultInfo,
+    )
+
+    logger.info("Creating database tables...")
+
+    async with asyncio.timeout(10):
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+
+def get_head_revision() -> str:
+    """alembic/versions 의 head 리비전 (DB 접속 없이 로컬 스크립트만 읽음)"""
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    script = ScriptDirectory.from_config(Config(str(PROJECT_DIR / "alembic.ini")))
+    return script.get_current_head()
+
+
+async def check_db_revision(bind: AsyncEngine = engine) -> str:
+    """DB 스키마가 마이그레이션 head 인지 확인
+
+    create_all 처럼 테이블마다 리플렉션하지 않고 alembic_version 1회 조회만 수행합니다.
+    """
+    head = get_head_revision()
+
+    async with asyncio.timeout(10):
+        async with bind.connect() as connection:
+            try:
+                current = await connection.scalar(
+                    text("SELECT version_num FROM alembic_version")
+                )
+            except DBAPIError as e:
+                raise RuntimeError(
+                    "alembic_version 테이블이 없습니다. "
+                    "`alembic upgrade head` 를 실행하세요."
+                ) from e
+
+    if current != head:
+        raise RuntimeError(
+            f"DB 스키마 리비전({current})이 head({head})와 다릅니다. "
+            "`alembic upgrade head` 를 실행하세요."
+        )
+    return current
 
 
 # FastAPI 의존성용 세션 제너레이터
@@ -63,12 +168,18 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             # await session.commit()
         except Exception as e:
             await session.rollback()
-            print(f"Session rollback due to: {e}")
+            logger.warning("Session rollback due to: %r", e)
             raise e
     # async with 종료 시 session.close()가 자동 호출됨
 
 
+# 읽기 전용 의존성 (복제본 라우팅, 쓰기 직후에는 primary)
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    async with ReadSessionLocal() as session:
+        yield session
+
+
 # 앱 종료 시 엔진 리소스 정리 함수
 async def dispose_engine() -> None:
-    await engine.dispose()
-    print("Database engine disposed")
+    await db_router.dispose()
+    logger.info("Database engine disposed")
@@ -0,0 +1,140 @@
+"""
+테스트용 DB 구성 (app/conftest.py 의 test_engine / db_session 픽스처)
+
+스키마는 테스트 세션(xdist 워커)마다 한 번만 만들고, 각 테스트는 연결 하나의 바깥
+트랜잭션 안에서 실행한 뒤 롤백합니다. 세션은 join_transaction_mode="create_savepoint"
+로 연결에 붙으므로 테스트 코드의 commit()/rollback() 은 SAVEPOINT 까지만 반영되고,
+테스트가 끝나면 바깥 트랜잭션 롤백으로 모두 사라집니다 (테이블 재생성/삭제 없음).
+
+    TEST_DB_URL 미지정                   프로세스 메모리 SQLite (서버 불필요)
+    TEST_DB_URL=mysql                    MYSQL_* 서버의 test_db (워커별 test_db_gw0 ...)
+    TEST_DB_URL=mysql+asyncmy://.../db   지정한 서버 DB (워커별 db_gw0, ...)
+    TEST_DB_URL=sqlite+aiosqlite:///t.db 파일 SQLite (워커별 t_gw0.db, ...)
+
+엔진/세션을 직접 만드는 코드(GenerationHandler, RowStream 등)에는 db_sessionmaker
+픽스처를 넘기면 같은 바깥 트랜잭션에 붙은 세션이 만들어집니다.
+"""
+
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool, StaticPool
+
+from app.database.session import Base
+from config import db_settings
+
+TEST_DB_NAME = "test_db"
+DEFAULT_TEST_DB_URL = "sqlite+aiosqlite://"
+
+
+def worker_id() -> str:
+    """pytest-xdist 워커 이름 (gw0, gw1, ...), 단일 프로세스면 빈 문자열"""
+    return os.environ.get("PYTEST_XDIST_WORKER", "")
+
+
+def worker_database_url(url: str | None = None, worker: str | None = None) -> URL:
+    """테스트 DB URL, 워커가 있으면 워커별 DB 이름/파일"""
+    url = url or os.environ.get("TEST_DB_URL") or DEFAULT_TEST_DB_URL
+    result = (
+        make_url(db_settings.MYSQL_URL).set(database=TEST_DB_NAME)
+        if url == "mysql"
+        else make_url(url)
+    )
+    worker = worker_id() if worker is None else worker
+    if not worker or not result.database or result.database == ":memory:":
+        return result
+    if result.get_backend_name() == "sqlite":
+        path = Path(result.database)
+        return result.set(database=str(path.with_stem(f"{path.stem}_{worker}")))
+    return result.set(database=f"{result.database}_{worker}")
+
+
+def _is_memory(url: URL) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def create_test_engine(url: URL) -> AsyncEngine:
+    if _is_memory(url):
+        # 메모리 DB 는 연결이 닫히면 사라지므로 연결 하나를 계속 사용
+        engine = create_async_engine(
+            url, poolclass=StaticPool, connect_args={"check_same_thread": False}
+        )
+    else:
+        engine = create_async_engine(url, pool_size=2, max_overflow=0)
+
+    if url.get_backend_name() == "sqlite":
+        # pysqlite 는 BEGIN 을 DML 직전까지 미루므로 SAVEPOINT 가 바깥 트랜잭션
+        # 밖에서 시작됨, BEGIN 을 직접 보냄
+        @event.listens_for(engine.sync_engine, "connect")
+        def _autocommit(dbapi_connection, _record) -> None:
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine.sync_engine, "begin")
+        def _begin(connection) -> None:
+            connection.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+async def create_database(url: URL) -> None:
+    """서버 DB 면 (워커별) 데이터베이스가 없을 때 생성"""
+    if url.get_backend_name() == "sqlite":
+        return
+    server = create_async_engine(url.set(database=None), poolclass=NullPool)
+    try:
+        async with server.connect() as connection:
+            await connection.execute(
+                text(f"CREATE DATABASE IF NOT EXISTS `{url.database}`")
+            )
+    finally:
+        await server.dispose()
+
+
+async def create_schema(engine: AsyncEngine) -> None:
+    import app.lyrics.models  # noqa: F401  (Base.metadata 에 테이블 등록)
+
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.create_all)
+
+
+async def drop_schema(engine: AsyncEngine) -> None:
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+
+
+@asynccontextmanager
+async def transactional_session(engine: AsyncEngine) -> AsyncIterator[AsyncSession]:
+    """끝나면 모든 변경을 롤백하는 세션 (commit() 은 SAVEPOINT 해제)"""
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(
+            bind=connection,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            if transaction.is_active:
+                await transaction.rollback()
+
+
+def transactional_sessionmaker(session: AsyncSession) -> async_sessionmaker:
+    """session 과 같은 연결/바깥 트랜잭션에 붙는 세션 팩토리"""
+    return async_sessionmaker(
+        bind=session.bind,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
@@ -0,0 +1,5 @@
+"""
+Database Tests 패키지
+
+DB/Redis 연결 관련 테스트를 제공합니다.
+"""
@@ -0,0 +1,63 @@
+import pytest
+from sqlalchemy import func, select
+
+from app.database.testing import transactional_session, worker_database_url
+from app.lyrics.models import PromptTemplate
+
+
+async def _count(session) -> int:
+    return await session.scalar(select(func.count()).select_from(PromptTemplate))
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_commit_is_rolled_back_after_session(test_engine):
+    async with transactional_session(test_engine) as session:
+        session.add(PromptTemplate(prompt="first"))
+        await session.commit()
+        assert await _count(session) == 1
+
+    async with transactional_session(test_engine) as session:
+        assert await _count(session) == 0
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_rollback_returns_to_last_commit(db_session):
+    db_session.add(PromptTemplate(prompt="kept"))
+    await db_session.commit()
+    db_session.add(PromptTemplate(prompt="discarded"))
+    await db_session.flush()
+    await db_session.rollback()
+
+    prompts = await db_session.scalars(select(PromptTemplate.prompt))
+    assert list(prompts) == ["kept"]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_sessionmaker_joins_test_transaction(db_session, db_sessionmaker):
+    async with db_sessionmaker() as other:
+        other.add(PromptTemplate(prompt="from factory"))
+        await other.commit()
+    assert await _count(db_session) == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_previous_test_rows_are_gone(db_session):
+    assert await _count(db_session) == 0
+
+
+def test_worker_database_url(monkeypatch):
+    monkeypatch.delenv("TEST_DB_URL", raising=False)
+    mysql = "mysql+asyncmy://test:pw@localhost:3306/test_db"
+
+    assert worker_database_url(mysql, worker="").database == "test_db"
+    assert worker_database_url(mysql, worker="gw1").database == "test_db_gw1"
+    assert worker_database_url("mysql", worker="gw0").database == "test_db_gw0"
+    # 기본은 서버가 필요 없는 메모리 SQLite (워커마다 프로세스가 다름)
+    assert worker_database_url(worker="gw0").get_backend_name() == "sqlite"
+    assert worker_database_url(worker="gw0").database is None
+
+    file = worker_database_url("sqlite+aiosqlite:////tmp/t.db", worker="gw2")
+    assert file.database == "/tmp/t_gw2.db"
+
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+    assert worker_database_url(mysql).database == "test_db_gw3"
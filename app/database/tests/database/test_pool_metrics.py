@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import exc, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.context import RequestContextMiddleware
+from app.core.metrics import REGISTRY
+from app.database.pool_metrics import (
+    AdaptivePoolController,
+    InstrumentedAsyncQueuePool,
+    instrument_engine,
+    pool_checkout_duration,
+    pool_connections,
+    pool_timeouts,
+    pool_wait,
+)
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    pytest.importorskip("aiosqlite")
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_logging_name="test-pool",
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    instrument_engine(engine)
+    yield engine
+    await engine.dispose()
+
+
+async def test_wait_timeout_and_gauges(engine):
+    async with engine.connect() as conn:
+        await conn.scalar(select(1))
+        assert REGISTRY.get("db_pool_in_use").value(pool="test-pool") == 1
+
+        # 풀이 가득 찬 상태에서 두 번째 연결은 pool_timeout 후 실패
+        with pytest.raises(exc.TimeoutError):
+            async with engine.connect():
+                pass
+
+    assert pool_timeouts.value(pool="test-pool") == 1
+    assert pool_connections.value(pool="test-pool") == 1
+    assert pool_wait.count(pool="test-pool") == 2
+    assert pool_wait.sum(pool="test-pool") >= 0.05
+
+    text = REGISTRY.render()
+    assert 'db_pool_in_use{pool="test-pool"} 0' in text
+    assert 'db_pool_max_overflow{pool="test-pool"} 0' in text
+
+
+async def test_checkout_duration_per_route(engine):
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int):
+        async with engine.connect() as conn:
+            await asyncio.sleep(0.01)
+            return {"value": await conn.scalar(select(item_id))}
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        for i in range(3):
+            assert (await client.get(f"/items/{i}")).json() == {"value": i}
+
+    labels = {"pool": "test-pool", "route": "/items/{item_id}"}
+    assert pool_checkout_duration.count(**labels) == 3
+    assert pool_checkout_duration.sum(**labels) >= 0.03
+
+
+async def test_adaptive_controller(engine):
+    controller = AdaptivePoolController(
+        engine, target_wait=0.01, min_limit=0, max_limit=6, step=4
+    )
+    pool = engine.sync_engine.pool
+
+    pool.recent_waits.extend([0.2] * 10)
+    assert controller.adjust() == 4
+    pool.recent_waits.extend([0.2] * 10)
+    assert controller.adjust() == 6
+
+    # 대기가 없고 사용량이 낮으면 다시 줄임
+    pool.recent_waits.extend([0.0] * 10)
+    assert controller.adjust() == 2
+    assert pool._max_overflow == 2
@@ -0,0 +1,104 @@
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse
+from httpx import ASGITransport, AsyncClient
+
+from app.core.cache import response_cache
+from app.database import redis as redis_module
+from app.database.redis import redis_manager
+from app.database.tests.fake_redis import FakeRedis, override_all
+
+
+@pytest.fixture
+def fake_redis():
+    yield override_all(redis_manager)
+    redis_manager.clear_overrides()
+
+
+@pytest.mark.asyncio
+async def test_batched_blacklist(fake_redis):
+    await redis_module.add_jtis_to_blacklist(["a", "b"], ttl=60)
+    await redis_module.add_jti_to_blacklist("c")
+
+    assert await redis_module.are_jtis_blacklisted(["a", "x", "c"]) == [
+        True,
+        False,
+        True,
+    ]
+    assert await redis_module.is_jti_blacklisted("b")
+    assert await fake_redis["token_blacklist"].ttl("a") == 60
+
+
+@pytest.mark.asyncio
+async def test_batched_verification_codes(fake_redis):
+    from uuid import uuid4
+
+    first, second, missing = uuid4(), uuid4(), uuid4()
+    await redis_module.add_shipment_verification_codes({first: 1234, second: 5678})
+
+    assert await redis_module.get_shipment_verification_codes(
+        [first, missing, second]
+    ) == ["1234", None, "5678"]
+    assert await redis_module.get_shipment_verification_code(first) == "1234"
+
+
+@pytest.mark.asyncio
+async def test_health_and_shutdown(fake_redis):
+    assert await redis_manager.health() == dict.fromkeys(fake_redis, True)
+    assert fake_redis["verification_codes"].decode_responses
+    await redis_manager.shutdown()
+    assert all(client.closed for client in fake_redis.values())
+
+
+@pytest.mark.asyncio
+async def test_response_cache_hit_304_and_invalidation(fake_redis):
+    app = FastAPI()
+    renders = []
+
+    @app.get("/results")
+    @response_cache.cached(tags=("song_results_all",))
+    async def results(request: Request):
+        renders.append(1)
+        return HTMLResponse(f"<p>{len(renders)}</p>")
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get("/results")
+        assert first.headers["x-cache"] == "MISS"
+        second = await client.get("/results")
+        assert second.headers["x-cache"] == "HIT"
+        assert second.text == first.text
+        assert len(renders) == 1
+
+        not_modified = await client.get(
+            "/results", headers={"if-none-match": first.headers["etag"]}
+        )
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+
+        assert await response_cache.invalidate_tags("song_results_all") == 2
+        assert (await client.get("/results")).text == "<p>2</p>"
+
+
+@pytest.mark.asyncio
+async def test_override_and_clear_overrides():
+    with pytest.raises(KeyError):
+        redis_manager.override("missing", FakeRedis())
+
+    fake = FakeRedis()
+    redis_manager.override("rate_limit", fake)
+    assert redis_manager.client("rate_limit") is fake
+    redis_manager.clear_overrides()
+    # 다음 호출은 실제 풀의 클라이언트 (연결은 명령을 보낼 때 생성)
+    assert not isinstance(redis_manager.client("rate_limit"), FakeRedis)
+    await redis_manager.shutdown()
+
+
+async def test_override_restores_existing_client():
+    real = redis_manager.client("rate_limit")
+    redis_manager.override("rate_limit", FakeRedis())
+    redis_manager.override("rate_limit", FakeRedis())
+    redis_manager.clear_overrides()
+    # 이미 만든 실제 클라이언트(풀)를 버리지 않고 그대로 복원
+    assert redis_manager.client("rate_limit") is real
+    await redis_manager.shutdown()
@@ -0,0 +1,135 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.database.routing import ReadYourWritesMiddleware, ReplicaRouter
+from app.database.session import Base, routing_sessionmaker
+from app.lyrics.models import PromptTemplate
+
+
+@pytest.fixture
+async def engines(tmp_path):
+    """primary 1개 + 복제본 2개 (각각 다른 행을 가진 SQLite 파일)"""
+    pytest.importorskip("aiosqlite")
+    engines = {}
+    for name in ("primary", "replica-a", "replica-b"):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / name}.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with routing_sessionmaker(router=ReplicaRouter(engine))() as session:
+            session.add(PromptTemplate(prompt=name))
+            await session.commit()
+        engines[name] = engine
+    yield engines
+    for engine in engines.values():
+        await engine.dispose()
+
+
+def _router(engines, **kw) -> ReplicaRouter:
+    return ReplicaRouter(
+        engines["primary"], [engines["replica-a"], engines["replica-b"]], **kw
+    )
+
+
+async def _read_source(session_factory) -> str:
+    async with session_factory() as session:
+        return await session.scalar(select(PromptTemplate.prompt).limit(1))
+
+
+async def test_reads_round_robin_and_writes_go_to_primary(engines):
+    router = _router(engines, sticky_seconds=0)
+    reader = routing_sessionmaker(read_only=True, router=router)
+
+    assert [await _read_source(reader) for _ in range(4)] == [
+        "replica-a",
+        "replica-b",
+        "replica-a",
+        "replica-b",
+    ]
+    # 쓰기 세션은 항상 primary
+    assert await _read_source(routing_sessionmaker(router=router)) == "primary"
+
+    # 읽기 세션에서 flush 한 쓰기도 primary 로
+    async with reader() as session:
+        session.add(PromptTemplate(prompt="written"))
+        await session.commit()
+    async with engines["primary"].connect() as conn:
+        rows = await conn.scalars(select(PromptTemplate.prompt))
+        assert "written" in rows.all()
+
+
+async def test_sticky_window_after_commit(engines):
+    router = _router(engines, sticky_seconds=0.2)
+    reader = routing_sessionmaker(read_only=True, router=router)
+    writer = routing_sessionmaker(router=router)
+
+    # 읽기만 한 커밋은 고정하지 않음
+    async with writer() as session:
+        await session.scalar(select(PromptTemplate.id))
+        await session.commit()
+    assert not router.is_pinned()
+
+    async with writer() as session:
+        session.add(PromptTemplate(prompt="new"))
+        await session.commit()
+    assert router.is_pinned()
+    assert await _read_source(reader) == "primary"
+
+    await asyncio.sleep(0.25)
+    assert await _read_source(reader) in ("replica-a", "replica-b")
+
+
+async def test_least_connections(engines):
+    router = _router(engines, strategy="least_connections")
+    async with engines["replica-a"].connect() as conn:
+        await conn.scalar(select(1))
+        assert router.choose_replica() is engines["replica-b"]
+        assert router.choose_replica() is engines["replica-b"]
+
+
+async def test_middleware_pins_client_with_cookie(engines):
+    router = _router(engines, sticky_seconds=5)
+    reader = routing_sessionmaker(read_only=True, router=router)
+    writer = routing_sessionmaker(router=router)
+
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware, router=router)
+
+    @app.post("/items")
+    async def create():
+        async with writer() as session:
+            session.add(PromptTemplate(prompt="item"))
+            await session.commit()
+        return {"source": await _read_source(reader)}
+
+    @app.get("/items")
+    async def read():
+        return {"source": await _read_source(reader)}
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post("/items")
+        assert response.json() == {"source": "primary"}
+        assert "db_primary" in response.cookies
+
+        # 쿠키를 가진 클라이언트는 sticky 구간 동안 primary
+        assert (await client.get("/items")).json() == {"source": "primary"}
+        client.cookies.clear()
+        assert (await client.get("/items")).json()["source"].startswith("replica")
+
+    # 요청 단위 상태이므로 전역 상태는 고정되지 않음
+    assert not router.is_pinned()
+
+
+async def test_middleware_caps_forged_cookie(engines):
+    router = _router(engines, sticky_seconds=5)
+    middleware = ReadYourWritesMiddleware(FastAPI(), router=router)
+    forged = f"db_primary={time.time() + 10**9:.0f}".encode()
+
+    state = middleware._restore({"headers": [(b"cookie", forged)]})
+    assert state.pinned_until <= time.monotonic() + router.sticky_seconds
@@ -0,0 +1,329 @@
+"""
+테스트용 인메모리 Redis 더블
+
+redis.asyncio.Redis 중 이 프로젝트가 사용하는 명령만 흉내 냅니다.
+Redis 서버 없이 테스트/벤치마크를 돌리기 위한 용도이며 운영 코드에서 사용하지 않습니다.
+
+    fake = FakeRedis()
+    redis_manager.override("token_blacklist", fake)
+
+    clients = override_all(redis_manager)  # 등록된 모든 논리 DB
+    ...
+    redis_manager.clear_overrides()
+"""
+
+import asyncio
+import fnmatch
+import time
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.database.redis import RedisManager
+
+
+def _encode(value: Any) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, str):
+        return value.encode()
+    if isinstance(value, (int, float)):
+        return repr(value).encode()
+    raise TypeError(f"unsupported value type: {type(value).__name__}")
+
+
+class FakeRedis:
+    def __init__(self, *, decode_responses: bool = False):
+        self.decode_responses = decode_responses
+        self._data: dict[bytes, Any] = {}
+        self._expires: dict[bytes, float] = {}
+        self.closed = False
+        # PUBLISH 기록 (구독은 흉내 내지 않음)
+        self.published: list[tuple[str, Any]] = []
+
+    # --- 내부 헬퍼 ---------------------------------------------------------
+
+    def _out(self, value: bytes | None):
+        if value is None or not self.decode_responses:
+            return value
+        return value.decode()
+
+    def _alive(self, key: bytes) -> bool:
+        deadline = self._expires.get(key)
+        if deadline is not None and deadline <= time.monotonic():
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+        return key in self._data
+
+    def _get(self, key, factory=None):
+        key = _encode(key)
+        if self._alive(key):
+            return self._data[key]
+        if factory is None:
+            return None
+        self._data[key] = factory()
+        return self._data[key]
+
+    # --- 연결 --------------------------------------------------------------
+
+    async def ping(self) -> bool:
+        return True
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+    # --- 키 ----------------------------------------------------------------
+
+    async def exists(self, *keys) -> int:
+        return sum(self._alive(_encode(key)) for key in keys)
+
+    async def delete(self, *keys) -> int:
+        deleted = 0
+        for key in map(_encode, keys):
+            if self._alive(key):
+                deleted += 1
+                del self._data[key]
+                self._expires.pop(key, None)
+        return deleted
+
+    async def expire(self, name, time_: int, nx=False, xx=False, gt=False, lt=False):
+        key = _encode(name)
+        if not self._alive(key):
+            return False
+        current = self._expires.get(key)
+        if (nx and current is not None) or (xx and current is None):
+            return False
+        deadline = time.monotonic() + time_
+        if gt and (current is None or deadline <= current):
+            return False
+        if lt and current is not None and deadline >= current:
+            return False
+        self._expires[key] = deadline
+        return True
+
+    async def ttl(self, name) -> int:
+        key = _encode(name)
+        if not self._alive(key):
+            return -2
+        deadline = self._expires.get(key)
+        return -1 if deadline is None else max(0, round(deadline - time.monotonic()))
+
+    async def keys(self, pattern: str = "*") -> list:
+        pattern = _encode(pattern).decode()
+        return [
+            self._out(key)
+            for key in list(self._data)
+            if self._alive(key) and fnmatch.fnmatchcase(key.decode(), pattern)
+        ]
+
+    async def scan_iter(self, match: str = "*", count: int | None = None):
+        for key in await self.keys(match):
+            yield key
+
+    async def publish(self, channel, message) -> int:
+        self.published.append((channel, message))
+        return 0
+
+    async def flushdb(self) -> bool:
+        self._data.clear()
+        self._expires.clear()
+        return True
+
+    # --- 문자열 ------------------------------------------------------------
+
+    async def get(self, name):
+        return self._out(self._get(name))
+
+    async def set(self, name, value, ex=None, px=None, nx=False, xx=False):
+        key = _encode(name)
+        exists = self._alive(key)
+        if (nx and exists) or (xx and not exists):
+            return None
+        self._data[key] = _encode(value)
+        self._expires.pop(key, None)
+        if ex is not None:
+            self._expires[key] = time.monotonic() + ex
+        elif px is not None:
+            self._expires[key] = time.monotonic() + px / 1000
+        return True
+
+    async def mget(self, keys: Iterable, *args) -> list:
+        keys = [keys] if isinstance(keys, (str, bytes)) else list(keys)
+        return [self._out(self._get(key)) for key in [*keys, *args]]
+
+    async def mset(self, mapping: Mapping) -> bool:
+        for key, value in mapping.items():
+            await self.set(key, value)
+        return True
+
+    async def incr(self, name, amount: int = 1) -> int:
+        value = int(self._get(name) or 0) + amount
+        key = _encode(name)
+        self._data[key] = _encode(value)
+        return value
+
+    # --- 해시 --------------------------------------------------------------
+
+    async def hset(self, name, key=None, value=None, mapping: Mapping | None = None):
+        data = self._get(name, dict)
+        items = dict(mapping or {})
+        if key is not None:
+            items[key] = value
+        added = 0
+        for field, field_value in items.items():
+            field = _encode(field)
+            added += field not in data
+            data[field] = _encode(field_value)
+        return added
+
+    async def hgetall(self, name) -> dict:
+        data = self._get(name) or {}
+        return {self._out(k): self._out(v) for k, v in data.items()}
+
+    # --- 집합 --------------------------------------------------------------
+
+    async def sadd(self, name, *values) -> int:
+        data = self._get(name, set)
+        before = len(data)
+        data.update(map(_encode, values))
+        return len(data) - before
+
+    async def srem(self, name, *values) -> int:
+        data = self._get(name) or set()
+        removed = 0
+        for value in map(_encode, values):
+            if value in data:
+                data.discard(value)
+                removed += 1
+        return removed
+
+    async def smembers(self, name) -> set:
+        return {self._out(value) for value in self._get(name) or set()}
+
+    # --- 리스트 ------------------------------------------------------------
+
+    async def rpush(self, name, *values) -> int:
+        data = self._get(name, list)
+        data.extend(map(_encode, values))
+        return len(data)
+
+    async def lpush(self, name, *values) -> int:
+        data = self._get(name, list)
+        for value in values:
+            data.insert(0, _encode(value))
+        return len(data)
+
+    async def llen(self, name) -> int:
+        return len(self._get(name) or [])
+
+    async def lrange(self, name, start: int, end: int) -> list:
+        data = self._get(name) or []
+        end = len(data) if end == -1 else end + 1
+        return [self._out(value) for value in data[start:end]]
+
+    async def lrem(self, name, count: int, value) -> int:
+        data = self._get(name) or []
+        value = _encode(value)
+        indexes = [i for i, item in enumerate(data) if item == value]
+        if count > 0:
+            indexes = indexes[:count]
+        elif count < 0:
+            indexes = indexes[count:]
+        for i in reversed(indexes):
+            del data[i]
+        return len(indexes)
+
+    async def lmove(self, first_list, second_list, src="LEFT", dest="RIGHT"):
+        source = self._get(first_list) or []
+        if not source:
+            return None
+        value = source.pop(0 if src.upper() == "LEFT" else -1)
+        target = self._get(second_list, list)
+        if dest.upper() == "LEFT":
+            target.insert(0, value)
+        else:
+            target.append(value)
+        return self._out(value)
+
+    async def blmove(self, first_list, second_list, timeout, src="LEFT", dest="RIGHT"):
+        # 블로킹 대신 timeout 동안 짧게 폴링
+        deadline = time.monotonic() + timeout
+        while True:
+            value = await self.lmove(first_list, second_list, src, dest)
+            if value is not None or time.monotonic() >= deadline:
+                return value
+            await asyncio.sleep(0.01)
+
+    # --- 정렬 집합 ---------------------------------------------------------
+
+    async def zadd(self, name, mapping: Mapping) -> int:
+        data = self._get(name, dict)
+        added = 0
+        for member, score in mapping.items():
+            member = _encode(member)
+            added += member not in data
+            data[member] = float(score)
+        return added
+
+    async def zrem(self, name, *values) -> int:
+        data = self._get(name) or {}
+        return sum(data.pop(_encode(value), None) is not None for value in values)
+
+    async def zcard(self, name) -> int:
+        return len(self._get(name) or {})
+
+    async def zrangebyscore(self, name, min, max, start=None, num=None) -> list:
+        low = float("-inf") if min == "-inf" else float(min)
+        high = float("inf") if max == "+inf" else float(max)
+        data = self._get(name) or {}
+        members = sorted(
+            (score, member) for member, score in data.items() if low <= score <= high
+        )
+        if start is not None and num is not None:
+            members = members[start : start + num]
+        return [self._out(member) for _, member in members]
+
+
+class FakePipeline:
+    """명령을 모아 두었다가 execute() 에서 순서대로 실행"""
+
+    def __init__(self, redis: FakeRedis):
+        self._redis = redis
+        self._commands: list[tuple[str, tuple, dict]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._commands.clear()
+
+    def __getattr__(self, name: str):
+        if not hasattr(self._redis, name):
+            raise AttributeError(name)
+
+        def queue(*args, **kwargs):
+            self._commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self) -> list:
+        results = []
+        for name, args, kwargs in self._commands:
+            results.append(await getattr(self._redis, name)(*args, **kwargs))
+        self._commands.clear()
+        return results
+
+
+def override_all(manager: "RedisManager") -> dict[str, FakeRedis]:
+    """manager 에 등록된 모든 논리 DB 를 FakeRedis 로 교체 (decode_responses 유지)"""
+    clients = {
+        name: FakeRedis(decode_responses=decode_responses)
+        for name, (_db, decode_responses) in manager.databases.items()
+    }
+    for name, client in clients.items():
+        manager.override(name, client)
+    return clients
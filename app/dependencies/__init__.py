@@ -4,13 +4,38 @@ Dependencies 패키지
 FastAPI 의존성(dependencies) 관련 모듈을 제공합니다.
 """
 
-from .auth import get_current_user, get_current_active_user
-from .database import get_db
-from .pagination import get_pagination_params
+from .auth import CurrentUser, get_current_active_user, get_current_user
+from .database import get_db, get_read_db
+from .pagination import (
+    Page,
+    PaginationParams,
+    get_pagination_params,
+    paginate,
+)
+from .permissions import (
+    Permissions,
+    get_permissions,
+    invalidate_user_permissions,
+    require_permissions,
+)
+from .rate_limit import RateLimit, by_api_key, by_client, rate_limit
 
 __all__ = [
-    "get_current_user",
+    "CurrentUser",
     "get_current_active_user",
+    "get_current_user",
     "get_db",
     "get_pagination_params",
+    "get_read_db",
+    "Page",
+    "PaginationParams",
+    "paginate",
+    "Permissions",
+    "get_permissions",
+    "invalidate_user_permissions",
+    "require_permissions",
+    "rate_limit",
+    "RateLimit",
+    "by_api_key",
+    "by_client",
 ]
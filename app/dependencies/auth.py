@@ -0,0 +1,352 @@
+"""
+JWT 인증 의존성
+
+    Authorization: Bearer <HS256 JWT>
+
+요청마다 하던 일을 줄이기 위해
+- 서명/클레임 검증이 끝난 토큰은 토큰 해시(SHA-256) 키의 TTL LRU 에 캐시하고
+  (exp 를 넘겨 캐시하지 않음)
+- JTI 블랙리스트는 로컬 Bloom 필터로 먼저 거릅니다. "확실히 없음" 이면 Redis 를
+  조회하지 않고, "아마 있음" 일 때만 EXISTS 로 확인합니다.
+
+Bloom 필터는 lifespan 에서 시작하면 Redis 블랙리스트 전체로 만들어지고,
+add_jti_to_blacklist() 가 발행하는 메시지를 구독해 다른 워커의 폐기도 바로
+반영합니다. 구독이 끊겨도 AUTH_BLACKLIST_SYNC_INTERVAL 마다 전체를 다시 읽습니다.
+첫 동기화 전에는 매번 Redis 로 확인합니다.
+
+    @router.get("/me")
+    async def me(user: CurrentUser = Depends(get_current_active_user)): ...
+"""
+
+import asyncio
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from redis.exceptions import RedisError
+
+from app.database.redis import BLACKLIST_CHANNEL, is_jti_blacklisted, redis_manager
+from app.utils.bloom import BloomFilter
+from config import security_settings
+
+logger = logging.getLogger(__name__)
+
+_HASHES = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+
+
+class InvalidToken(ValueError):
+    """서명/형식/유효기간 검증 실패"""
+
+
+def _b64decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def encode_token(
+    claims: dict[str, Any],
+    secret: str = security_settings.JWT_SECRET,
+    algorithm: str = security_settings.JWT_ALGORITHM,
+) -> str:
+    header = _b64encode(json.dumps({"alg": algorithm, "typ": "JWT"}).encode())
+    payload = _b64encode(json.dumps(claims, separators=(",", ":")).encode())
+    signing_input = f"{header}.{payload}".encode()
+    signature = hmac.new(secret.encode(), signing_input, _HASHES[algorithm]).digest()
+    return f"{header}.{payload}.{_b64encode(signature)}"
+
+
+def decode_token(
+    token: str,
+    secret: str = security_settings.JWT_SECRET,
+    algorithm: str = security_settings.JWT_ALGORITHM,
+    leeway: float = security_settings.JWT_LEEWAY,
+) -> dict[str, Any]:
+    """서명과 exp/nbf 를 검증한 클레임 (실패 시 InvalidToken)"""
+    try:
+        header_b64, payload_b64, signature_b64 = token.split(".")
+        header = json.loads(_b64decode(header_b64))
+        signature = _b64decode(signature_b64)
+    except (ValueError, binascii.Error):
+        raise InvalidToken("malformed token") from None
+    if not isinstance(header, dict):
+        raise InvalidToken("malformed token")
+
+    # alg 는 헤더가 아니라 설정값으로 고정 (alg=none / 알고리즘 혼동 공격 방지)
+    if header.get("alg") != algorithm or algorithm not in _HASHES:
+        raise InvalidToken("unexpected algorithm")
+    signing_input = f"{header_b64}.{payload_b64}".encode()
+    expected = hmac.new(secret.encode(), signing_input, _HASHES[algorithm]).digest()
+    if not hmac.compare_digest(signature, expected):
+        raise InvalidToken("invalid signature")
+
+    try:
+        claims = json.loads(_b64decode(payload_b64))
+    except (ValueError, binascii.Error):
+        raise InvalidToken("malformed payload") from None
+    if not isinstance(claims, dict):
+        raise InvalidToken("malformed payload")
+
+    now = time.time()
+    if "exp" in claims and now > _timestamp(claims, "exp") + leeway:
+        raise InvalidToken("token expired")
+    if "nbf" in claims and now < _timestamp(claims, "nbf") - leeway:
+        raise InvalidToken("token not yet valid")
+    return claims
+
+
+def _timestamp(claims: dict[str, Any], name: str) -> float:
+    value = claims[name]
+    # bool 은 int 의 하위 클래스, NaN 은 어떤 비교도 거짓이라 만료되지 않음
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise InvalidToken(f"invalid {name} claim")
+    if not math.isfinite(value):
+        raise InvalidToken(f"invalid {name} claim")
+    return float(value)
+
+
+@dataclass(frozen=True, slots=True)
+class CurrentUser:
+    id: str  # sub
+    jti: str | None
+    is_active: bool = True
+    claims: dict[str, Any] = field(default_factory=dict, compare=False)
+
+    @classmethod
+    def from_claims(cls, claims: dict[str, Any]) -> "CurrentUser":
+        if "sub" not in claims:
+            raise InvalidToken("missing sub")
+        jti = claims.get("jti")
+        if jti is not None and not isinstance(jti, str):
+            raise InvalidToken("invalid jti claim")
+        return cls(
+            id=str(claims["sub"]),
+            jti=jti,
+            is_active=bool(claims.get("active", True)),
+            claims=claims,
+        )
+
+
+class TokenCache:
+    """검증된 토큰 -> (CurrentUser, 만료 시각) TTL LRU"""
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[bytes, tuple[CurrentUser, float]] = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        # 토큰 원문을 메모리에 오래 들고 있지 않도록 해시로 보관
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> CurrentUser | None:
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        user, expires_at = entry
+        if time.time() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return user
+
+    def put(self, token: str, user: CurrentUser) -> None:
+        expires_at = time.time() + self.ttl
+        if "exp" in user.claims:
+            expires_at = min(expires_at, float(user.claims["exp"]))
+        key = self._key(token)
+        self._entries[key] = (user, expires_at)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class BlacklistFilter:
+    """JTI 블랙리스트의 로컬 Bloom 필터 (Redis 와 동기화)"""
+
+    def __init__(
+        self,
+        capacity: int = 100_000,
+        error_rate: float = 0.001,
+        sync_interval: float = 60.0,
+    ):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_interval = sync_interval
+        self.bloom: BloomFilter | None = None  # 첫 동기화 전에는 None
+        self.redis_checks = 0
+        # refresh() 도중 구독으로 들어온 JTI (새 필터에 다시 넣음)
+        self._pending: list[str] | None = None
+        self._tasks: list[asyncio.Task] = []
+
+    async def contains(self, jti: str) -> bool:
+        bloom = self.bloom
+        if bloom is not None and jti not in bloom:
+            return False
+        self.redis_checks += 1
+        try:
+            return await is_jti_blacklisted(jti)
+        except (RedisError, OSError):
+            if bloom is None:
+                # 동기화 전 Redis 장애: Redis 를 보조 저장소로 보는 다른 기능처럼 허용
+                logger.warning("token blacklist unavailable, skipping check")
+                return False
+            # Bloom 이 "아마 있음" 이라 했으므로 확인 불가 시 거절
+            return True
+
+    def add(self, jti: str) -> None:
+        if self.bloom is not None:
+            self.bloom.add(jti)
+        if self._pending is not None:
+            self._pending.append(jti)
+
+    async def refresh(self) -> int:
+        """Redis 블랙리스트 전체로 Bloom 필터를 새로 만들어 교체, 항목 수 반환
+
+        만료된 JTI 는 새 필터에서 빠지므로 거짓 양성 비율이 다시 낮아집니다.
+        """
+        client = redis_manager.client("token_blacklist")
+        self._pending = []
+        try:
+            jtis = [
+                key.decode() if isinstance(key, bytes) else key
+                async for key in client.scan_iter(match="*", count=1000)
+            ]
+            bloom = BloomFilter(max(self.capacity, len(jtis) * 2), self.error_rate)
+            for jti in (*jtis, *self._pending):
+                bloom.add(jti)
+            self.bloom = bloom
+        finally:
+            self._pending = None
+        return len(jtis)
+
+    async def _sync_loop(self) -> None:
+        while True:
+            try:
+                count = await self.refresh()
+                logger.debug("token blacklist synced: %d", count)
+            except (RedisError, OSError):
+                logger.warning("token blacklist sync failed", exc_info=True)
+            await asyncio.sleep(self.sync_interval)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                pubsub = redis_manager.client("token_blacklist").pubsub()
+                async with pubsub:
+                    await pubsub.subscribe(BLACKLIST_CHANNEL)
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+                        data = message["data"]
+                        if isinstance(data, bytes):
+                            data = data.decode()
+                        for jti in data.split("\n"):
+                            self.add(jti)
+            except (RedisError, OSError):
+                logger.warning("token blacklist subscription lost, retrying")
+                await asyncio.sleep(self.sync_interval / 10)
+
+    def start(self) -> None:
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._sync_loop(), name="blacklist-sync"),
+                asyncio.create_task(self._listen(), name="blacklist-listen"),
+            ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+
+class Authenticator:
+    def __init__(
+        self,
+        cache: TokenCache,
+        blacklist: BlacklistFilter,
+        secret: str = security_settings.JWT_SECRET,
+        algorithm: str = security_settings.JWT_ALGORITHM,
+    ):
+        self.cache = cache
+        self.blacklist = blacklist
+        self.secret = secret
+        self.algorithm = algorithm
+
+    async def authenticate(self, token: str) -> CurrentUser:
+        user = self.cache.get(token)
+        if user is None:
+            user = CurrentUser.from_claims(
+                decode_token(token, self.secret, self.algorithm)
+            )
+            self.cache.put(token, user)
+        # 캐시된 토큰도 그 사이 폐기됐을 수 있으므로 매번 확인 (보통 로컬 조회로 끝남)
+        if user.jti is not None and await self.blacklist.contains(user.jti):
+            raise InvalidToken("token revoked")
+        return user
+
+
+token_blacklist = BlacklistFilter(
+    capacity=security_settings.AUTH_BLACKLIST_CAPACITY,
+    error_rate=security_settings.AUTH_BLACKLIST_ERROR_RATE,
+    sync_interval=security_settings.AUTH_BLACKLIST_SYNC_INTERVAL,
+)
+authenticator = Authenticator(
+    TokenCache(
+        security_settings.AUTH_TOKEN_CACHE_SIZE,
+        security_settings.AUTH_TOKEN_CACHE_TTL,
+    ),
+    token_blacklist,
+)
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+) -> CurrentUser:
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    try:
+        return await authenticator.authenticate(credentials.credentials)
+    except InvalidToken as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=str(e),
+            headers={"WWW-Authenticate": 'Bearer error="invalid_token"'},
+        ) from None
+
+
+async def get_current_active_user(
+    user: CurrentUser = Depends(get_current_user),
+) -> CurrentUser:
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user"
+        )
+    return user
@@ -0,0 +1,17 @@
+from typing import AsyncGenerator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.session import get_read_session, get_session
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """요청 단위 DB 세션 의존성 (app.database.session.get_session 위임)"""
+    async for session in get_session():
+        yield session
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """읽기 전용 DB 세션 의존성 (복제본 라우팅)"""
+    async for session in get_read_session():
+        yield session
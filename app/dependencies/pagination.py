@@ -0,0 +1,173 @@
+"""
+커서(keyset) 기반 페이지네이션
+
+OFFSET/LIMIT 은 페이지가 뒤로 갈수록 건너뛸 행을 모두 읽어야 하므로 느려집니다.
+여기서는 `(created_at, id)` 를 담은 불투명(opaque) 커서 토큰을 사용해
+인덱스 범위 탐색(seek)만으로 다음/이전 페이지를 가져옵니다.
+
+사용 예:
+
+    @router.get("/results")
+    async def results(
+        params: PaginationParams = Depends(get_pagination_params),
+        session: AsyncSession = Depends(get_session),
+    ):
+        page = await paginate(session, SongResultsAll, params)
+        return {"items": page.items, "next": page.next_cursor, "prev": page.prev_cursor}
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Generic, Literal, TypeVar
+
+from fastapi import HTTPException, Query, status
+from sqlalchemy import Select, and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+Direction = Literal["next", "prev"]
+
+T = TypeVar("T")
+
+
+class InvalidCursor(ValueError):
+    """커서 토큰을 해석할 수 없음"""
+
+
+@dataclass(frozen=True, slots=True)
+class Cursor:
+    """페이지 경계 행의 정렬 키 `(created_at, id)` 와 이동 방향"""
+
+    created_at: datetime
+    id: int
+    direction: Direction = "next"
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    """커서를 URL-safe base64 토큰으로 인코딩 (패딩 제거)"""
+    payload = json.dumps(
+        [cursor.created_at.isoformat(), cursor.id, cursor.direction[0]],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).rstrip(b"=").decode()
+
+
+def decode_cursor(token: str) -> Cursor:
+    """토큰을 커서로 디코딩, 형식이 잘못되면 InvalidCursor"""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        created_at, id_, direction = json.loads(base64.urlsafe_b64decode(padded))
+        return Cursor(
+            created_at=datetime.fromisoformat(created_at),
+            id=int(id_),
+            direction={"n": "next", "p": "prev"}[direction],
+        )
+    except (binascii.Error, UnicodeDecodeError, TypeError, KeyError, ValueError) as e:
+        raise InvalidCursor(f"invalid cursor: {token!r}") from e
+
+
+@dataclass(frozen=True, slots=True)
+class PaginationParams:
+    cursor: Cursor | None = None
+    limit: int = DEFAULT_PAGE_SIZE
+
+
+@dataclass(slots=True)
+class Page(Generic[T]):
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+    limit: int = DEFAULT_PAGE_SIZE
+
+
+def get_pagination_params(
+    cursor: str | None = Query(
+        default=None, description="이전 응답의 next/prev 커서 토큰"
+    ),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+) -> PaginationParams:
+    """FastAPI 의존성: 쿼리 파라미터에서 커서/페이지 크기 파싱"""
+    if cursor is None:
+        return PaginationParams(limit=limit)
+
+    try:
+        return PaginationParams(cursor=decode_cursor(cursor), limit=limit)
+    except InvalidCursor as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+
+
+def seek_predicate(model: Any, cursor: Cursor, *, greater: bool):
+    """`(created_at, id)` 가 커서보다 크거나(greater) 작은 행을 고르는 조건
+
+    `(a, b) > (x, y)` 를 그대로 쓰면 MySQL 이 인덱스 범위 탐색을 못 하는 경우가 있어
+    선두 컬럼 범위 조건(`created_at >= x`)을 먼저 두고 나머지를 필터로 붙입니다.
+    """
+    created_at, pk = model.created_at, model.id
+    if greater:
+        return and_(
+            created_at >= cursor.created_at,
+            or_(created_at > cursor.created_at, pk > cursor.id),
+        )
+    return and_(
+        created_at <= cursor.created_at,
+        or_(created_at < cursor.created_at, pk < cursor.id),
+    )
+
+
+def _cursor_for(row: Any, direction: Direction) -> str:
+    return encode_cursor(Cursor(row.created_at, row.id, direction))
+
+
+async def paginate(
+    session: AsyncSession,
+    model: Any,
+    params: PaginationParams,
+    *,
+    stmt: Select | None = None,
+    descending: bool = True,
+) -> Page:
+    """`(created_at, id)` 순서로 한 페이지를 조회
+
+    - model: `created_at`, `id` 컬럼을 가진 매핑 클래스 (app/lyrics/models.py 의 모델들)
+    - stmt: 추가 필터가 걸린 `select(model)` (생략 시 전체)
+    - descending: True 면 최신순
+    """
+    stmt = select(model) if stmt is None else stmt
+    cursor = params.cursor
+    forward = cursor is None or cursor.direction == "next"
+
+    # 최신순으로 앞으로 가면 더 작은 키, 뒤로 가면 더 큰 키를 찾는다
+    greater = forward != descending
+    if cursor is not None:
+        stmt = stmt.where(seek_predicate(model, cursor, greater=greater))
+
+    if greater:
+        stmt = stmt.order_by(model.created_at.asc(), model.id.asc())
+    else:
+        stmt = stmt.order_by(model.created_at.desc(), model.id.desc())
+
+    # 한 행 더 읽어서 다음 페이지 존재 여부 판단
+    rows = list((await session.scalars(stmt.limit(params.limit + 1))).all())
+    has_more = len(rows) > params.limit
+    rows = rows[: params.limit]
+    if not forward:
+        rows.reverse()
+
+    page = Page(items=rows, limit=params.limit)
+    if not rows:
+        return page
+
+    if forward:
+        page.next_cursor = _cursor_for(rows[-1], "next") if has_more else None
+        page.prev_cursor = _cursor_for(rows[0], "prev") if cursor else None
+    else:
+        page.next_cursor = _cursor_for(rows[-1], "next")
+        page.prev_cursor = _cursor_for(rows[0], "prev") if has_more else None
+    return page
@@ -0,0 +1,285 @@
+"""
+권한 검사 의존성
+
+역할 -> 권한 정책(PERMISSION_POLICY)을 시작 시 비트마스크 표로 컴파일합니다.
+권한 이름마다 비트 하나를 배정하고, 역할은 권한 비트의 OR 로 저장합니다.
+
+    policy  {"editor": ["lyrics:read", "lyrics:write"], "viewer": ["lyrics:read"]}
+    bits    lyrics:read=0b01, lyrics:write=0b10
+    roles   editor=0b11, viewer=0b01
+
+요청마다 하는 일은 사용자 유효 권한(역할 마스크의 OR)을 캐시에서 꺼내
+`granted & required == required` 를 계산하는 것뿐입니다. groups 테이블 조회는
+캐시 미스일 때만 일어나며, 그룹 구성원이 바뀌면 invalidate_user_permissions() 로
+모든 워커의 캐시에서 해당 사용자를 지웁니다. 토큰 클레임의 역할은 토큰마다 다를 수
+있으므로 캐시하지 않고 요청마다 역할 마스크를 OR 합니다.
+
+    @router.post("/lyrics", dependencies=[Depends(require_permissions("lyrics:write"))])
+    async def create_lyrics(...): ...
+
+정책에 없는 권한 이름은 라우트를 정의할 때 ValueError 로 드러납니다.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from dataclasses import dataclass
+
+from fastapi import Depends, HTTPException, status
+from redis.exceptions import RedisError
+from sqlalchemy import column, select, table
+
+from app.database.redis import (
+    PERMISSION_CHANNEL,
+    publish_permission_invalidation,
+    redis_manager,
+)
+from app.database.session import AsyncSessionLocal
+from app.dependencies.auth import CurrentUser, get_current_active_user
+from config import permission_settings
+
+logger = logging.getLogger(__name__)
+
+RoleLoader = Callable[[CurrentUser], Awaitable[Iterable[str]]]
+
+
+class PolicyTable:
+    """역할 -> 권한 비트마스크 표 (생성 후 읽기 전용)
+
+    권한 목록의 "*" 는 전체 권한, "lyrics:*" 는 lyrics: 로 시작하는 모든 권한입니다.
+    """
+
+    def __init__(self, policy: Mapping[str, Iterable[str]]):
+        policy = {role: tuple(perms) for role, perms in policy.items()}
+        names = sorted(
+            {p for perms in policy.values() for p in perms if not p.endswith("*")}
+        )
+        self.bits: dict[str, int] = {name: 1 << i for i, name in enumerate(names)}
+        self.role_masks: dict[str, int] = {
+            role: self.mask(perms) for role, perms in policy.items()
+        }
+
+    def mask(self, permissions: Iterable[str]) -> int:
+        mask = 0
+        for permission in permissions:
+            if permission.endswith("*"):
+                prefix = permission[:-1]
+                for name, bit in self.bits.items():
+                    if name.startswith(prefix):
+                        mask |= bit
+                continue
+            bit = self.bits.get(permission)
+            if bit is None:
+                raise ValueError(f"unknown permission: {permission!r}")
+            mask |= bit
+        return mask
+
+    def effective(self, roles: Iterable[str]) -> int:
+        """역할들의 권한 합집합 (정책에 없는 역할은 권한 없음)"""
+        mask = 0
+        for role in roles:
+            mask |= self.role_masks.get(role, 0)
+        return mask
+
+    def names(self, mask: int) -> frozenset[str]:
+        return frozenset(name for name, bit in self.bits.items() if mask & bit)
+
+
+@dataclass(frozen=True, slots=True)
+class Permissions:
+    """사용자 유효 권한 (핸들러 안에서 조건부로 검사할 때)"""
+
+    mask: int
+    table: PolicyTable
+
+    def __contains__(self, permission: str) -> bool:
+        bit = self.table.bits.get(permission, 0)
+        return bit != 0 and self.mask & bit == bit
+
+    def names(self) -> frozenset[str]:
+        return self.table.names(self.mask)
+
+
+class PermissionCache:
+    """사용자 ID -> (권한 마스크, 만료 시각) TTL LRU
+
+    무효화가 일어날 때마다 generation 이 바뀌므로, 무효화 이전에 시작한 역할
+    조회 결과는 put() 에서 버려집니다 (지운 직후 오래된 값이 다시 들어가지 않음).
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.generation = 0
+        self._entries: OrderedDict[str, tuple[int, float]] = OrderedDict()
+
+    def get(self, user_id: str) -> int | None:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        mask, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[user_id]
+            return None
+        self._entries.move_to_end(user_id)
+        return mask
+
+    def put(self, user_id: str, mask: int, generation: int) -> None:
+        if generation != self.generation:
+            return
+        self._entries[user_id] = (mask, time.monotonic() + self.ttl)
+        self._entries.move_to_end(user_id)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_ids: Iterable[str]) -> None:
+        self.generation += 1
+        for user_id in user_ids:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+async def roles_from_claims(user: CurrentUser) -> Iterable[str]:
+    """토큰 roles 클레임 (리스트 또는 공백 구분 문자열)"""
+    roles = user.claims.get("roles", ())
+    return roles.split() if isinstance(roles, str) else roles
+
+
+_groups = table("groups", column("id"), column("name"))
+_memberships = table("user_group_association", column("user_id"), column("group_id"))
+
+
+async def roles_from_groups(user: CurrentUser) -> Iterable[str]:
+    """사용자가 속한 그룹 이름 (groups / user_group_association)"""
+    stmt = (
+        select(_groups.c.name)
+        .join(_memberships, _memberships.c.group_id == _groups.c.id)
+        .where(_memberships.c.user_id == int(user.id))
+    )
+    # 구성원 변경 직후 무효화된 값을 복제본 지연으로 다시 읽지 않도록 primary 에서 조회
+    async with AsyncSessionLocal() as session:
+        return (await session.scalars(stmt)).all()
+
+
+class PermissionEvaluator:
+    def __init__(
+        self,
+        table: PolicyTable,
+        loader: RoleLoader = roles_from_claims,
+        cache: PermissionCache | None = None,
+    ):
+        self.table = table
+        self.loader = loader
+        self.cache = cache or PermissionCache()
+        self._task: asyncio.Task | None = None
+
+    async def mask(self, user: CurrentUser) -> int:
+        if self.loader is roles_from_claims:
+            # 같은 사용자라도 토큰마다 역할이 다를 수 있어 user.id 로 캐시하면 안 됨
+            return self.table.effective(await self.loader(user))
+        mask = self.cache.get(user.id)
+        if mask is None:
+            generation = self.cache.generation
+            mask = self.table.effective(await self.loader(user))
+            self.cache.put(user.id, mask, generation)
+        return mask
+
+    async def permissions(self, user: CurrentUser) -> Permissions:
+        return Permissions(await self.mask(user), self.table)
+
+    def invalidate(self, user_ids: Iterable[str]) -> None:
+        user_ids = list(user_ids)
+        if "*" in user_ids:
+            self.cache.clear()
+        else:
+            self.cache.invalidate(user_ids)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                pubsub = redis_manager.client("token_blacklist").pubsub()
+                async with pubsub:
+                    await pubsub.subscribe(PERMISSION_CHANNEL)
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+                        data = message["data"]
+                        if isinstance(data, bytes):
+                            data = data.decode()
+                        self.invalidate(data.split("\n"))
+            except (RedisError, OSError):
+                # 끊긴 동안 놓친 무효화가 있을 수 있으므로 재구독 전에 전체 삭제
+                logger.warning("permission invalidation subscription lost, retrying")
+                await asyncio.sleep(self.cache.ttl / 10)
+                self.cache.clear()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen(), name="permission-listen")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+_LOADERS: dict[str, RoleLoader] = {
+    "claims": roles_from_claims,
+    "groups": roles_from_groups,
+}
+
+policy_table = PolicyTable(permission_settings.PERMISSION_POLICY)
+permission_evaluator = PermissionEvaluator(
+    policy_table,
+    _LOADERS[permission_settings.PERMISSION_ROLE_SOURCE],
+    PermissionCache(
+        permission_settings.PERMISSION_CACHE_SIZE,
+        permission_settings.PERMISSION_CACHE_TTL,
+    ),
+)
+
+
+async def invalidate_user_permissions(*user_ids: str | int) -> None:
+    """그룹 구성원/역할 변경 후 호출 (인자가 없으면 전체 무효화)"""
+    ids = [str(user_id) for user_id in user_ids] or ["*"]
+    permission_evaluator.invalidate(ids)
+    try:
+        await publish_permission_invalidation(ids)
+    except (RedisError, OSError):
+        logger.warning("permission invalidation not published, other workers wait TTL")
+
+
+async def get_permissions(
+    user: CurrentUser = Depends(get_current_active_user),
+) -> Permissions:
+    return await permission_evaluator.permissions(user)
+
+
+def require_permissions(*permissions: str, any_of: bool = False):
+    """권한을 모두(any_of=True 면 하나 이상) 가진 사용자만 허용하는 의존성"""
+    required = policy_table.mask(permissions)
+    if not required:
+        # 인자가 없거나 와일드카드가 아무 권한과도 맞지 않으면 모두 허용(any_of 면 거부)
+        raise ValueError(f"permissions match nothing in the policy: {permissions!r}")
+
+    async def dependency(
+        user: CurrentUser = Depends(get_current_active_user),
+    ) -> CurrentUser:
+        granted = await permission_evaluator.mask(user)
+        allowed = granted & required if any_of else granted & required == required
+        if not allowed:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, detail="Permission denied"
+            )
+        return user
+
+    return dependency
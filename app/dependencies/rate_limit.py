@@ -0,0 +1,315 @@
+"""
+요청 속도 제한 (rate limit)
+
+알고리즘
+- sliding_window: 최근 window 초 동안의 요청 시각 로그로 정확히 limit 회까지 허용
+- token_bucket: 용량 limit, 초당 limit/window 개씩 채워지는 버킷 (순간 폭주 허용)
+
+백엔드
+- MemoryBackend: 워커 프로세스 메모리, await 없이 계산하므로 잠금 불필요
+- RedisBackend: 워커 간 공유, Lua 스크립트로 검사+기록을 1회 왕복에 원자적으로 처리
+
+사용 예 (라우트별 / API 키별):
+
+    @router.post("/generate", dependencies=[Depends(rate_limit("10/minute"))])
+    async def generate(...): ...
+
+    search_limit = rate_limit("100/minute", key=by_api_key)
+
+    @router.get("/search", dependencies=[Depends(search_limit)])
+    async def search(...): ...
+
+허용된 응답에는 X-RateLimit-Limit/Remaining/Reset 을 붙이고, 초과하면 429 와
+Retry-After 를 돌려줍니다. (엔드포인트가 Response 를 직접 반환하면 허용 응답의
+헤더는 붙지 않습니다.)
+"""
+
+import hashlib
+import logging
+import math
+import re
+import time
+import uuid
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Literal, Protocol
+
+from fastapi import HTTPException, Request, Response, status
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.context import route_template
+from app.database.redis import redis_manager
+from config import rate_limit_settings
+
+logger = logging.getLogger(__name__)
+
+Algorithm = Literal["sliding_window", "token_bucket"]
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+_LIMIT_PATTERN = re.compile(r"(\d+)\s*/\s*(\d*)\s*(second|minute|hour|day)s?")
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimit:
+    limit: int
+    window: float  # 초
+    algorithm: Algorithm = "sliding_window"
+
+    @classmethod
+    def parse(cls, value: str, algorithm: Algorithm = "sliding_window") -> "RateLimit":
+        """ "10/minute", "5/30seconds" 같은 표기 해석"""
+        match = _LIMIT_PATTERN.fullmatch(value.strip())
+        if match is None:
+            raise ValueError(f"invalid rate limit: {value!r}")
+        count, amount, unit = match.groups()
+        return cls(int(count), float(amount or 1) * _PERIODS[unit], algorithm)
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitResult:
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after: float  # 다음 자리가 비기까지 (초)
+    retry_after: float  # 거절 시 다시 시도할 수 있기까지 (초), 허용이면 0
+
+    def headers(self) -> dict[str, str]:
+        headers = {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(self.remaining),
+            "X-RateLimit-Reset": str(math.ceil(self.reset_after)),
+        }
+        if not self.allowed:
+            headers["Retry-After"] = str(max(1, math.ceil(self.retry_after)))
+        return headers
+
+
+class RateLimitBackend(Protocol):
+    async def hit(self, key: str, rule: RateLimit) -> RateLimitResult: ...
+
+
+class MemoryBackend:
+    """프로세스 메모리 백엔드 (워커마다 따로 셈)
+
+    키가 max_keys 를 넘으면 가장 오래 사용하지 않은 키부터 버립니다.
+    """
+
+    def __init__(
+        self, max_keys: int = 100_000, clock: Callable[[], float] | None = None
+    ):
+        self.max_keys = max_keys
+        self.clock = clock or time.monotonic
+        self._state: OrderedDict[str, deque[float] | list[float]] = OrderedDict()
+
+    async def hit(self, key: str, rule: RateLimit) -> RateLimitResult:
+        return self.check(key, rule)
+
+    def check(self, key: str, rule: RateLimit) -> RateLimitResult:
+        # await 가 없으므로 이벤트 루프 안에서 원자적으로 실행됨
+        now = self.clock()
+        state = self._state.get(key)
+        if state is None:
+            if len(self._state) >= self.max_keys:
+                self._state.popitem(last=False)
+        else:
+            self._state.move_to_end(key)
+        if rule.algorithm == "token_bucket":
+            return self._token_bucket(key, rule, now, state)
+        return self._sliding_window(key, rule, now, state)
+
+    def _sliding_window(self, key, rule, now, log) -> RateLimitResult:
+        if log is None:
+            log = self._state[key] = deque()
+        expired = now - rule.window
+        while log and log[0] <= expired:
+            log.popleft()
+
+        allowed = len(log) < rule.limit
+        if allowed:
+            log.append(now)
+        reset_after = log[0] + rule.window - now if log else 0.0
+        return RateLimitResult(
+            allowed=allowed,
+            limit=rule.limit,
+            remaining=rule.limit - len(log),
+            reset_after=reset_after,
+            retry_after=0.0 if allowed else reset_after,
+        )
+
+    def _token_bucket(self, key, rule, now, bucket) -> RateLimitResult:
+        rate = rule.limit / rule.window
+        if bucket is None:
+            bucket = self._state[key] = [float(rule.limit), now]
+        tokens = min(rule.limit, bucket[0] + (now - bucket[1]) * rate)
+
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        bucket[0], bucket[1] = tokens, now
+        return RateLimitResult(
+            allowed=allowed,
+            limit=rule.limit,
+            remaining=int(tokens),
+            reset_after=(rule.limit - tokens) / rate,
+            retry_after=0.0 if allowed else (1 - tokens) / rate,
+        )
+
+
+# KEYS[1]: 키, ARGV: limit, window(ms), 고유 멤버
+# 반환: {허용 여부, 남은 횟수, reset(ms)}
+SLIDING_WINDOW_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+local count = redis.call('ZCARD', KEYS[1])
+local allowed = 0
+if count < limit then
+    redis.call('ZADD', KEYS[1], now, ARGV[3])
+    count = count + 1
+    allowed = 1
+end
+redis.call('PEXPIRE', KEYS[1], window)
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+local reset = 0
+if oldest[2] then
+    reset = tonumber(oldest[2]) + window - now
+end
+return {allowed, limit - count, reset}
+"""
+
+# KEYS[1]: 키, ARGV: limit, window(ms)
+# 토큰은 소수점이 생기므로 1000배 정수로 저장
+TOKEN_BUCKET_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local capacity = tonumber(ARGV[1]) * 1000
+local window = tonumber(ARGV[2])
+local rate = capacity / window
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= 1000 then
+    tokens = tokens - 1000
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], window)
+local retry = 0
+if allowed == 0 then
+    retry = math.ceil((1000 - tokens) / rate)
+end
+local reset = math.ceil((capacity - tokens) / rate)
+return {allowed, math.floor(tokens / 1000), reset, retry}
+"""
+
+
+class RedisBackend:
+    """Redis 백엔드 (워커 간 공유), 검사마다 EVALSHA 1회"""
+
+    def __init__(self, client: Redis):
+        self.client = client
+        self._sliding_window = client.register_script(SLIDING_WINDOW_LUA)
+        self._token_bucket = client.register_script(TOKEN_BUCKET_LUA)
+
+    async def hit(self, key: str, rule: RateLimit) -> RateLimitResult:
+        window_ms = max(1, int(rule.window * 1000))
+        if rule.algorithm == "token_bucket":
+            allowed, remaining, reset, retry = await self._token_bucket(
+                keys=[key], args=[rule.limit, window_ms]
+            )
+        else:
+            allowed, remaining, reset = await self._sliding_window(
+                keys=[key], args=[rule.limit, window_ms, uuid.uuid4().hex]
+            )
+            retry = 0 if allowed else reset
+        return RateLimitResult(
+            allowed=bool(allowed),
+            limit=rule.limit,
+            remaining=int(remaining),
+            reset_after=int(reset) / 1000,
+            retry_after=int(retry) / 1000,
+        )
+
+
+class RateLimiter:
+    def __init__(self, backend: RateLimitBackend, prefix: str = "rl"):
+        self.backend = backend
+        self.prefix = prefix
+
+    async def hit(self, key: str, rule: RateLimit) -> RateLimitResult:
+        key = f"{self.prefix}:{rule.algorithm[0]}:{key}"
+        try:
+            return await self.backend.hit(key, rule)
+        except (RedisError, OSError):
+            # 제한 저장소 장애로 서비스 전체를 막지 않도록 허용 (fail-open)
+            logger.warning("rate limit backend unavailable, allowing %s", key)
+            return RateLimitResult(True, rule.limit, rule.limit, 0.0, 0.0)
+
+
+def _create_limiter() -> RateLimiter:
+    if rate_limit_settings.RATE_LIMIT_BACKEND == "redis":
+        return RateLimiter(RedisBackend(redis_manager.client("rate_limit")))
+    return RateLimiter(MemoryBackend(rate_limit_settings.RATE_LIMIT_MEMORY_MAX_KEYS))
+
+
+rate_limiter = _create_limiter()
+
+
+def by_client(request: Request) -> str:
+    """클라이언트 IP 기준"""
+    return request.client.host if request.client else "unknown"
+
+
+def by_api_key(request: Request) -> str:
+    """등록된 API 키 기준 (키가 없거나 RATE_LIMIT_API_KEYS 에 없으면 IP 기준)
+
+    임의의 키를 바꿔 가며 보내 제한을 피하지 못하도록 등록된 키만 따로 세고,
+    카운터 이름에는 키 원문 대신 SHA-256 을 씁니다.
+    """
+    api_key = request.headers.get(rate_limit_settings.RATE_LIMIT_API_KEY_HEADER)
+    if api_key:
+        digest = hashlib.sha256(api_key.encode()).hexdigest()
+        if digest in rate_limit_settings.RATE_LIMIT_API_KEYS:
+            return f"key:{digest}"
+    return f"ip:{by_client(request)}"
+
+
+def rate_limit(
+    limit: str | RateLimit | None = None,
+    *,
+    key: Callable[[Request], str] = by_client,
+    algorithm: Algorithm = "sliding_window",
+    limiter: RateLimiter | None = None,
+):
+    """라우트에 속도 제한을 거는 의존성 (limit 생략 시 RATE_LIMIT_DEFAULT)
+
+    카운터는 라우트 템플릿 + key(request) 별로 따로 셉니다.
+    """
+    rule = (
+        limit
+        if isinstance(limit, RateLimit)
+        else RateLimit.parse(limit or rate_limit_settings.RATE_LIMIT_DEFAULT, algorithm)
+    )
+
+    async def dependency(request: Request, response: Response) -> RateLimitResult:
+        if not rate_limit_settings.RATE_LIMIT_ENABLED:
+            return RateLimitResult(True, rule.limit, rule.limit, 0.0, 0.0)
+
+        identity = f"{route_template(request.scope)}:{key(request)}"
+        result = await (limiter or rate_limiter).hit(identity, rule)
+        if not result.allowed:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too Many Requests",
+                headers=result.headers(),
+            )
+        response.headers.update(result.headers())
+        return result
+
+    return dependency
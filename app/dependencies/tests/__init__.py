@@ -0,0 +1,5 @@
+"""
+Dependencies Tests 패키지
+
+의존성 모듈 관련 테스트를 제공합니다.
+"""
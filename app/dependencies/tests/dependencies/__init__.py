@@ -0,0 +1,3 @@
+"""
+Dependencies 단위 테스트 패키지
+"""
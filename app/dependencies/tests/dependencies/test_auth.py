@@ -0,0 +1,129 @@
+import time
+
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.database import redis as redis_module
+from app.database.redis import redis_manager
+from app.database.tests.fake_redis import FakeRedis
+from app.dependencies import auth
+from app.dependencies.auth import (
+    Authenticator,
+    BlacklistFilter,
+    CurrentUser,
+    InvalidToken,
+    TokenCache,
+    decode_token,
+    encode_token,
+    get_current_active_user,
+)
+
+SECRET = "test-secret"
+
+
+def _token(**claims) -> str:
+    return encode_token({"sub": "1", "jti": "j-1", **claims}, SECRET, "HS256")
+
+
+@pytest.fixture
+def blacklist_redis():
+    client = FakeRedis()
+    redis_manager.override("token_blacklist", client)
+    yield client
+    redis_manager.clear_overrides()
+
+
+def test_decode_token():
+    claims = decode_token(_token(exp=time.time() + 60), SECRET, "HS256")
+    assert claims["sub"] == "1"
+
+    header, payload, _ = _token().split(".")
+    forged_none = encode_token({"sub": "1"}, SECRET, "HS256").replace(
+        header, "eyJhbGciOiJub25lIn0"
+    )
+    cases = [
+        (_token() + "x", "invalid signature"),
+        ("W10.e30.AAAA", "malformed token"),  # 헤더가 객체가 아님 ("[]")
+        (_token(exp="soon"), "invalid exp claim"),
+        (_token(exp=float("nan")), "invalid exp claim"),
+        (_token(nbf=[1]), "invalid nbf claim"),
+        (encode_token({"sub": "1"}, "other", "HS256"), "invalid signature"),
+        (forged_none, "unexpected algorithm"),
+        (f"{header}.{payload}", "malformed token"),
+        (_token(exp=time.time() - 1), "token expired"),
+        (_token(nbf=time.time() + 60), "token not yet valid"),
+    ]
+    for token, message in cases:
+        with pytest.raises(InvalidToken, match=message):
+            decode_token(token, SECRET, "HS256")
+
+
+def test_from_claims_rejects_non_string_jti():
+    # 폐기 목록(블룸 필터) 조회 전에 401 로 거절
+    with pytest.raises(InvalidToken, match="invalid jti claim"):
+        CurrentUser.from_claims({"sub": "1", "jti": 123})
+    assert CurrentUser.from_claims({"sub": "1", "jti": "abc"}).jti == "abc"
+
+
+def test_token_cache_ttl_and_lru():
+    cache = TokenCache(maxsize=2, ttl=60)
+    user = CurrentUser.from_claims({"sub": "1", "exp": time.time() - 1})
+    cache.put("expired", user)
+    assert cache.get("expired") is None  # exp 를 넘겨 캐시하지 않음
+
+    for token in ("a", "b", "c"):
+        cache.put(token, CurrentUser.from_claims({"sub": token}))
+    assert cache.get("a") is None
+    assert cache.get("c").id == "c"
+    assert len(cache) == 2
+
+
+async def test_blacklist_bloom_skips_redis(blacklist_redis):
+    await redis_module.add_jtis_to_blacklist(["revoked-1", "revoked-2"])
+    blacklist = BlacklistFilter(capacity=1000)
+
+    # 첫 동기화 전에는 Redis 로 확인
+    assert not await blacklist.contains("fresh")
+    assert blacklist.redis_checks == 1
+
+    assert await blacklist.refresh() == 2
+    assert not await blacklist.contains("fresh")
+    assert await blacklist.contains("revoked-1")
+    assert blacklist.redis_checks == 2  # "fresh" 는 로컬 필터에서 끝남
+    assert blacklist_redis.published == [("jti_blacklist", "revoked-1\nrevoked-2")]
+
+
+async def test_current_user_dependency(blacklist_redis, monkeypatch):
+    blacklist = BlacklistFilter(capacity=1000)
+    await blacklist.refresh()
+    authenticator = Authenticator(TokenCache(), blacklist, SECRET, "HS256")
+    monkeypatch.setattr(auth, "authenticator", authenticator)
+
+    app = FastAPI()
+
+    @app.get("/me")
+    async def me(user: CurrentUser = Depends(get_current_active_user)):
+        return {"id": user.id}
+
+    token = _token(exp=time.time() + 60)
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        ok = await client.get("/me", headers={"Authorization": f"Bearer {token}"})
+        missing = await client.get("/me")
+        inactive = await client.get(
+            "/me", headers={"Authorization": f"Bearer {_token(active=False)}"}
+        )
+        # 캐시된 토큰이라도 폐기 알림을 받으면 거절
+        await redis_module.add_jti_to_blacklist("j-1")
+        blacklist.add("j-1")
+        revoked = await client.get("/me", headers={"Authorization": f"Bearer {token}"})
+
+    assert ok.json() == {"id": "1"}
+    assert missing.status_code == 401
+    assert missing.headers["www-authenticate"] == "Bearer"
+    assert inactive.status_code == 403
+    assert revoked.status_code == 401
+    assert revoked.json()["detail"] == "token revoked"
+    assert len(authenticator.cache) == 2
@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import insert
+
+from app.dependencies.pagination import (
+    Cursor,
+    InvalidCursor,
+    PaginationParams,
+    decode_cursor,
+    encode_cursor,
+    get_pagination_params,
+    paginate,
+)
+from app.lyrics.models import PromptTemplate
+
+
+def test_cursor_round_trip():
+    cursor = Cursor(datetime(2025, 1, 2, 3, 4, 5), 42, "prev")
+    token = encode_cursor(cursor)
+
+    assert "=" not in token
+    assert decode_cursor(token) == cursor
+
+
+@pytest.mark.parametrize("token", ["", "not-base64!", "WzEsMl0"])
+def test_invalid_cursor(token):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(token)
+
+    with pytest.raises(HTTPException) as exc_info:
+        get_pagination_params(cursor=token, limit=10)
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_paginate_walks_forward_and_back(db_session):
+    # 같은 created_at 을 가진 행이 섞여 있어도 id 로 순서가 결정되어야 함
+    base = datetime(2025, 1, 1)
+    await db_session.execute(
+        insert(PromptTemplate),
+        [
+            {
+                "id": i + 1,
+                "prompt": f"p{i}",
+                "created_at": base + timedelta(minutes=i // 3),
+            }
+            for i in range(10)
+        ],
+    )
+
+    seen = []
+    params = PaginationParams(limit=4)
+    pages = []
+    while True:
+        page = await paginate(db_session, PromptTemplate, params)
+        pages.append(page)
+        seen.extend(row.id for row in page.items)
+        if page.next_cursor is None:
+            break
+        params = PaginationParams(decode_cursor(page.next_cursor), limit=4)
+
+    assert seen == list(range(10, 0, -1))
+    assert [len(p.items) for p in pages] == [4, 4, 2]
+    assert pages[0].prev_cursor is None
+
+    prev = await paginate(
+        db_session,
+        PromptTemplate,
+        PaginationParams(decode_cursor(pages[2].prev_cursor), limit=4),
+    )
+    assert [row.id for row in prev.items] == [row.id for row in pages[1].items]
+    assert prev.next_cursor is not None
+    assert prev.prev_cursor is not None
@@ -0,0 +1,146 @@
+import asyncio
+
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.database.redis import redis_manager
+from app.database.tests.fake_redis import FakeRedis
+from app.dependencies import permissions
+from app.dependencies.auth import CurrentUser, get_current_active_user
+from app.dependencies.permissions import (
+    PermissionCache,
+    PermissionEvaluator,
+    PolicyTable,
+    invalidate_user_permissions,
+    require_permissions,
+)
+
+POLICY = {
+    "admin": ["*"],
+    "editor": ["lyrics:read", "lyrics:write"],
+    "viewer": ["lyrics:read"],
+    "moderator": ["lyrics:*", "users:ban"],
+}
+
+
+def _user(user_id="1", roles=()) -> CurrentUser:
+    return CurrentUser.from_claims({"sub": user_id, "roles": list(roles)})
+
+
+def test_policy_table_compiles_masks():
+    table = PolicyTable(POLICY)
+    read, write, ban = (
+        table.bits[p] for p in ("lyrics:read", "lyrics:write", "users:ban")
+    )
+
+    assert table.role_masks["viewer"] == read
+    assert table.role_masks["moderator"] == read | write | ban
+    assert table.role_masks["admin"] == read | write | ban
+    assert table.effective(["viewer", "unknown"]) == read
+    assert table.names(table.effective(["editor"])) == {"lyrics:read", "lyrics:write"}
+    with pytest.raises(ValueError, match="unknown permission"):
+        table.mask(["lyrics:delete"])
+
+
+def test_require_permissions_rejects_empty_mask():
+    with pytest.raises(ValueError, match="match nothing"):
+        require_permissions()
+    with pytest.raises(ValueError, match="match nothing"):
+        require_permissions("billing:*")
+
+
+async def test_evaluator_caches_until_invalidated():
+    roles = {"1": ["viewer"]}
+    calls = []
+
+    async def loader(user):
+        calls.append(user.id)
+        return roles[user.id]
+
+    table = PolicyTable(POLICY)
+    evaluator = PermissionEvaluator(table, loader, PermissionCache(ttl=60))
+    user = _user()
+
+    assert "lyrics:write" not in await evaluator.permissions(user)
+    assert "lyrics:read" in await evaluator.permissions(user)
+    assert calls == ["1"]
+
+    roles["1"] = ["editor"]
+    evaluator.invalidate(["1"])
+    assert "lyrics:write" in await evaluator.permissions(user)
+    assert calls == ["1", "1"]
+
+
+async def test_invalidation_during_load_is_not_overwritten():
+    release = asyncio.Event()
+
+    async def slow_loader(user):
+        await release.wait()
+        return ["editor"]
+
+    evaluator = PermissionEvaluator(PolicyTable(POLICY), slow_loader)
+    pending = asyncio.create_task(evaluator.mask(_user()))
+    await asyncio.sleep(0)
+    evaluator.invalidate(["1"])
+    release.set()
+    await pending
+
+    assert len(evaluator.cache) == 0
+
+
+async def test_claims_roles_are_not_cached_per_user():
+    evaluator = PermissionEvaluator(PolicyTable(POLICY))
+
+    # 같은 사용자의 admin 토큰 다음에 온 viewer 토큰은 viewer 권한만
+    assert "lyrics:write" in await evaluator.permissions(_user(roles=["admin"]))
+    assert "lyrics:write" not in await evaluator.permissions(_user(roles=["viewer"]))
+    assert len(evaluator.cache) == 0
+
+
+async def test_require_permissions_dependency(monkeypatch):
+    client = FakeRedis()
+    redis_manager.override("token_blacklist", client)
+    roles = {"1": ["viewer"]}
+
+    async def loader(user):
+        return roles[user.id]
+
+    evaluator = PermissionEvaluator(PolicyTable(POLICY), loader)
+    monkeypatch.setattr(permissions, "permission_evaluator", evaluator)
+    monkeypatch.setattr(permissions, "policy_table", evaluator.table)
+
+    app = FastAPI()
+    app.dependency_overrides[get_current_active_user] = lambda: _user()
+
+    @app.post("/lyrics", dependencies=[Depends(require_permissions("lyrics:write"))])
+    async def create():
+        return {"ok": True}
+
+    @app.get(
+        "/moderate",
+        dependencies=[
+            Depends(require_permissions("users:ban", "lyrics:write", any_of=True))
+        ],
+    )
+    async def moderate():
+        return {"ok": True}
+
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as http:
+            denied = await http.post("/lyrics")
+            roles["1"] = ["editor", "moderator"]
+            cached = await http.post("/lyrics")  # 무효화 전까지는 캐시된 viewer 권한
+            await invalidate_user_permissions(1)
+            allowed = await http.post("/lyrics")
+            any_of = await http.get("/moderate")
+    finally:
+        redis_manager.clear_overrides()
+
+    assert denied.status_code == 403
+    assert cached.status_code == 403
+    assert allowed.status_code == 200
+    assert any_of.status_code == 200
+    assert client.published == [("permission_invalidate", "1")]
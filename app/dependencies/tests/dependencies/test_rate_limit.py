@@ -0,0 +1,146 @@
+import hashlib
+
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.dependencies.rate_limit import (
+    MemoryBackend,
+    RateLimit,
+    RateLimiter,
+    RedisBackend,
+    by_api_key,
+    rate_limit,
+)
+from config import db_settings, rate_limit_settings
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("10/minute", RateLimit(10, 60)),
+        ("5/30seconds", RateLimit(5, 30)),
+        ("100 / hour", RateLimit(100, 3600)),
+    ],
+)
+def test_parse(value, expected):
+    assert RateLimit.parse(value) == expected
+    with pytest.raises(ValueError):
+        RateLimit.parse("10 per minute")
+
+
+def test_sliding_window_log():
+    clock = Clock()
+    backend = MemoryBackend(clock=clock)
+    rule = RateLimit(3, 10)
+
+    results = []
+    for offset in (0, 1, 2, 3):
+        clock.now = 1000 + offset
+        results.append(backend.check("k", rule))
+    assert [r.allowed for r in results] == [True, True, True, False]
+    assert [r.remaining for r in results] == [2, 1, 0, 0]
+    assert results[-1].retry_after == pytest.approx(7)
+
+    # 첫 요청이 창 밖으로 나가면 한 자리만 비어야 함 (고정 창과 다름)
+    clock.now = 1010
+    assert backend.check("k", rule).allowed
+    assert not backend.check("k", rule).allowed
+
+
+def test_token_bucket_refill_and_key_eviction():
+    clock = Clock()
+    backend = MemoryBackend(max_keys=2, clock=clock)
+    rule = RateLimit(2, 10, "token_bucket")  # 5초에 1개씩 채워짐
+
+    assert backend.check("a", rule).allowed
+    assert backend.check("a", rule).allowed
+    denied = backend.check("a", rule)
+    assert not denied.allowed
+    assert denied.retry_after == pytest.approx(5)
+
+    clock.now += 5
+    assert backend.check("a", rule).allowed
+
+    backend.check("b", rule)
+    backend.check("c", rule)  # 가장 오래 쓰지 않은 a 를 버림
+    assert set(backend._state) == {"b", "c"}
+
+
+async def test_dependency_headers_and_keys(monkeypatch):
+    keys = {hashlib.sha256(key).hexdigest() for key in (b"a", b"b")}
+    monkeypatch.setattr(rate_limit_settings, "RATE_LIMIT_API_KEYS", keys)
+    limiter = RateLimiter(MemoryBackend())
+    app = FastAPI()
+
+    @app.get(
+        "/items/{item_id}",
+        dependencies=[Depends(rate_limit("2/minute", limiter=limiter))],
+    )
+    async def item(item_id: int):
+        return {}
+
+    @app.get(
+        "/search",
+        dependencies=[Depends(rate_limit("1/minute", key=by_api_key, limiter=limiter))],
+    )
+    async def search():
+        return {}
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        first = await client.get("/items/1")
+        # 라우트 템플릿 기준이라 다른 id 도 같은 카운터
+        second = await client.get("/items/2")
+        blocked = await client.get("/items/3")
+        key_a = await client.get("/search", headers={"x-api-key": "a"})
+        key_b = await client.get("/search", headers={"x-api-key": "b"})
+        key_a_again = await client.get("/search", headers={"x-api-key": "a"})
+        # 등록되지 않은 키는 바꿔 보내도 같은 IP 카운터
+        unknown = await client.get("/search", headers={"x-api-key": "c"})
+        unknown_again = await client.get("/search", headers={"x-api-key": "d"})
+
+    assert first.headers["x-ratelimit-limit"] == "2"
+    assert first.headers["x-ratelimit-remaining"] == "1"
+    assert second.headers["x-ratelimit-remaining"] == "0"
+    assert blocked.status_code == 429
+    assert int(blocked.headers["retry-after"]) >= 59
+    assert [r.status_code for r in (key_a, key_b, key_a_again)] == [200, 200, 429]
+    assert [r.status_code for r in (unknown, unknown_again)] == [200, 429]
+
+
+@pytest.fixture
+async def redis_client():
+    # 실제 Redis 가 있을 때만 Lua 스크립트 검증
+    client = Redis.from_url(db_settings.REDIS_URL(15), socket_connect_timeout=0.2)
+    try:
+        await client.ping()
+    except (RedisError, OSError):
+        await client.aclose()
+        pytest.skip("redis is not reachable")
+    await client.flushdb()
+    yield client
+    await client.flushdb()
+    await client.aclose()
+
+
+@pytest.mark.parametrize("algorithm", ["sliding_window", "token_bucket"])
+async def test_redis_backend(redis_client, algorithm):
+    backend = RedisBackend(redis_client)
+    rule = RateLimit(3, 60, algorithm)
+
+    results = [await backend.hit("k", rule) for _ in range(4)]
+    assert [r.allowed for r in results] == [True, True, True, False]
+    assert [r.remaining for r in results[:3]] == [2, 1, 0]
+    assert results[-1].retry_after > 0
@@ -3,7 +3,3 @@ Home 모듈
 
 홈 관련 기능을 제공하는 패키지입니다.
 """
-
-from .models import Home
-
-__all__ = ["Home"]
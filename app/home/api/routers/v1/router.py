@@ -1,10 +1,16 @@
+import logging
+
 from fastapi import APIRouter, Depends, Request  # , Form, UploadFile, File, status
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import response_cache
+from app.database.redis import redis_manager
 from app.database.session import get_session
 from config import templates
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(tags=["home"])
 
 
@@ -22,10 +28,19 @@ async def db_health_check(session: AsyncSession = Depends(get_session)):
         return {"status": "unhealthy", "database": "disconnected", "error": str(e)}
 
 
+@router.get("/redis")
+async def redis_health_check():
+    """Redis 논리 DB 별 연결 상태 확인"""
+    databases = await redis_manager.health()
+    return {
+        "status": "healthy" if all(databases.values()) else "unhealthy",
+        "databases": databases,
+    }
+
+
 @router.get("/")
-async def home(
-    request: Request,
-    conn: AsyncSession = Depends(get_session),
-):
-    print("session_user:")
-    return templates.TemplateResponse(request=request, name="home.html", context={})
+@response_cache.cached()  # DB 를 읽지 않는 정적 페이지라 태그 없이 TTL 로만 만료
+async def home(request: Request):
+    # 요청마다 찍히는 로그라 LOG_DEBUG_SAMPLE_RATE 비율만 남김
+    logger.debug("home page requested")
+    return templates.TemplateResponse(request=request, name="index.html", context={})
@@ -1,3 +1,5 @@
+import logging
+
 from fastapi import APIRouter, Depends, Request  # , Form, UploadFile, File, status
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -5,6 +7,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.database.session import get_session
 from config import templates
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(tags=["home"])
 
 
@@ -27,7 +31,8 @@ async def home(
     request: Request,
     conn: AsyncSession = Depends(get_session),
 ):
-    print("session_user:")
+    # 요청마다 찍히는 로그라 LOG_DEBUG_SAMPLE_RATE 비율만 남김
+    logger.debug("home page requested")
 
     return templates.TemplateResponse(
         request=request,
@@ -1,5 +1,9 @@
+from typing import Any
+
 from sqladmin import ModelView
+from starlette.requests import Request
 
+from app.core.cache import response_cache
 from app.lyrics.models import (  # noqa: F401
     Attribute,
     PromptTemplate,
@@ -7,9 +11,22 @@ from app.lyrics.models import (  # noqa: F401
     SongSample,
     StoreDefaultInfo,
 )
+from app.lyrics.services.prompt import prompt_renderer
+
+
+class CacheInvalidatingModelView(ModelView):
+    """관리자 화면에서 생성/수정/삭제 시 해당 테이블 태그의 캐시 페이지 제거"""
+
+    async def after_model_change(
+        self, data: dict, model: Any, is_created: bool, request: Request
+    ) -> None:
+        await response_cache.invalidate_tags(self.model.__tablename__)
 
+    async def after_model_delete(self, model: Any, request: Request) -> None:
+        await response_cache.invalidate_tags(self.model.__tablename__)
 
-class LyricsStoreDefaultInfoAdmin(ModelView, model=StoreDefaultInfo):
+
+class LyricsStoreDefaultInfoAdmin(CacheInvalidatingModelView, model=StoreDefaultInfo):
     name = "상가 기본 정보"
     name_plural = "상가 정보 목록"
     icon = "fa-solid fa-store"
@@ -43,7 +60,7 @@ class LyricsStoreDefaultInfoAdmin(ModelView, model=StoreDefaultInfo):
     # ]
 
 
-class LyricsAttributeAdmin(ModelView, model=Attribute):
+class LyricsAttributeAdmin(CacheInvalidatingModelView, model=Attribute):
     name = "속성"
     name_plural = "속성 목록"
     icon = "fa-solid fa-tags"
@@ -67,7 +84,7 @@ class LyricsAttributeAdmin(ModelView, model=Attribute):
     ]
 
 
-class LyricsSongSampleAdmin(ModelView, model=SongSample):
+class LyricsSongSampleAdmin(CacheInvalidatingModelView, model=SongSample):
     name = "가사 샘플"
     name_plural = "가사 샘플 목록"
     icon = "fa-solid fa-flask"
@@ -89,7 +106,7 @@ class LyricsSongSampleAdmin(ModelView, model=SongSample):
     column_default_sort = (SongSample.created_at, False)  # False: ASC, True: DESC
 
 
-class LyricsPromptTemplateAdmin(ModelView, model=PromptTemplate):
+class LyricsPromptTemplateAdmin(CacheInvalidatingModelView, model=PromptTemplate):
     name = "프롬프트 템플릿"
     name_plural = "프롬프트 템플릿 목록"
     icon = "fa-solid fa-file-alt"
@@ -106,8 +123,19 @@ class LyricsPromptTemplateAdmin(ModelView, model=PromptTemplate):
 
     column_default_sort = (PromptTemplate.created_at, False)  # False: ASC, True: DESC
 
+    # 컴파일된 프롬프트 캐시도 함께 제거
+    async def after_model_change(
+        self, data: dict, model: Any, is_created: bool, request: Request
+    ) -> None:
+        prompt_renderer.invalidate(model.id)
+        await super().after_model_change(data, model, is_created, request)
+
+    async def after_model_delete(self, model: Any, request: Request) -> None:
+        prompt_renderer.invalidate(model.id)
+        await super().after_model_delete(model, request)
+
 
-class LyricsSongResultsAllAdmin(ModelView, model=SongResultsAll):
+class LyricsSongResultsAllAdmin(CacheInvalidatingModelView, model=SongResultsAll):
     name = "가사 결과"
     name_plural = "가사 결과 목록"
     icon = "fa-solid fa-music"
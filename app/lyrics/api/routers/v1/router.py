@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends, Request  # , Form, UploadFile, File, status
-from sqlalchemy import Connection
+from fastapi import APIRouter, Query, Request  # , Form, UploadFile, File, status
+from sqlalchemy import select
 
-from app.database.session import get_session
+from app.core.streaming import RowStream, streaming_templates
+from app.database.session import ReadSessionLocal
+from app.lyrics.models import SongResultsAll
 
 router = APIRouter(prefix="/lyrics", tags=["lyrics"])
 
@@ -9,12 +11,15 @@ router = APIRouter(prefix="/lyrics", tags=["lyrics"])
 @router.get("/")
 async def home(
     request: Request,
-    conn: Connection = Depends(get_session),
+    genre: str | None = None,
+    limit: int = Query(1000, ge=1, le=10_000),
 ):
-    print("session_user:")
+    """가사 결과 목록 (행이 많으므로 스트리밍 렌더링)"""
+    stmt = select(SongResultsAll).order_by(
+        SongResultsAll.created_at.desc(), SongResultsAll.id.desc()
+    )
+    if genre:
+        stmt = stmt.where(SongResultsAll.genre == genre)
 
-    # return templates.TemplateResponse(
-    #     request=request,
-    #     name="index.html",
-    #     context={"all_blogs": all_blogs, "session_user": session_user},
-    # )
+    rows = RowStream(stmt.limit(limit), ReadSessionLocal)
+    return streaming_templates.response(request, "lyrics/results.html", {"rows": rows})
@@ -1,8 +1,12 @@
+import logging
+
 from fastapi import APIRouter, Depends, Request  # , Form, UploadFile, File, status
 from sqlalchemy import Connection
 
 from app.database.session import get_session
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/lyrics", tags=["lyrics"])
 
 
@@ -11,7 +15,8 @@ async def home(
     request: Request,
     conn: Connection = Depends(get_session),
 ):
-    print("session_user:")
+    # 요청마다 찍히는 로그라 LOG_DEBUG_SAMPLE_RATE 비율만 남김
+    logger.debug("lyrics page requested")
 
     # return templates.TemplateResponse(
     #     request=request,
@@ -1,5 +1,6 @@
 from sqlalchemy import (
     DateTime,
+    Index,
     Integer,
     String,
     Text,
@@ -76,6 +77,12 @@ class StoreDefaultInfo(Base):
     def __repr__(self) -> str:
         return f"id={self.id}, store_name={self.store_name}"
 
+    # 관리자 목록 기본 정렬(store_name), 커서 페이지네이션(created_at, id)
+    __table_args__ = (
+        Index("idx_store_default_info_store_name", "store_name", "id"),
+        Index("idx_store_default_info_created_at_id", "created_at", "id"),
+    )
+
 
 class PromptTemplate(Base):
     __tablename__ = "prompt_template"
@@ -101,6 +108,8 @@ class PromptTemplate(Base):
     def __repr__(self) -> str:
         return f"id={self.id}, description={self.description}"
 
+    __table_args__ = (Index("idx_prompt_template_created_at_id", "created_at", "id"),)
+
 
 class Attribute(Base):
     __tablename__ = "attribute"
@@ -126,6 +135,11 @@ class Attribute(Base):
     def __repr__(self) -> str:
         return f"id={self.id}, attr_category={self.attr_category}"
 
+    __table_args__ = (
+        Index("idx_attribute_created_at_id", "created_at", "id"),
+        Index("idx_attribute_attr_category_created_at", "attr_category", "created_at"),
+    )
+
 
 class SongSample(Base):
     __tablename__ = "song_sample"
@@ -181,6 +195,11 @@ class SongSample(Base):
     def __repr__(self) -> str:
         return f"id={self.id}, sample_song={self.sample_song}"
 
+    __table_args__ = (
+        Index("idx_song_sample_created_at_id", "created_at", "id"),
+        Index("idx_song_sample_ai_ai_model_created_at", "ai", "ai_model", "created_at"),
+    )
+
 
 class SongResultsAll(Base):
     __tablename__ = "song_results_all"
@@ -295,3 +314,31 @@ class SongResultsAll(Base):
 
     def __repr__(self) -> str:
         return f"id={self.id}, result_song={self.result_song}"
+
+    __table_args__ = (
+        # 관리자 기본 정렬 + 커서 페이지네이션
+        Index("idx_song_results_all_created_at_id", "created_at", "id"),
+        # 업종/장르 필터 후 최신순 (count 쿼리는 인덱스만으로 처리)
+        Index(
+            "idx_song_results_all_store_category_genre_created_at",
+            "store_category",
+            "genre",
+            "created_at",
+        ),
+        Index("idx_song_results_all_store_name_created_at", "store_name", "created_at"),
+        Index(
+            "idx_song_results_all_ai_ai_model_created_at",
+            "ai",
+            "ai_model",
+            "created_at",
+        ),
+        Index(
+            "idx_song_results_all_attr_category_created_at",
+            "attr_category",
+            "created_at",
+        ),
+        # 관리자 목록의 나머지 정렬 가능 컬럼 (filesort 방지)
+        Index("idx_song_results_all_ai_model", "ai_model"),
+        Index("idx_song_results_all_genre", "genre"),
+        Index("idx_song_results_all_num_of_people", "num_of_people"),
+    )
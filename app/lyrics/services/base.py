@@ -1,6 +1,8 @@
 from uuid import UUID
+
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import SQLModel
+
+from app.core.cache import response_cache
 
 
 class BaseService:
@@ -10,15 +12,30 @@ class BaseService:
 
     async def _get(self, id: UUID):
         return await self.session.get(self.model, id)
-    
+
     async def _add(self, entity):
         self.session.add(entity)
         await self.session.commit()
         await self.session.refresh(entity)
+        await self._invalidate_cache()
         return entity
-    
+
+    async def _add_all(self, entities, *, batch_size: int = 500):
+        # 배치 단위 다중 행 upsert (캐시 무효화는 BulkWriter 가 1회 수행)
+        from app.lyrics.services.bulk import BulkWriter
+
+        writer = BulkWriter(self.session, self.model, batch_size=batch_size)
+        return await writer.write(entities)
+
     async def _update(self, entity):
         return await self._add(entity)
-    
+
     async def _delete(self, entity):
-        await self.session.delete(entity)
\ No newline at end of file
+        await self.session.delete(entity)
+        # 커밋 전에 무효화하면 다른 요청이 이전 데이터를 다시 캐시할 수 있음
+        await self.session.commit()
+        await self._invalidate_cache()
+
+    async def _invalidate_cache(self):
+        # 이 테이블을 읽는 캐시 페이지 제거
+        await response_cache.invalidate_tags(self.model.__tablename__)
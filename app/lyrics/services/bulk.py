@@ -0,0 +1,214 @@
+"""
+생성 결과 일괄 저장
+
+BaseService._add 는 행마다 add -> commit -> refresh (왕복 3회 + 트랜잭션 1개) 를
+수행합니다. BulkWriter 는 결과를 batch_size 단위로 모아 배치마다 다중 행
+INSERT ... ON DUPLICATE KEY UPDATE 1회로 저장합니다.
+
+    async with AsyncSessionLocal() as session:
+        result = await BulkWriter(session).write(results)
+        # BulkResult(inserted=..., updated=..., duplicate=..., batches=...)
+"""
+
+from collections.abc import AsyncIterable, Iterable, Sequence
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any
+
+from sqlalchemy import inspect, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import response_cache
+from app.lyrics.models import SongResultsAll
+
+Row = dict[str, Any]
+
+# 갱신 대상에서 제외 (식별자/생성 시각)
+EXCLUDED_UPDATE_COLUMNS = frozenset({"id", "created_at"})
+
+
+@dataclass(slots=True)
+class BulkResult:
+    inserted: int = 0
+    updated: int = 0
+    duplicate: int = 0
+    batches: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated + self.duplicate
+
+
+class BulkWriter:
+    """unique 컬럼 충돌 시 갱신하는 일괄 upsert
+
+    MySQL 은 어느 unique 키(prompt/attr_value/sample_song/result_song 등)에서
+    충돌해도 ON DUPLICATE KEY UPDATE 로 기존 행을 갱신합니다.
+    SQLite(테스트/벤치마크용)는 ON CONFLICT 대상을 하나만 지정할 수 있어
+    conflict_target 컬럼 충돌만 갱신하고, 다른 unique 충돌은 IntegrityError 입니다.
+
+    MySQL 의 영향 행 수는 드라이버 플래그(CLIENT_FOUND_ROWS)에 따라 의미가 달라서
+    배치마다 unique 컬럼으로 기존 행을 1회 조회해 inserted/updated/duplicate 로
+    분류합니다.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        model: type = SongResultsAll,
+        *,
+        batch_size: int = 500,
+        update_columns: Sequence[str] | None = None,
+        conflict_target: str | None = None,
+        invalidate_cache: bool = True,
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        self.session = session
+        self.model = model
+        self.table = model.__table__
+        self.batch_size = batch_size
+        self.unique_columns = [c.name for c in self.table.columns if c.unique]
+        if update_columns is None:
+            update_columns = [
+                c.name
+                for c in self.table.columns
+                if not c.unique
+                and not c.primary_key
+                and c.name not in EXCLUDED_UPDATE_COLUMNS
+            ]
+        self.update_columns = list(update_columns)
+        # SQLite ON CONFLICT 대상 (기본: 마지막 unique 컬럼 = result_song, 없으면 PK)
+        if conflict_target is None:
+            primary_key = [c.name for c in self.table.primary_key.columns]
+            if self.unique_columns:
+                conflict_target = self.unique_columns[-1]
+            elif len(primary_key) == 1:
+                conflict_target = primary_key[0]
+            else:
+                raise ValueError(
+                    f"{self.table.name} has no unique column; pass conflict_target"
+                )
+        self.conflict_target = conflict_target
+        self.invalidate_cache = invalidate_cache
+
+    def to_row(self, item: Any) -> Row:
+        """ORM 인스턴스/dict -> 컬럼 dict (None 인 id/created_at 은 DB 기본값 사용)"""
+        if isinstance(item, dict):
+            return item
+        state = inspect(item)
+        row = {}
+        for attr in state.mapper.column_attrs:
+            value = getattr(item, attr.key)
+            if value is None and attr.key in EXCLUDED_UPDATE_COLUMNS:
+                continue
+            row[attr.columns[0].name] = value
+        return row
+
+    async def write(self, items: Iterable[Any] | AsyncIterable[Any]) -> BulkResult:
+        result = BulkResult()
+        async for batch in self._batches(items):
+            await self._write_batch([self.to_row(item) for item in batch], result)
+            result.batches += 1
+
+        if self.invalidate_cache and (result.inserted or result.updated):
+            await response_cache.invalidate_tags(self.table.name)
+        return result
+
+    async def _batches(self, items: Iterable[Any] | AsyncIterable[Any]):
+        if isinstance(items, AsyncIterable):
+            batch = []
+            async for item in items:
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+            return
+
+        iterator = iter(items)
+        while batch := list(islice(iterator, self.batch_size)):
+            yield batch
+
+    async def _write_batch(self, rows: list[Row], result: BulkResult) -> None:
+        # 다중 VALUES 는 모든 행의 키가 같아야 함
+        keys = list(dict.fromkeys(key for row in rows for key in row))
+        rows = [{key: row.get(key) for key in keys} for row in rows]
+
+        await self._classify(rows, result)
+        dialect = self.session.get_bind().dialect.name
+        await self.session.execute(self._upsert(rows, keys, dialect))
+        await self.session.commit()
+
+    def _upsert(self, rows: list[Row], keys: list[str], dialect: str):
+        update_columns = [c for c in self.update_columns if c in keys]
+
+        if dialect in ("mysql", "mariadb"):
+            from sqlalchemy.dialects.mysql import insert
+
+            stmt = insert(self.table).values(rows)
+            # 갱신할 컬럼이 없으면 no-op 갱신으로 충돌만 무시
+            target = update_columns or [self.conflict_target]
+            return stmt.on_duplicate_key_update({c: stmt.inserted[c] for c in target})
+
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+
+            stmt = insert(self.table).values(rows)
+            if not update_columns:
+                return stmt.on_conflict_do_nothing(
+                    index_elements=[self.conflict_target]
+                )
+            return stmt.on_conflict_do_update(
+                index_elements=[self.conflict_target],
+                set_={c: stmt.excluded[c] for c in update_columns},
+            )
+
+        raise NotImplementedError(f"bulk upsert is not supported for {dialect!r}")
+
+    async def _classify(self, rows: list[Row], result: BulkResult) -> None:
+        """unique 값이 겹치는 기존 행(및 같은 배치의 앞선 행)과 비교해 분류"""
+        candidates = self.unique_columns or [self.conflict_target]
+        columns = [c for c in candidates if any(row.get(c) for row in rows)]
+        update_columns = [c for c in self.update_columns if c in rows[0]]
+
+        known: dict[tuple[str, Any], Row] = {}
+        if columns:
+            table = self.table
+            stmt = select(
+                *(table.c[c] for c in dict.fromkeys(columns + update_columns))
+            ).where(
+                or_(
+                    *(
+                        table.c[c].in_({row[c] for row in rows if row.get(c)})
+                        for c in columns
+                    )
+                )
+            )
+            for existing in (await self.session.execute(stmt)).mappings():
+                for c in columns:
+                    if existing[c] is not None:
+                        known[(c, existing[c])] = dict(existing)
+
+        for row in rows:
+            match = next(
+                (
+                    known[(c, row[c])]
+                    for c in columns
+                    if row.get(c) is not None and (c, row[c]) in known
+                ),
+                None,
+            )
+            if match is None:
+                result.inserted += 1
+            elif any(match.get(c) != row[c] for c in update_columns):
+                result.updated += 1
+            else:
+                result.duplicate += 1
+
+            # 충돌 시 unique 컬럼은 기존 값 유지, 갱신 컬럼만 바뀜
+            merged = {**match, **{c: row[c] for c in update_columns}} if match else row
+            for c in columns:
+                if merged.get(c) is not None:
+                    known[(c, merged[c])] = merged
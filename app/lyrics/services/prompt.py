@@ -0,0 +1,156 @@
+"""
+프롬프트 템플릿 렌더링 엔진
+
+PromptTemplate.prompt 를 샌드박스 Jinja2 템플릿으로 한 번만 컴파일해
+(id, created_at) 키의 LRU 에 보관합니다. 같은 템플릿으로 여러 프롬프트를
+렌더링해도 DB 조회와 파싱은 첫 번째 호출에서만 일어납니다.
+
+    compiled = await prompt_renderer.get(session, template_id)
+    prompt = compiled.render(store=store, attribute=attribute, sample=sample)
+
+관리자 화면에서 수정/삭제하면 invalidate() 로 즉시 제거되고, 다른 프로세스
+(워커 등)의 캐시는 max_age 가 지나면 다시 조회합니다.
+적중/미스 수는 /metrics 에 prompt_cache_hits_total/prompt_cache_misses_total 로
+노출됩니다.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from datetime import datetime
+
+from jinja2 import Template
+from jinja2.sandbox import SandboxedEnvironment
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.metrics import Counter
+from app.lyrics.models import PromptTemplate
+from config import cache_settings
+
+cache_hits = Counter("prompt_cache_hits_total", "프롬프트 템플릿 캐시 적중 수")
+cache_misses = Counter("prompt_cache_misses_total", "프롬프트 템플릿 캐시 미스 수")
+
+
+class PromptTemplateNotFound(LookupError):
+    pass
+
+
+@dataclass(slots=True)
+class CompiledPrompt:
+    id: int
+    created_at: datetime | None
+    description: str | None
+    template: Template
+    loaded_at: float
+
+    def render(self, **context) -> str:
+        return self.template.render(**context)
+
+
+@dataclass(slots=True)
+class PromptCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class PromptRenderer:
+    def __init__(self, maxsize: int = 256, max_age: float | None = None):
+        self.maxsize = maxsize
+        self.max_age = max_age
+        # 사용자 입력 템플릿이므로 샌드박스에서 실행 (속성/메서드 접근 제한)
+        self.env = SandboxedEnvironment(autoescape=False, cache_size=0)
+        self._cache: OrderedDict[tuple[int, datetime | None], CompiledPrompt] = (
+            OrderedDict()
+        )
+        self._keys: dict[int, tuple[int, datetime | None]] = {}
+        self._stats = PromptCacheStats()
+
+    def stats(self) -> PromptCacheStats:
+        return replace(self._stats, size=len(self._cache))
+
+    def _lookup(self, template_id: int) -> CompiledPrompt | None:
+        key = self._keys.get(template_id)
+        if key is None:
+            return None
+        compiled = self._cache[key]
+        if self.max_age is not None and (
+            time.monotonic() - compiled.loaded_at > self.max_age
+        ):
+            self._remove(key)
+            return None
+        self._cache.move_to_end(key)
+        return compiled
+
+    def _remove(self, key: tuple[int, datetime | None]) -> None:
+        self._cache.pop(key, None)
+        if self._keys.get(key[0]) == key:
+            del self._keys[key[0]]
+
+    def compile(self, row: PromptTemplate) -> CompiledPrompt:
+        """이미 조회한 행을 컴파일 (같은 (id, created_at) 이면 캐시 재사용)"""
+        key = (row.id, row.created_at)
+        compiled = self._cache.get(key)
+        if compiled is not None and self._keys.get(row.id) == key:
+            self._stats.hits += 1
+            cache_hits.inc()
+            self._cache.move_to_end(key)
+            return compiled
+
+        self._stats.misses += 1
+        cache_misses.inc()
+        compiled = CompiledPrompt(
+            id=row.id,
+            created_at=row.created_at,
+            description=row.description,
+            template=self.env.from_string(row.prompt),
+            loaded_at=time.monotonic(),
+        )
+        # 같은 id 의 이전 버전(삭제 후 재생성 등) 제거
+        previous = self._keys.get(row.id)
+        if previous is not None and previous != key:
+            self._remove(previous)
+        self._cache[key] = compiled
+        self._keys[row.id] = key
+        while len(self._cache) > self.maxsize:
+            evicted, _ = self._cache.popitem(last=False)
+            self._keys.pop(evicted[0], None)
+            self._stats.evictions += 1
+        return compiled
+
+    async def get(self, session: AsyncSession, template_id: int) -> CompiledPrompt:
+        compiled = self._lookup(template_id)
+        if compiled is not None:
+            self._stats.hits += 1
+            cache_hits.inc()
+            return compiled
+
+        row = await session.get(PromptTemplate, template_id)
+        if row is None:
+            raise PromptTemplateNotFound(template_id)
+        return self.compile(row)
+
+    async def render(self, session: AsyncSession, template_id: int, **context) -> str:
+        return (await self.get(session, template_id)).render(**context)
+
+    def invalidate(self, template_id: int | None = None) -> None:
+        """수정/삭제된 템플릿 제거 (None 이면 전체)"""
+        if template_id is None:
+            self._cache.clear()
+            self._keys.clear()
+            return
+        key = self._keys.get(template_id)
+        if key is not None:
+            self._remove(key)
+
+
+prompt_renderer = PromptRenderer(
+    maxsize=cache_settings.PROMPT_CACHE_SIZE,
+    max_age=cache_settings.PROMPT_CACHE_MAX_AGE,
+)
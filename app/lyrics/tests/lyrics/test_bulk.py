@@ -0,0 +1,103 @@
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.dialects import mysql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import response_cache
+from app.lyrics.models import PromptTemplate, SongResultsAll
+from app.lyrics.services.bulk import BulkWriter
+
+
+def _row(i: int, **overrides) -> dict:
+    row = {
+        "store_name": f"store-{i}",
+        "prompt": f"prompt-{i}",
+        "attr_category": "mood",
+        "attr_value": f"value-{i}",
+        "ai": "stub",
+        "ai_model": "stub-v1",
+        "sample_song": f"sample-{i}",
+        "result_song": f"result-{i}",
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.fixture
+def session(db_session, monkeypatch):
+    async def fake_invalidate(*tags):
+        fake_invalidate.calls.append(tags)
+
+    fake_invalidate.calls = []
+    monkeypatch.setattr(response_cache, "invalidate_tags", fake_invalidate)
+    db_session.invalidated = fake_invalidate.calls
+    return db_session
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_bulk_write_counts(session):
+    writer = BulkWriter(session, batch_size=4)
+    result = await writer.write(_row(i) for i in range(10))
+
+    assert (result.inserted, result.updated, result.duplicate) == (10, 0, 0)
+    assert result.batches == 3
+
+    async def resubmitted():
+        for i in range(8, 12):
+            # 8: 그대로, 9: 모델 변경, 10/11: 신규
+            yield _row(i, ai_model="stub-v2" if i == 9 else "stub-v1")
+        # 같은 배치 안의 중복
+        yield _row(11)
+
+    result = await writer.write(resubmitted())
+    assert (result.inserted, result.updated, result.duplicate) == (2, 1, 2)
+
+    count = await session.scalar(select(func.count()).select_from(SongResultsAll))
+    assert count == 12
+    model = await session.scalar(
+        select(SongResultsAll.ai_model).where(SongResultsAll.result_song == "result-9")
+    )
+    assert model == "stub-v2"
+    assert session.invalidated == [("song_results_all",), ("song_results_all",)]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_bulk_write_accepts_orm_instances(session):
+    result = await BulkWriter(session).write([SongResultsAll(**_row(1))])
+    assert result.inserted == 1
+
+    result = await BulkWriter(session).write([SongResultsAll(**_row(1))])
+    assert (result.inserted, result.duplicate) == (0, 1)
+    # 변경이 없으면 캐시 무효화도 하지 않음
+    assert len(session.invalidated) == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_bulk_write_without_unique_column_uses_primary_key(session):
+    writer = BulkWriter(session, PromptTemplate)
+    assert writer.conflict_target == "id"
+
+    result = await writer.write(
+        [PromptTemplate(prompt="p-1"), PromptTemplate(prompt="p-2")]
+    )
+    assert result.inserted == 2
+
+    first = await session.scalar(select(PromptTemplate.id).order_by(PromptTemplate.id))
+    result = await writer.write([{"id": first, "prompt": "p-1 (edited)"}])
+    assert (result.inserted, result.updated) == (0, 1)
+    assert (
+        await session.scalar(
+            select(PromptTemplate.prompt).where(PromptTemplate.id == first)
+        )
+        == "p-1 (edited)"
+    )
+
+
+def test_mysql_statement_is_single_multi_row_upsert():
+    rows = [_row(1), _row(2)]
+    stmt = BulkWriter(AsyncSession())._upsert(rows, list(rows[0]), "mysql")
+    sql = str(stmt.compile(dialect=mysql.dialect()))
+
+    assert sql.count("INSERT INTO song_results_all") == 1
+    assert "ON DUPLICATE KEY UPDATE" in sql
+    assert "result_song =" not in sql.split("ON DUPLICATE KEY UPDATE")[1]
@@ -0,0 +1,97 @@
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+from jinja2.exceptions import SecurityError
+from sqlalchemy import event
+
+from app.lyrics.models import PromptTemplate
+from app.lyrics.services.prompt import (
+    PromptRenderer,
+    PromptTemplateNotFound,
+    cache_hits,
+    cache_misses,
+)
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def templates(db_session) -> list[int]:
+    rows = [
+        PromptTemplate(prompt="{{ store.store_name }}의 {{ mood }} 노래"),
+        PromptTemplate(prompt="{{ store.store_name }} 광고"),
+    ]
+    db_session.add_all(rows)
+    await db_session.commit()
+    return [row.id for row in rows]
+
+
+def _count_selects(session) -> list[str]:
+    statements = []
+
+    # 공유 엔진이 아닌 이 테스트의 연결에만 등록 (연결과 함께 사라짐)
+    @event.listens_for(session.bind.sync_connection, "before_cursor_execute")
+    def record(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    return statements
+
+
+async def test_batch_render_reads_template_once(db_session, templates):
+    renderer = PromptRenderer(maxsize=8)
+    selects = _count_selects(db_session)
+    hits_before, misses_before = cache_hits.value(), cache_misses.value()
+    store = SimpleNamespace(store_name="카페 봄")
+
+    prompts = [
+        await renderer.render(db_session, templates[0], store=store, mood=f"m{i}")
+        for i in range(10_000)
+    ]
+
+    assert prompts[0] == "카페 봄의 m0 노래"
+    assert len(selects) == 1
+    stats = renderer.stats()
+    assert (stats.hits, stats.misses, stats.size) == (9_999, 1, 1)
+    # 프로세스 전역 Prometheus 카운터에도 반영
+    assert cache_hits.value() - hits_before == 9_999
+    assert cache_misses.value() - misses_before == 1
+
+
+async def test_invalidate_and_eviction(db_session, templates):
+    renderer = PromptRenderer(maxsize=1)
+    store = SimpleNamespace(store_name="카페")
+    first, second = templates
+
+    await renderer.get(db_session, first)
+    await renderer.get(db_session, second)
+    assert renderer.stats().evictions == 1
+
+    # 관리자 수정 후 invalidate 하면 새 본문으로 다시 컴파일
+    row = await db_session.get(PromptTemplate, second)
+    row.prompt = "{{ store.store_name }} 신규"
+    await db_session.commit()
+    assert await renderer.render(db_session, second, store=store) == "카페 광고"
+    renderer.invalidate(second)
+    assert await renderer.render(db_session, second, store=store) == "카페 신규"
+
+    with pytest.raises(PromptTemplateNotFound):
+        await renderer.get(db_session, second + 100)
+
+
+async def test_max_age_and_sandbox(db_session, templates, monkeypatch):
+    renderer = PromptRenderer(max_age=10)
+    now = [100.0]
+    monkeypatch.setattr("app.lyrics.services.prompt.time.monotonic", lambda: now[0])
+
+    await renderer.get(db_session, templates[0])
+    now[0] += 11
+    await renderer.get(db_session, templates[0])
+    assert renderer.stats().misses == 2
+
+    row = PromptTemplate(prompt="{{ store.__class__.__mro__ }}")
+    db_session.add(row)
+    await db_session.flush()
+    with pytest.raises(SecurityError):
+        await renderer.render(db_session, row.id, store=object())
@@ -0,0 +1,236 @@
+import asyncio
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy import select
+
+from app.core.cache import response_cache
+from app.database.tests.fake_redis import FakeRedis
+from app.lyrics.models import (
+    Attribute,
+    PromptTemplate,
+    SongResultsAll,
+    SongSample,
+    StoreDefaultInfo,
+)
+from app.lyrics.services.prompt import PromptRenderer
+from app.lyrics.worker import (
+    ConflictingResult,
+    GenerationHandler,
+    GenerationJob,
+    MemoryJobQueue,
+    PermanentJobError,
+    PromptTooLong,
+    RedisJobQueue,
+    StubGeneratorBackend,
+    WorkerPool,
+)
+
+
+def _job(**kwargs) -> GenerationJob:
+    return GenerationJob(
+        store_id=1, attribute_id=1, prompt_template_id=1, sample_id=1, **kwargs
+    )
+
+
+async def _drain(pool: WorkerPool, queue: MemoryJobQueue, timeout: float = 2.0):
+    await pool.start()
+    try:
+        async with asyncio.timeout(timeout):
+            while queue.qsize() or queue.processing:
+                await asyncio.sleep(0.01)
+    finally:
+        await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_pool_retries_then_succeeds():
+    calls: dict[str, int] = {}
+
+    async def flaky(job: GenerationJob) -> None:
+        calls[job.id] = calls.get(job.id, 0) + 1
+        if calls[job.id] < 3:
+            raise ConnectionError("backend unavailable")
+
+    queue = MemoryJobQueue()
+    await queue.enqueue(*(_job() for _ in range(5)))
+    pool = WorkerPool(queue, flaky, concurrency=3, backoff_base=0.01, poll_timeout=0.01)
+    await _drain(pool, queue)
+
+    assert pool.stats.succeeded == 5
+    assert pool.stats.retried == 10
+    assert not queue.dead
+
+
+@pytest.mark.asyncio
+async def test_pool_dead_letters_after_max_retries():
+    async def broken(job: GenerationJob) -> None:
+        if job.store_id == 2:
+            raise PermanentJobError("missing row")
+        raise RuntimeError("boom")
+
+    queue = MemoryJobQueue()
+    await queue.enqueue(_job(), GenerationJob(2, 1, 1, 1))
+    pool = WorkerPool(
+        queue, broken, max_retries=2, backoff_base=0.01, poll_timeout=0.01
+    )
+    await _drain(pool, queue)
+
+    assert pool.stats.failed == 2
+    # 영구 오류는 재시도 없이 바로 dead-letter
+    assert sorted(job.attempts for job in queue.dead) == [1, 3]
+    assert all(job.last_error for job in queue.dead)
+
+
+class FlakyQueue(MemoryJobQueue):
+    """처음 failures 번의 reserve/ack 가 Redis 연결 오류"""
+
+    def __init__(self, failures: int):
+        super().__init__()
+        self.failures = failures
+
+    def _maybe_fail(self) -> None:
+        if self.failures > 0:
+            self.failures -= 1
+            raise RedisConnectionError("connection refused")
+
+    async def reserve(self, timeout: float) -> GenerationJob | None:
+        self._maybe_fail()
+        return await super().reserve(timeout)
+
+    async def ack(self, job: GenerationJob) -> None:
+        self._maybe_fail()
+        await super().ack(job)
+
+
+@pytest.mark.asyncio
+async def test_pool_survives_queue_errors():
+    async def ok(job: GenerationJob) -> None:
+        pass
+
+    queue = FlakyQueue(failures=3)
+    await queue.enqueue(*(_job() for _ in range(3)))
+    pool = WorkerPool(queue, ok, concurrency=1, backoff_base=0.01, poll_timeout=0.01)
+    await pool.start()
+    try:
+        async with asyncio.timeout(2):
+            while pool.stats.succeeded < 3:
+                await asyncio.sleep(0.01)
+    finally:
+        await pool.stop()
+    assert queue.failures == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_run_fails_when_task_crashes():
+    class BrokenQueue(MemoryJobQueue):
+        async def reserve(self, timeout: float) -> GenerationJob | None:
+            raise ValueError("unexpected")
+
+    async def ok(job: GenerationJob) -> None:
+        pass
+
+    pool = WorkerPool(BrokenQueue(), ok, concurrency=2, poll_timeout=0.01)
+    with pytest.raises(RuntimeError, match="crashed"):
+        async with asyncio.timeout(2):
+            await pool.run()
+
+
+@pytest.mark.asyncio
+async def test_redis_queue_round_trip():
+    redis = FakeRedis()
+    queue = RedisJobQueue(redis, consumer="test")
+    first, second = _job(), _job()
+    await queue.enqueue(first, second)
+
+    job = await queue.reserve(0.1)
+    assert job.id == first.id
+    assert await redis.llen(queue.processing_key) == 1
+
+    job.attempts += 1
+    await queue.retry(job, delay=0)
+    assert await redis.llen(queue.processing_key) == 0
+    assert await queue.promote_due() == 1
+
+    # 처리 중 종료된 작업은 recover 로 pending 에 되돌아옴
+    job = await queue.reserve(0.1)
+    assert job.id == second.id
+    assert await queue.recover() == 1
+
+    seen = []
+    while (job := await queue.reserve(0.05)) is not None:
+        seen.append((job.id, job.attempts))
+        await queue.ack(job)
+    assert sorted(seen) == sorted([(first.id, 1), (second.id, 0)])
+    assert await redis.llen(queue.processing_key) == 0
+
+
+@pytest.mark.asyncio
+async def test_redis_queue_reclaims_dead_consumer_jobs():
+    redis = FakeRedis()
+    crashed = RedisJobQueue(redis, consumer="host:100", heartbeat_ttl=60)
+    alive = RedisJobQueue(redis, consumer="host:200", heartbeat_ttl=60)
+    await crashed.enqueue(_job(), _job())
+    await crashed.heartbeat()
+    await alive.heartbeat()
+    assert await crashed.reserve(0.1) is not None
+    assert await alive.reserve(0.1) is not None
+
+    # 재시작한 프로세스는 새 이름(pid)이라 이전 processing 리스트를 모름
+    restarted = RedisJobQueue(redis, consumer="host:300", heartbeat_ttl=60)
+    assert await restarted.recover() == 0
+
+    # 생존 표시가 만료되면 다른 소비자가 회수, 살아 있는 소비자의 작업은 그대로
+    await redis.delete(crashed.heartbeat_key)
+    assert await restarted.recover() == 1
+    assert await redis.llen(crashed.processing_key) == 0
+    assert await redis.llen(alive.processing_key) == 1
+    assert await redis.llen(restarted.pending_key) == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_generation_handler_stores_result(
+    db_session, db_sessionmaker, monkeypatch
+):
+    invalidated = []
+
+    async def fake_invalidate(*tags):
+        invalidated.extend(tags)
+
+    monkeypatch.setattr(response_cache, "invalidate_tags", fake_invalidate)
+
+    spring = StoreDefaultInfo(store_name="카페 봄", store_category="카페")
+    summer = StoreDefaultInfo(store_name="카페 여름", store_category="카페")
+    attribute = Attribute(attr_category="분위기", attr_value="따뜻한")
+    template = PromptTemplate(
+        prompt="{{ store.store_name }} {{ attribute.attr_value }}"
+    )
+    long_template = PromptTemplate(prompt="{{ store.store_name }}" + "!" * 300)
+    sample = SongSample(ai="stub", ai_model="stub-v1", sample_song="라라라")
+    db_session.add_all([spring, summer, attribute, template, long_template, sample])
+    await db_session.commit()
+
+    def job(store=spring, prompt=template) -> GenerationJob:
+        return GenerationJob(store.id, attribute.id, prompt.id, sample.id)
+
+    handler = GenerationHandler(
+        db_sessionmaker, StubGeneratorBackend(), renderer=PromptRenderer()
+    )
+    await handler(job())
+    # 같은 입력 재처리는 unique 충돌을 성공으로 간주
+    await handler(job())
+
+    results = (await db_session.scalars(select(SongResultsAll))).all()
+    assert len(results) == 1
+    assert results[0].prompt == "카페 봄 따뜻한"
+    assert results[0].ai_model == "stub-v1"
+
+    # 다른 입력(상가 2)이 unique 컬럼(attr_value, sample_song)에서 겹치면 dead-letter
+    with pytest.raises(ConflictingResult):
+        await handler(job(store=summer))
+    # 잘라서 저장하면 다른 프롬프트와 충돌하므로 거부
+    with pytest.raises(PromptTooLong):
+        await handler(job(prompt=long_template))
+    with pytest.raises(PermanentJobError):
+        await handler(GenerationJob(summer.id + 100, attribute.id, template.id, 1))
+    assert invalidated == [SongResultsAll.__tablename__]
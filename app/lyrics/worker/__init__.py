@@ -0,0 +1,49 @@
+"""
+가사 생성 워커 패키지
+
+요청 핸들러는 작업을 큐에 넣기만 하고(enqueue_generation), 생성은 별도 프로세스의
+워커 풀이 처리합니다.
+
+    python -m app.lyrics.worker --concurrency 16
+"""
+
+from .backends import GeneratorBackend, StubGeneratorBackend, get_backend
+from .generation import (
+    ConflictingResult,
+    GenerationHandler,
+    MissingSource,
+    PromptTooLong,
+)
+from .jobs import GenerationJob
+from .pool import PermanentJobError, WorkerPool
+from .queue import JobQueue, MemoryJobQueue, RedisJobQueue
+
+
+def get_job_queue() -> RedisJobQueue:
+    from app.database.redis import redis_manager
+
+    return RedisJobQueue(redis_manager.client("worker_queue"))
+
+
+async def enqueue_generation(*jobs: GenerationJob) -> None:
+    """작업 등록 (RPUSH 1회, 요청 처리를 막지 않음)"""
+    await get_job_queue().enqueue(*jobs)
+
+
+__all__ = [
+    "ConflictingResult",
+    "GenerationHandler",
+    "GenerationJob",
+    "GeneratorBackend",
+    "JobQueue",
+    "MemoryJobQueue",
+    "MissingSource",
+    "PermanentJobError",
+    "PromptTooLong",
+    "RedisJobQueue",
+    "StubGeneratorBackend",
+    "WorkerPool",
+    "enqueue_generation",
+    "get_backend",
+    "get_job_queue",
+]
@@ -0,0 +1,63 @@
+"""
+가사 생성 워커 실행
+
+    python -m app.lyrics.worker [--concurrency N] [--backend stub]
+
+프로세스를 여러 개 띄우면 같은 Redis 큐를 나눠 처리합니다.
+SIGINT/SIGTERM 을 받으면 처리 중인 작업을 마치고 종료합니다.
+"""
+
+import argparse
+import asyncio
+import logging
+import signal
+
+from app.core.logging import setup_logging, shutdown_logging
+from app.database.redis import redis_manager
+from app.database.session import AsyncSessionLocal, engine
+from app.lyrics.worker import GenerationHandler, WorkerPool, get_backend, get_job_queue
+from config import log_settings, worker_settings
+
+logger = logging.getLogger("app.lyrics.worker")
+
+
+async def main(concurrency: int, backend_name: str) -> None:
+    queue = get_job_queue()
+    recovered = await queue.recover()
+    if recovered:
+        logger.info("recovered %d unacknowledged jobs", recovered)
+
+    pool = WorkerPool(
+        queue,
+        GenerationHandler(AsyncSessionLocal, get_backend(backend_name)),
+        concurrency=concurrency,
+        max_retries=worker_settings.WORKER_MAX_RETRIES,
+        backoff_base=worker_settings.WORKER_BACKOFF_BASE,
+        backoff_max=worker_settings.WORKER_BACKOFF_MAX,
+    )
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, pool.request_stop)
+
+    try:
+        await pool.run()
+    finally:
+        logger.info("worker stopped: %s", pool.stats)
+        await redis_manager.shutdown()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="가사 생성 워커")
+    parser.add_argument(
+        "--concurrency", type=int, default=worker_settings.WORKER_CONCURRENCY
+    )
+    parser.add_argument("--backend", default=worker_settings.WORKER_BACKEND)
+    args = parser.parse_args()
+
+    setup_logging(log_settings)
+    try:
+        asyncio.run(main(args.concurrency, args.backend))
+    finally:
+        shutdown_logging()
@@ -0,0 +1,62 @@
+"""
+가사 생성 백엔드
+
+새 모델은 GeneratorBackend 프로토콜을 구현한 뒤 BACKENDS 에 등록하고
+WORKER_BACKEND 설정으로 선택합니다.
+"""
+
+import asyncio
+import hashlib
+from typing import Protocol
+
+
+class GeneratorBackend(Protocol):
+    name: str
+    model: str
+
+    async def generate(self, prompt: str, *, sample_song: str | None = None) -> str:
+        """프롬프트로 가사 생성, 실패 시 예외 (워커가 재시도)"""
+        ...
+
+
+class StubGeneratorBackend:
+    """외부 호출 없이 프롬프트 해시로 결정적인 가사를 만드는 로컬 스텁 모델
+
+    같은 입력에는 항상 같은 결과를 돌려주므로 테스트/부하 측정에 사용합니다.
+    """
+
+    name = "stub"
+    model = "stub-v1"
+
+    WORDS = (
+        "봄날", "골목", "커피", "햇살", "웃음", "노래", "바람", "거리",
+        "손님", "하루", "별빛", "마음", "시장", "향기", "여름", "밤",
+    )  # fmt: skip
+
+    def __init__(self, latency: float = 0.0, max_length: int = 400):
+        self.latency = latency
+        self.max_length = max_length
+
+    async def generate(self, prompt: str, *, sample_song: str | None = None) -> str:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        digest = hashlib.sha256(f"{prompt}\0{sample_song or ''}".encode()).digest()
+        lines = []
+        for i in range(0, 32, 4):
+            words = [self.WORDS[b % len(self.WORDS)] for b in digest[i : i + 4]]
+            lines.append(" ".join(words))
+        # 결과 컬럼이 unique 이므로 해시 일부를 붙여 입력별로 구분
+        return ("\n".join(lines) + f"\n#{digest.hex()[:12]}")[: self.max_length]
+
+
+BACKENDS: dict[str, type] = {
+    StubGeneratorBackend.name: StubGeneratorBackend,
+}
+
+
+def get_backend(name: str, **options) -> GeneratorBackend:
+    try:
+        return BACKENDS[name](**options)
+    except KeyError:
+        raise ValueError(f"unknown generator backend: {name!r}") from None
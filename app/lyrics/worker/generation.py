@@ -0,0 +1,154 @@
+import logging
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.cache import response_cache
+from app.lyrics.models import (
+    Attribute,
+    PromptTemplate,
+    SongResultsAll,
+    SongSample,
+    StoreDefaultInfo,
+)
+from app.lyrics.services.prompt import (
+    CompiledPrompt,
+    PromptRenderer,
+    PromptTemplateNotFound,
+    prompt_renderer,
+)
+from app.lyrics.worker.backends import GeneratorBackend
+from app.lyrics.worker.jobs import GenerationJob
+from app.lyrics.worker.pool import PermanentJobError
+
+logger = logging.getLogger(__name__)
+
+
+class MissingSource(PermanentJobError):
+    """작업이 참조하는 원본 행이 없음 (재시도해도 성공할 수 없음)"""
+
+
+class PromptTooLong(PermanentJobError):
+    """렌더링한 프롬프트가 컬럼 길이를 넘음 (잘라 저장하면 다른 작업과 충돌)"""
+
+
+class ConflictingResult(PermanentJobError):
+    """다른 입력으로 만든 기존 결과와 unique 컬럼이 겹침"""
+
+
+class GenerationHandler:
+    """작업 1건: 원본 행 조회 -> 프롬프트 렌더링 -> 생성 -> SongResultsAll 저장"""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        backend: GeneratorBackend,
+        renderer: PromptRenderer = prompt_renderer,
+    ):
+        self.session_factory = session_factory
+        self.backend = backend
+        self.renderer = renderer
+
+    async def __call__(self, job: GenerationJob) -> None:
+        async with self.session_factory() as session:
+            store = await session.get(StoreDefaultInfo, job.store_id)
+            attribute = await session.get(Attribute, job.attribute_id)
+            sample = await session.get(SongSample, job.sample_id)
+            try:
+                # 컴파일된 템플릿은 캐시에서 재사용 (첫 작업만 DB 조회)
+                template = await self.renderer.get(session, job.prompt_template_id)
+            except PromptTemplateNotFound:
+                template = None
+            if None in (store, attribute, template, sample):
+                raise MissingSource(f"missing source rows for job {job.id}")
+
+            prompt = template.render(store=store, attribute=attribute, sample=sample)
+            if len(prompt) > PROMPT_MAX_LENGTH:
+                raise PromptTooLong(
+                    f"prompt of job {job.id} is {len(prompt)} chars "
+                    f"(max {PROMPT_MAX_LENGTH})"
+                )
+            lyrics = await self.backend.generate(prompt, sample_song=sample.sample_song)
+
+            result = build_result(
+                store,
+                attribute,
+                template,
+                sample,
+                prompt,
+                lyrics,
+                ai=self.backend.name,
+                ai_model=self.backend.model,
+            )
+            session.add(result)
+            try:
+                await session.commit()
+            except IntegrityError as e:
+                await session.rollback()
+                # 같은 입력의 결과가 이미 저장된 경우만 멱등 처리 (재전송/재시도)
+                if await is_stored(session, result):
+                    logger.info("job %s already has a stored result", job.id)
+                    return
+                raise ConflictingResult(
+                    f"result of job {job.id} conflicts with a stored row: {e.orig}"
+                ) from e
+
+        await response_cache.invalidate_tags(SongResultsAll.__tablename__)
+
+
+PROMPT_MAX_LENGTH = SongResultsAll.__table__.c.prompt.type.length
+
+
+async def is_stored(session: AsyncSession, result: SongResultsAll) -> bool:
+    """같은 입력(상가, 프롬프트, 속성, 샘플, 백엔드)으로 만든 결과가 있는지"""
+    columns = SongResultsAll.__table__.c
+    identity = (
+        "store_name",
+        "store_phone_number",
+        "prompt",
+        "attr_category",
+        "attr_value",
+        "sample_song",
+        "ai",
+        "ai_model",
+    )
+    query = select(columns.id).where(
+        *(
+            columns[name].is_not_distinct_from(getattr(result, name))
+            for name in identity
+        )
+    )
+    return await session.scalar(query.limit(1)) is not None
+
+
+def build_result(
+    store: StoreDefaultInfo,
+    attribute: Attribute,
+    template: PromptTemplate | CompiledPrompt,
+    sample: SongSample,
+    prompt: str,
+    lyrics: str,
+    *,
+    ai: str,
+    ai_model: str,
+) -> SongResultsAll:
+    return SongResultsAll(
+        store_info=(store.store_info or "")[:255] or None,
+        store_name=store.store_name,
+        store_category=store.store_category,
+        store_address=store.store_address,
+        store_phone_number=store.store_phone_number,
+        description=template.description,
+        prompt=prompt,
+        attr_category=attribute.attr_category,
+        attr_value=attribute.attr_value,
+        ai=ai,
+        ai_model=ai_model,
+        season=sample.season,
+        num_of_people=sample.num_of_people,
+        people_category=sample.people_category,
+        genre=sample.genre,
+        sample_song=sample.sample_song,
+        result_song=lyrics[:400],
+    )
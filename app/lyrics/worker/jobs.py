@@ -0,0 +1,23 @@
+import json
+import uuid
+from dataclasses import asdict, dataclass, field
+
+
+@dataclass(slots=True)
+class GenerationJob:
+    """가사 생성 작업 1건 (상가 정보 + 속성 + 프롬프트 템플릿 + 샘플 -> 결과)"""
+
+    store_id: int
+    attribute_id: int
+    prompt_template_id: int
+    sample_id: int
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    attempts: int = 0
+    last_error: str | None = None
+
+    def dumps(self) -> str:
+        return json.dumps(asdict(self), separators=(",", ":"))
+
+    @classmethod
+    def loads(cls, payload: str | bytes) -> "GenerationJob":
+        return cls(**json.loads(payload))
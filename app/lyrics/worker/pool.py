@@ -0,0 +1,157 @@
+import asyncio
+import logging
+import random
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from redis.exceptions import RedisError
+
+from app.lyrics.worker.jobs import GenerationJob
+from app.lyrics.worker.queue import JobQueue
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[GenerationJob], Awaitable[None]]
+
+
+class PermanentJobError(Exception):
+    """재시도 없이 바로 dead-letter 로 보낼 오류"""
+
+
+@dataclass(slots=True)
+class WorkerStats:
+    succeeded: int = 0
+    retried: int = 0
+    failed: int = 0
+
+
+class WorkerPool:
+    """동시 처리 수가 제한된 asyncio 워커 풀
+
+    concurrency 개의 소비자 태스크가 큐에서 작업을 꺼내 handler 를 실행합니다.
+    예외가 나면 지수 백오프(+지터)로 지연 큐에 다시 넣고, max_retries 를 넘으면
+    dead-letter 로 보냅니다. 처리량은 이 풀을 여러 프로세스로 띄워 수평 확장합니다.
+
+    큐(Redis) 오류는 같은 백오프로 기다렸다가 계속 시도하고, 그 외 예외로 태스크가
+    죽으면 풀 전체를 멈추고 run() 이 예외를 다시 올립니다 (프로세스는 0 이 아닌
+    코드로 종료되어 재시작됨).
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        handler: Handler,
+        *,
+        concurrency: int = 8,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+        poll_timeout: float = 1.0,
+    ):
+        self.queue = queue
+        self.handler = handler
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.poll_timeout = poll_timeout
+        self.stats = WorkerStats()
+        self._stopping = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+
+    def backoff(self, attempts: int) -> float:
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (attempts - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+    async def _process(self, job: GenerationJob) -> None:
+        try:
+            await self.handler(job)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            job.attempts += 1
+            job.last_error = f"{type(e).__name__}: {e}"[:500]
+            if isinstance(e, PermanentJobError) or job.attempts > self.max_retries:
+                logger.error("job %s failed permanently: %s", job.id, job.last_error)
+                self.stats.failed += 1
+                await self.queue.fail(job)
+            else:
+                delay = self.backoff(job.attempts)
+                logger.warning(
+                    "job %s failed (attempt %d), retry in %.1fs: %s",
+                    job.id,
+                    job.attempts,
+                    delay,
+                    job.last_error,
+                )
+                self.stats.retried += 1
+                await self.queue.retry(job, delay)
+        else:
+            self.stats.succeeded += 1
+            await self.queue.ack(job)
+
+    async def _wait(self, timeout: float) -> None:
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout)
+        except TimeoutError:
+            pass
+
+    async def _consume(self) -> None:
+        failures = 0
+        while not self._stopping.is_set():
+            try:
+                job = await self.queue.reserve(self.poll_timeout)
+                if job is not None:
+                    # ack/retry/fail 이 실패한 작업은 processing 에 남아 recover 로 회수
+                    await self._process(job)
+            except (RedisError, OSError) as e:
+                failures += 1
+                delay = self.backoff(failures)
+                logger.warning("job queue unavailable, retry in %.1fs: %s", delay, e)
+                await self._wait(delay)
+            else:
+                failures = 0
+
+    async def _promote(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await self.queue.promote_due()
+                await self.queue.heartbeat()
+            except (RedisError, OSError) as e:
+                logger.warning("job queue maintenance failed: %s", e)
+            await self._wait(self.poll_timeout)
+
+    def _task_done(self, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("%s crashed, stopping pool", task.get_name())
+            self._stopping.set()
+
+    async def start(self) -> None:
+        self._stopping.clear()
+        self._tasks = [
+            asyncio.create_task(self._consume(), name=f"lyrics-worker-{i}")
+            for i in range(self.concurrency)
+        ]
+        self._tasks.append(asyncio.create_task(self._promote(), name="lyrics-promoter"))
+        for task in self._tasks:
+            task.add_done_callback(self._task_done)
+
+    async def stop(self) -> None:
+        """새 작업 수신을 멈추고 처리 중인 작업이 끝날 때까지 대기"""
+        self._stopping.set()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    async def run(self) -> None:
+        await self.start()
+        tasks = list(self._tasks)
+        try:
+            await self._stopping.wait()
+        finally:
+            await self.stop()
+        for task in tasks:
+            if not task.cancelled() and (error := task.exception()) is not None:
+                raise RuntimeError(f"{task.get_name()} crashed") from error
+
+    def request_stop(self) -> None:
+        self._stopping.set()
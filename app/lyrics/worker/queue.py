@@ -0,0 +1,203 @@
+"""
+가사 생성 작업 큐
+
+RedisJobQueue (운영)
+    pending(list) --BLMOVE--> processing:<consumer>(list) --ack--> 삭제
+                                         |--retry--> delayed(zset, score=실행 시각)
+                                         |--fail---> dead(list)
+    처리 중 프로세스가 죽어도 processing 리스트에 남아 있으므로 recover() 로 되살립니다.
+    소비자 이름은 hostname:pid 라 재시작하면 바뀌므로, 각 소비자는 consumers:<이름>
+    키(TTL)로 생존을 알리고(heartbeat), 이 키가 만료된 소비자의 processing 리스트는
+    다른 워커가 회수합니다 (기동 시 recover() 와 이후 heartbeat_ttl 마다).
+
+MemoryJobQueue (로컬/테스트)
+    같은 인터페이스를 프로세스 메모리로 구현, 내구성 없음
+"""
+
+import asyncio
+import heapq
+import logging
+import os
+import socket
+import time
+from typing import Protocol
+
+from redis.asyncio import Redis
+
+from app.lyrics.worker.jobs import GenerationJob
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueue(Protocol):
+    async def enqueue(self, *jobs: GenerationJob) -> None: ...
+
+    async def reserve(self, timeout: float) -> GenerationJob | None: ...
+
+    async def ack(self, job: GenerationJob) -> None: ...
+
+    async def retry(self, job: GenerationJob, delay: float) -> None: ...
+
+    async def fail(self, job: GenerationJob) -> None: ...
+
+    async def promote_due(self) -> int: ...
+
+    async def heartbeat(self) -> int: ...
+
+
+def default_consumer_name() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class RedisJobQueue:
+    def __init__(
+        self,
+        redis: Redis,
+        *,
+        name: str = "lyrics:jobs",
+        consumer: str | None = None,
+        heartbeat_ttl: float = 30.0,
+    ):
+        self.redis = redis
+        self.name = name
+        self.consumer = consumer or default_consumer_name()
+        self.pending_key = f"{name}:pending"
+        self.delayed_key = f"{name}:delayed"
+        self.dead_key = f"{name}:dead"
+        self.processing_key = f"{name}:processing:{self.consumer}"
+        self.heartbeat_key = f"{name}:consumers:{self.consumer}"
+        self.heartbeat_ttl = heartbeat_ttl
+        self._reclaimed_at = 0.0
+        # reserve 한 작업의 원본 payload (ack/LREM 은 바이트 단위로 일치해야 함)
+        self._reserved: dict[str, bytes | str] = {}
+
+    async def enqueue(self, *jobs: GenerationJob) -> None:
+        if jobs:
+            await self.redis.rpush(self.pending_key, *(job.dumps() for job in jobs))
+
+    async def reserve(self, timeout: float) -> GenerationJob | None:
+        payload = await self.redis.blmove(
+            self.pending_key, self.processing_key, timeout, "LEFT", "RIGHT"
+        )
+        if payload is None:
+            return None
+        job = GenerationJob.loads(payload)
+        self._reserved[job.id] = payload
+        return job
+
+    async def ack(self, job: GenerationJob) -> None:
+        payload = self._reserved.pop(job.id, None) or job.dumps()
+        await self.redis.lrem(self.processing_key, 1, payload)
+
+    async def retry(self, job: GenerationJob, delay: float) -> None:
+        original = self._reserved.pop(job.id, None) or job.dumps()
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.zadd(self.delayed_key, {job.dumps(): time.time() + delay})
+            pipe.lrem(self.processing_key, 1, original)
+            await pipe.execute()
+
+    async def fail(self, job: GenerationJob) -> None:
+        original = self._reserved.pop(job.id, None) or job.dumps()
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.rpush(self.dead_key, job.dumps())
+            pipe.lrem(self.processing_key, 1, original)
+            await pipe.execute()
+
+    async def promote_due(self, limit: int = 100) -> int:
+        """실행 시각이 지난 지연 작업을 pending 으로 이동
+
+        여러 프로세스가 동시에 호출해도 ZREM 에 성공한 쪽만 옮기므로 중복되지 않습니다.
+        """
+        due = await self.redis.zrangebyscore(
+            self.delayed_key, "-inf", time.time(), start=0, num=limit
+        )
+        moved = 0
+        for payload in due:
+            if await self.redis.zrem(self.delayed_key, payload):
+                await self.redis.rpush(self.pending_key, payload)
+                moved += 1
+        return moved
+
+    async def _requeue(self, processing_key: bytes | str) -> int:
+        moved = 0
+        while await self.redis.lmove(processing_key, self.pending_key, "RIGHT", "LEFT"):
+            moved += 1
+        return moved
+
+    async def heartbeat(self) -> int:
+        """생존 표시를 갱신하고, heartbeat_ttl 마다 죽은 소비자의 작업을 회수"""
+        await self.redis.set(self.heartbeat_key, 1, px=int(self.heartbeat_ttl * 1000))
+        now = time.monotonic()
+        if now - self._reclaimed_at < self.heartbeat_ttl:
+            return 0
+        self._reclaimed_at = now
+        return await self.reclaim_orphans()
+
+    async def reclaim_orphans(self) -> int:
+        """생존 표시가 만료된 소비자의 processing 리스트를 pending 으로 되돌림"""
+        prefix = f"{self.name}:processing:"
+        moved = 0
+        async for key in self.redis.scan_iter(match=f"{prefix}*"):
+            consumer = (key.decode() if isinstance(key, bytes) else key)[len(prefix) :]
+            if consumer == self.consumer or await self.redis.exists(
+                f"{self.name}:consumers:{consumer}"
+            ):
+                continue
+            count = await self._requeue(key)
+            if count:
+                logger.warning("requeued %d jobs of dead consumer %s", count, consumer)
+            moved += count
+        return moved
+
+    async def recover(self) -> int:
+        """이전 실행과 죽은 소비자가 처리 중이던(ack 되지 않은) 작업을 pending 으로"""
+        await self.redis.set(self.heartbeat_key, 1, px=int(self.heartbeat_ttl * 1000))
+        moved = await self._requeue(self.processing_key)
+        self._reclaimed_at = time.monotonic()
+        return moved + await self.reclaim_orphans()
+
+
+class MemoryJobQueue:
+    def __init__(self):
+        self._pending: asyncio.Queue[GenerationJob] = asyncio.Queue()
+        self._delayed: list[tuple[float, int, GenerationJob]] = []
+        self._seq = 0
+        self.processing: dict[str, GenerationJob] = {}
+        self.dead: list[GenerationJob] = []
+
+    async def enqueue(self, *jobs: GenerationJob) -> None:
+        for job in jobs:
+            self._pending.put_nowait(job)
+
+    async def reserve(self, timeout: float) -> GenerationJob | None:
+        try:
+            job = await asyncio.wait_for(self._pending.get(), timeout)
+        except TimeoutError:
+            return None
+        self.processing[job.id] = job
+        return job
+
+    async def ack(self, job: GenerationJob) -> None:
+        self.processing.pop(job.id, None)
+
+    async def retry(self, job: GenerationJob, delay: float) -> None:
+        self.processing.pop(job.id, None)
+        self._seq += 1
+        heapq.heappush(self._delayed, (time.monotonic() + delay, self._seq, job))
+
+    async def fail(self, job: GenerationJob) -> None:
+        self.processing.pop(job.id, None)
+        self.dead.append(job)
+
+    async def promote_due(self) -> int:
+        now, moved = time.monotonic(), 0
+        while self._delayed and self._delayed[0][0] <= now:
+            self._pending.put_nowait(heapq.heappop(self._delayed)[2])
+            moved += 1
+        return moved
+
+    async def heartbeat(self) -> int:
+        return 0
+
+    def qsize(self) -> int:
+        return self._pending.qsize() + len(self._delayed)
@@ -0,0 +1,6 @@
+"""
+Media 모듈
+
+업로드(재개 가능한 스트리밍 업로드)와 업로드 후처리, Range 스트리밍(/media)을
+제공하는 패키지입니다.
+"""
@@ -0,0 +1,5 @@
+"""
+Media API 패키지
+
+업로드 관련 API 라우터를 제공합니다.
+"""
@@ -0,0 +1,138 @@
+import logging
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Request,
+    Response,
+    status,
+)
+from pydantic import BaseModel, Field
+from starlette.requests import ClientDisconnect
+
+from app.dependencies.permissions import require_permissions
+from app.dependencies.rate_limit import rate_limit
+from app.media.processing import processing_pool
+from app.media.storage import (
+    UploadError,
+    UploadSession,
+    parse_checksum,
+    upload_store,
+)
+from config import media_settings
+
+logger = logging.getLogger(__name__)
+
+# /media 는 파일 마운트가 먼저 잡으므로 업로드 API 는 /uploads
+# 디스크에 쓰는 API 라 media:upload 권한이 있는 사용자만 허용
+router = APIRouter(
+    prefix="/uploads",
+    tags=["media"],
+    dependencies=[Depends(require_permissions("media:upload"))],
+)
+
+
+class UploadCreate(BaseModel):
+    filename: str = Field(min_length=1, max_length=255)
+    size: int = Field(ge=1)
+    sha256: str | None = Field(default=None, pattern=r"^[0-9a-fA-F]{64}$")
+
+
+class UploadStatus(BaseModel):
+    id: str
+    offset: int
+    size: int
+    complete: bool = False
+    url: str | None = None
+    sha256: str | None = None
+    deduplicated: bool = False
+
+
+def _error(e: UploadError) -> HTTPException:
+    return HTTPException(status_code=e.status_code, detail=str(e))
+
+
+def _offset_headers(session: UploadSession, offset: int) -> dict[str, str]:
+    return {"Upload-Offset": str(offset), "Upload-Length": str(session.size)}
+
+
+@router.post(
+    "",
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(rate_limit(media_settings.MEDIA_UPLOAD_RATE_LIMIT))],
+)
+async def create_upload(body: UploadCreate, response: Response) -> UploadStatus:
+    """업로드 시작 (이후 PATCH 로 본문 전송, Content-Type 은 확장자로 결정)"""
+    try:
+        session = await upload_store.create(body.filename, body.size, body.sha256)
+    except UploadError as e:
+        raise _error(e) from None
+    response.headers["Location"] = f"{router.prefix}/{session.id}"
+    response.headers.update(_offset_headers(session, 0))
+    return UploadStatus(id=session.id, offset=0, size=session.size)
+
+
+@router.head("/{upload_id}")
+async def upload_offset(upload_id: str) -> Response:
+    """재개 위치 확인"""
+    try:
+        session = await upload_store.get(upload_id)
+        offset = await upload_store.offset(session)
+    except UploadError as e:
+        raise _error(e) from None
+    return Response(
+        headers={**_offset_headers(session, offset), "Cache-Control": "no-store"}
+    )
+
+
+@router.patch("/{upload_id}")
+async def append_upload(
+    upload_id: str,
+    request: Request,
+    response: Response,
+    upload_offset: int = Header(ge=0),
+    upload_checksum: str | None = Header(default=None),
+) -> UploadStatus:
+    """Upload-Offset 위치부터 본문을 이어 씀, 마지막 조각이면 저장 후 후처리 예약"""
+    try:
+        session = await upload_store.get(upload_id)
+        checksum = parse_checksum(upload_checksum) if upload_checksum else None
+        offset = await upload_store.append(
+            session, upload_offset, request.stream(), checksum
+        )
+    except UploadError as e:
+        raise _error(e) from None
+    except ClientDisconnect:
+        # 받은 만큼은 저장됨, 클라이언트가 HEAD 로 위치를 확인해 재개
+        logger.info("upload %s interrupted", upload_id)
+        raise HTTPException(status_code=400, detail="client disconnected") from None
+
+    response.headers.update(_offset_headers(session, offset))
+    if offset < session.size:
+        return UploadStatus(id=session.id, offset=offset, size=session.size)
+
+    try:
+        media = await upload_store.finalize(session)
+    except UploadError as e:
+        raise _error(e) from None
+    processing_pool.submit(media)
+    return UploadStatus(
+        id=session.id,
+        offset=offset,
+        size=session.size,
+        complete=True,
+        url=f"{media_settings.MEDIA_URL}/{media.name}",
+        sha256=media.sha256,
+        deduplicated=media.deduplicated,
+    )
+
+
+@router.delete("/{upload_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def cancel_upload(upload_id: str) -> None:
+    try:
+        await upload_store.get(upload_id)
+    except UploadError as e:
+        raise _error(e) from None
+    await upload_store.delete(upload_id)
@@ -0,0 +1,129 @@
+"""
+업로드 후처리 태스크 풀
+
+업로드 요청은 파일을 옮긴 뒤 submit() 으로 후처리를 넘기고 바로 응답합니다.
+고정된 수의 소비자 태스크가 제한된 큐에서 꺼내 처리하고, 큐가 가득 차면
+요청을 기다리게 하지 않고 버립니다 (media_processing_total{result="dropped"}).
+파일을 읽는 등 블로킹 작업은 프로세서 안에서 asyncio.to_thread 로 실행합니다.
+
+    processing_pool.register("audio/", extract_audio_info)
+"""
+
+import asyncio
+import json
+import logging
+import wave
+from collections.abc import Awaitable, Callable
+
+from app.core.metrics import Counter
+from app.media.storage import StoredMedia
+from config import media_settings
+
+logger = logging.getLogger(__name__)
+
+processed = Counter(
+    "media_processing_total", "업로드 후처리 결과 수", labelnames=("result",)
+)
+
+Processor = Callable[[StoredMedia], Awaitable[None]]
+
+
+class ProcessingPool:
+    def __init__(self, concurrency: int = 2, maxsize: int = 1000):
+        self.concurrency = concurrency
+        self._queue: asyncio.Queue[StoredMedia] = asyncio.Queue(maxsize)
+        # (content-type 접두어, 프로세서), 등록 순서대로 실행
+        self._processors: list[tuple[str, Processor]] = []
+        self._tasks: list[asyncio.Task] = []
+
+    def register(self, content_type: str, processor: Processor) -> None:
+        """content_type 으로 시작하는 업로드에 실행할 프로세서 ("" 는 전체)"""
+        self._processors.append((content_type, processor))
+
+    def submit(self, media: StoredMedia) -> bool:
+        try:
+            self._queue.put_nowait(media)
+        except asyncio.QueueFull:
+            logger.warning("media processing queue full, dropped %s", media.name)
+            processed.inc(result="dropped")
+            return False
+        return True
+
+    async def _run(self, media: StoredMedia) -> None:
+        for content_type, processor in self._processors:
+            if not media.content_type.startswith(content_type):
+                continue
+            try:
+                await processor(media)
+            except Exception:
+                logger.exception("media processor failed: %s", media.name)
+                processed.inc(result="failed")
+                return
+        processed.inc(result="ok")
+
+    async def _consume(self) -> None:
+        while True:
+            media = await self._queue.get()
+            try:
+                await self._run(media)
+            finally:
+                self._queue.task_done()
+
+    async def join(self) -> None:
+        """큐에 있는 작업이 모두 끝날 때까지 대기"""
+        await self._queue.join()
+
+    def start(self) -> None:
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._consume(), name=f"media-processing-{i}")
+                for i in range(self.concurrency)
+            ]
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """남은 작업을 timeout 동안 처리한 뒤 종료"""
+        if not self._tasks:
+            return
+        try:
+            await asyncio.wait_for(self.join(), timeout)
+        except TimeoutError:
+            logger.warning(
+                "media processing stopped with %d queued", self._queue.qsize()
+            )
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+
+def _audio_info(media: StoredMedia) -> dict:
+    info = {
+        "sha256": media.sha256,
+        "size": media.size,
+        "content_type": media.content_type,
+        "filename": media.filename,
+    }
+    try:
+        with wave.open(str(media.path), "rb") as audio:
+            info["duration"] = audio.getnframes() / audio.getframerate()
+            info["channels"] = audio.getnchannels()
+            info["sample_rate"] = audio.getframerate()
+    except (wave.Error, EOFError):
+        pass  # WAV 외 형식은 기본 정보만
+    return info
+
+
+async def extract_audio_info(media: StoredMedia) -> None:
+    """<파일>.json 에 크기/해시/(WAV 면) 길이 기록"""
+    if media.deduplicated:
+        return  # 같은 내용을 이미 처리함
+    info = await asyncio.to_thread(_audio_info, media)
+    sidecar = media.path.with_name(media.path.name + ".json")
+    await asyncio.to_thread(sidecar.write_text, json.dumps(info, ensure_ascii=False))
+
+
+processing_pool = ProcessingPool(
+    concurrency=media_settings.MEDIA_PROCESSING_CONCURRENCY,
+    maxsize=media_settings.MEDIA_PROCESSING_QUEUE_SIZE,
+)
+processing_pool.register("audio/", extract_audio_info)
@@ -0,0 +1,399 @@
+"""
+재개 가능한 업로드 저장소
+
+    POST  /uploads        {"filename", "size", "sha256"?}  -> 업로드 ID
+    PATCH /uploads/{id}   Upload-Offset: <이어 쓸 위치>, 본문 = 그 위치부터의 바이트
+                          (선택) Upload-Checksum: sha256 <이번 본문의 base64 digest>
+    HEAD  /uploads/{id}   Upload-Offset (연결이 끊긴 뒤 재개할 위치)
+
+본문은 메모리에 모으지 않고 chunk_size 단위로 <MEDIA_DIR>/.uploads/<id>.part 에
+이어 씁니다. 쓰는 동안 SHA-256 을 함께 계산하고, 마지막 바이트가 들어오면
+<MEDIA_DIR>/files/<해시 앞 2자>/<해시><확장자> 로 옮깁니다. 같은 내용이 이미
+있으면 새 파일을 버리고 기존 파일을 돌려줍니다 (중복 제거).
+
+업로드 상태는 .uploads/<id>.json 과 .part 파일 크기뿐이라 워커가 달라도 이어서
+받을 수 있습니다. 진행 중 해시 상태는 프로세스 메모리에 두며, 다른 워커에서
+재개하면 지금까지 받은 부분을 한 번 다시 읽어 계산합니다.
+
+확장자는 MEDIA_UPLOAD_TYPES (음원/가사) 만 받고 Content-Type 도 확장자로 정합니다.
+expiry 초 동안 이어 쓰지 않은 업로드는 start() 로 띄운 정리 작업이 지웁니다.
+"""
+
+import asyncio
+import base64
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+import uuid
+from collections.abc import AsyncIterator, Mapping
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from fastapi import status
+
+from config import media_settings
+
+logger = logging.getLogger(__name__)
+
+_UPLOAD_ID = re.compile(r"[0-9a-f]{32}")
+_READ_SIZE = 1024 * 1024
+
+
+class UploadError(Exception):
+    status_code = status.HTTP_400_BAD_REQUEST
+
+
+class UploadNotFound(UploadError):
+    status_code = status.HTTP_404_NOT_FOUND
+
+
+class OffsetMismatch(UploadError):
+    """Upload-Offset 이 서버가 받은 크기와 다름 (HEAD 로 다시 확인)"""
+
+    status_code = status.HTTP_409_CONFLICT
+
+
+class UploadLocked(UploadError):
+    """같은 업로드를 다른 요청이 쓰는 중"""
+
+    status_code = status.HTTP_409_CONFLICT
+
+
+class UploadTooLarge(UploadError):
+    status_code = status.HTTP_413_CONTENT_TOO_LARGE
+
+
+class UnsupportedMediaType(UploadError):
+    status_code = status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+
+class ChecksumMismatch(UploadError):
+    # tus 체크섬 확장과 같은 상태 코드
+    status_code = 460
+
+
+@dataclass(slots=True)
+class UploadSession:
+    id: str
+    filename: str
+    size: int
+    content_type: str
+    sha256: str | None = None  # 클라이언트가 알려 준 전체 파일 해시 (선택)
+    created_at: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class StoredMedia:
+    sha256: str
+    size: int
+    path: Path
+    name: str  # MEDIA_DIR 기준 상대 경로 (URL 에 사용)
+    content_type: str
+    filename: str
+    deduplicated: bool
+
+
+def _write(file, data: bytearray, hashers: list) -> None:
+    # 쓰기와 해시 갱신을 한 스레드 작업으로 (hashlib 은 큰 버퍼에서 GIL 을 놓음)
+    file.write(data)
+    for hasher in hashers:
+        hasher.update(data)
+
+
+def _hash_file(path: Path) -> "hashlib._Hash":
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(_READ_SIZE):
+            hasher.update(block)
+    return hasher
+
+
+def _open_locked(path: Path, mode: str = "ab"):
+    file = open(path, mode)
+    try:
+        fcntl.flock(file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        file.close()
+        raise UploadLocked("upload in progress") from None
+    return file
+
+
+class UploadStore:
+    def __init__(
+        self,
+        root: str | Path,
+        chunk_size: int = 1024 * 1024,
+        max_size: int = 4 * 1024**3,
+        types: Mapping[str, str] | None = None,
+        expiry: float = 24 * 3600,
+    ):
+        self.root = Path(root)
+        self.incoming = self.root / ".uploads"
+        self.files = self.root / "files"
+        self.chunk_size = chunk_size
+        self.max_size = max_size
+        # 허용 확장자 -> Content-Type
+        self.types = dict(types or media_settings.MEDIA_UPLOAD_TYPES)
+        self.expiry = expiry
+        # 업로드 ID -> (해시한 바이트 수, 진행 중 SHA-256)
+        self._hashers: dict[str, tuple[int, "hashlib._Hash"]] = {}
+        self._task: asyncio.Task | None = None
+
+    def _paths(self, upload_id: str) -> tuple[Path, Path]:
+        if not _UPLOAD_ID.fullmatch(upload_id):
+            raise UploadNotFound("upload not found")
+        return (
+            self.incoming / f"{upload_id}.json",
+            self.incoming / f"{upload_id}.part",
+        )
+
+    async def create(
+        self,
+        filename: str,
+        size: int,
+        sha256: str | None = None,
+    ) -> UploadSession:
+        if size > self.max_size:
+            raise UploadTooLarge(f"upload exceeds {self.max_size} bytes")
+        filename = os.path.basename(filename)
+        content_type = self.types.get(Path(filename).suffix.lower())
+        if content_type is None:
+            raise UnsupportedMediaType(
+                f"allowed file types: {', '.join(sorted(self.types))}"
+            )
+        session = UploadSession(
+            id=uuid.uuid4().hex,
+            filename=filename,
+            size=size,
+            content_type=content_type,
+            sha256=sha256.lower() if sha256 else None,
+            created_at=time.time(),
+        )
+        meta, part = self._paths(session.id)
+
+        def write() -> None:
+            self.incoming.mkdir(parents=True, exist_ok=True)
+            part.touch()
+            meta.write_text(json.dumps(asdict(session)))
+
+        await asyncio.to_thread(write)
+        return session
+
+    async def get(self, upload_id: str) -> UploadSession:
+        meta, _ = self._paths(upload_id)
+        try:
+            data = await asyncio.to_thread(meta.read_text)
+        except FileNotFoundError:
+            raise UploadNotFound("upload not found") from None
+        return UploadSession(**json.loads(data))
+
+    async def offset(self, session: UploadSession) -> int:
+        _, part = self._paths(session.id)
+        try:
+            return (await asyncio.to_thread(os.stat, part)).st_size
+        except FileNotFoundError:
+            raise UploadNotFound("upload not found") from None
+
+    async def _hasher(self, session: UploadSession, offset: int) -> "hashlib._Hash":
+        cached = self._hashers.pop(session.id, None)
+        if cached is not None and cached[0] == offset:
+            return cached[1]
+        _, part = self._paths(session.id)
+        return await asyncio.to_thread(_hash_file, part)
+
+    async def append(
+        self,
+        session: UploadSession,
+        offset: int,
+        chunks: AsyncIterator[bytes],
+        checksum: tuple[str, bytes] | None = None,
+    ) -> int:
+        """offset 부터 본문을 이어 쓰고 새 offset 반환
+
+        checksum: (알고리즘, digest) 이번 본문의 체크섬, 다르면 쓰기 전 상태로 되돌림
+        """
+        _, part = self._paths(session.id)
+        file = await asyncio.to_thread(_open_locked, part)
+        try:
+            current = file.tell()
+            if offset != current:
+                raise OffsetMismatch(f"expected offset {current}")
+            remaining = session.size - current
+            hasher = await self._hasher(session, current)
+            hashers = [hasher]
+            if checksum is not None:
+                hashers.append(hashlib.new(checksum[0]))
+
+            received = 0
+            buffer = bytearray()
+            try:
+                async for data in chunks:
+                    received += len(data)
+                    if received > remaining:
+                        raise UploadTooLarge("body exceeds declared upload size")
+                    buffer += data
+                    if len(buffer) >= self.chunk_size:
+                        await asyncio.to_thread(_write, file, buffer, hashers)
+                        buffer.clear()
+                if buffer:
+                    await asyncio.to_thread(_write, file, buffer, hashers)
+                await asyncio.to_thread(file.flush)
+            except BaseException:
+                # 중간에 끊기면 받은 만큼 남겨 두고 재개 (해시는 다음에 다시 계산)
+                # 체크섬을 준 요청은 검증할 수 없으므로 요청 전 상태로 되돌림
+                if checksum is not None:
+                    await asyncio.to_thread(file.truncate, current)
+                elif buffer:
+                    await asyncio.to_thread(_write, file, buffer, [])
+                raise
+
+            if checksum is not None and hashers[1].digest() != checksum[1]:
+                await asyncio.to_thread(file.truncate, current)
+                raise ChecksumMismatch("checksum mismatch")
+            self._hashers[session.id] = (current + received, hasher)
+            return current + received
+        finally:
+            await asyncio.to_thread(file.close)
+
+    def _discard(self, upload_id: str) -> None:
+        for path in self._paths(upload_id):
+            path.unlink(missing_ok=True)
+
+    async def delete(self, upload_id: str) -> None:
+        """업로드 취소"""
+        self._hashers.pop(upload_id, None)
+        await asyncio.to_thread(self._discard, upload_id)
+
+    async def finalize(self, session: UploadSession) -> StoredMedia:
+        """모두 받은 업로드를 내용 주소 경로로 옮김 (이미 있으면 중복 제거)
+
+        .part 잠금을 잡은 채 처리하므로 같은 업로드를 동시에 완료하는 요청 중 하나만
+        옮기고, 나머지는 UploadLocked / UploadNotFound 가 됩니다.
+        """
+        meta, part = self._paths(session.id)
+        suffix = Path(session.filename).suffix.lower()
+        if suffix not in self.types:
+            raise UnsupportedMediaType("file type not allowed")
+        try:
+            file = await asyncio.to_thread(_open_locked, part, "rb")
+        except FileNotFoundError:
+            raise UploadNotFound("upload not found") from None
+        try:
+            # 잠금을 잡기 전에 다른 요청이 먼저 완료해 옮겼을 수 있음
+            if not await asyncio.to_thread(part.exists):
+                raise UploadNotFound("upload not found")
+            digest = (await self._hasher(session, session.size)).hexdigest()
+            self._hashers.pop(session.id, None)
+            if session.sha256 is not None and digest != session.sha256:
+                await asyncio.to_thread(self._discard, session.id)
+                raise ChecksumMismatch("file checksum mismatch")
+
+            target = self.files / digest[:2] / f"{digest}{suffix}"
+
+            def store() -> bool:
+                deduplicated = target.exists()
+                if deduplicated:
+                    part.unlink()
+                else:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    os.replace(part, target)
+                meta.unlink(missing_ok=True)
+                return deduplicated
+
+            deduplicated = await asyncio.to_thread(store)
+        except FileNotFoundError:
+            raise UploadNotFound("upload not found") from None
+        finally:
+            await asyncio.to_thread(file.close)
+        return StoredMedia(
+            sha256=digest,
+            size=session.size,
+            path=target,
+            name=target.relative_to(self.root).as_posix(),
+            content_type=session.content_type,
+            filename=session.filename,
+            deduplicated=deduplicated,
+        )
+
+    def _expire(self, now: float) -> list[str]:
+        expired = []
+        if not self.incoming.is_dir():
+            return expired
+        for part in self.incoming.glob("*.part"):
+            upload_id = part.stem
+            try:
+                if now - part.stat().st_mtime < self.expiry:
+                    continue
+                file = _open_locked(part, "rb")
+            except (FileNotFoundError, UploadLocked):
+                continue  # 이미 완료됐거나 지금 쓰는 중
+            try:
+                self._discard(upload_id)
+            finally:
+                file.close()
+            expired.append(upload_id)
+        # .part 없이 남은 메타데이터 (생성 도중 실패 등)
+        for meta in self.incoming.glob("*.json"):
+            try:
+                if (
+                    now - meta.stat().st_mtime >= self.expiry
+                    and not meta.with_suffix(".part").exists()
+                ):
+                    meta.unlink(missing_ok=True)
+            except FileNotFoundError:
+                pass
+        return expired
+
+    async def expire(self) -> int:
+        """expiry 초 동안 이어 쓰지 않은 업로드 삭제, 삭제한 수 반환"""
+        expired = await asyncio.to_thread(self._expire, time.time())
+        for upload_id in expired:
+            self._hashers.pop(upload_id, None)
+        if expired:
+            logger.info("expired %d abandoned uploads", len(expired))
+        return len(expired)
+
+    async def _sweep_loop(self, interval: float) -> None:
+        while True:
+            try:
+                await self.expire()
+            except OSError:
+                logger.warning("upload sweep failed", exc_info=True)
+            await asyncio.sleep(interval)
+
+    def start(self, interval: float = 3600) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(
+                self._sweep_loop(interval), name="upload-sweep"
+            )
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+def parse_checksum(header: str) -> tuple[str, bytes]:
+    """Upload-Checksum: "<알고리즘> <base64 digest>" """
+    algorithm, _, value = header.strip().partition(" ")
+    algorithm = algorithm.lower()
+    if algorithm not in ("sha1", "sha256", "md5"):
+        raise UploadError(f"unsupported checksum algorithm: {algorithm}")
+    try:
+        return algorithm, base64.b64decode(value, validate=True)
+    except ValueError:
+        raise UploadError("malformed Upload-Checksum") from None
+
+
+upload_store = UploadStore(
+    media_settings.MEDIA_DIR,
+    chunk_size=media_settings.MEDIA_UPLOAD_CHUNK_SIZE,
+    max_size=media_settings.MEDIA_MAX_UPLOAD_SIZE,
+    types=media_settings.MEDIA_UPLOAD_TYPES,
+    expiry=media_settings.MEDIA_UPLOAD_EXPIRY,
+)
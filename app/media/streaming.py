@@ -0,0 +1,420 @@
+"""
+미디어 스트리밍 (/media)
+
+플레이어는 곡을 탐색할 때마다 Range 요청을 보냅니다. StaticFiles 는 요청마다
+경로 확인(realpath + stat)과 open 을 반복하므로, MediaFiles 는 열린 파일을 재사용합니다.
+
+- 열린 파일 LRU (OpenFileCache): 요청 경로 -> (fd, stat, ETag, Last-Modified).
+  MEDIA_STAT_TTL 이 지난 항목만 stat 으로 바뀌었는지 확인하고, 내용 주소 경로
+  (files/<해시>) 는 바뀌지 않으므로 확인하지 않습니다 (1년 immutable 캐시).
+- Range: 단일 구간은 206 + Content-Range, 여러 구간은 multipart/byteranges.
+  겹치거나 붙은 구간은 합치고, If-Range 가 현재 ETag/Last-Modified 와 다르면
+  전체를 보냅니다.
+- 전송: 서버가 ASGI zerocopysend 확장을 지원하면 캐시한 fd 그대로 sendfile,
+  pathsend 만 있으면 전체 응답은 경로로 넘기고, 그 외에는 os.pread 로 읽어 보냅니다
+  (fd 를 여러 요청이 공유해도 파일 위치를 바꾸지 않음).
+  탐색으로 끊긴 요청은 http.disconnect 를 받는 즉시 읽기를 멈춥니다.
+"""
+
+import asyncio
+import io
+import mimetypes
+import os
+import re
+import secrets
+import stat
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from email.utils import formatdate
+
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Receive, Scope, Send
+
+from app.utils.static import IMMUTABLE
+
+_RANGE = re.compile(r"(\d*)-(\d*)", re.ASCII)
+# UploadStore 가 내용 해시 이름으로 저장하는 위치 (내용이 바뀌지 않음)
+_CONTENT_ADDRESSED = "files" + os.sep
+# 브라우저에서 바로 재생/표시해도 되는 형식, 그 외는 내려받기 (업로드 파일의 XSS 방지)
+INLINE_TYPES = ("audio/", "text/plain")
+
+
+class OpenFile:
+    __slots__ = (
+        "path",
+        "fd",
+        "stat",
+        "etag",
+        "last_modified",
+        "checked_at",
+        "refs",
+        "evicted",
+    )
+
+    def __init__(self, path: str, fd: int, stat_result: os.stat_result):
+        self.path = path
+        self.fd = fd
+        self.stat = stat_result
+        self.etag = f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+        self.last_modified = formatdate(stat_result.st_mtime, usegmt=True)
+        self.checked_at = time.monotonic()
+        self.refs = 0  # 이 fd 로 전송 중인 응답 수
+        self.evicted = False
+
+    @property
+    def size(self) -> int:
+        return self.stat.st_size
+
+
+def _open(path: str) -> tuple[int, os.stat_result]:
+    fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        stat_result = os.fstat(fd)
+    except BaseException:
+        os.close(fd)
+        raise
+    if not stat.S_ISREG(stat_result.st_mode):
+        os.close(fd)
+        raise FileNotFoundError(path)
+    return fd, stat_result
+
+
+def _unchanged(a: os.stat_result, b: os.stat_result) -> bool:
+    return (a.st_ino, a.st_size, a.st_mtime_ns) == (b.st_ino, b.st_size, b.st_mtime_ns)
+
+
+class OpenFileCache:
+    """요청 경로 -> OpenFile LRU
+
+    acquire() 로 받은 항목은 release() 전까지 닫히지 않습니다. 밀려나거나 바뀐 파일은
+    목록에서 빼고, 전송 중인 응답이 모두 끝나면 닫습니다.
+    모든 메서드는 이벤트 루프 스레드에서 호출합니다.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 2.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._files: OrderedDict[str, OpenFile] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def _hit(self, key: str, entry: OpenFile) -> OpenFile:
+        self._files.move_to_end(key)
+        entry.refs += 1
+        self.hits += 1
+        return entry
+
+    async def acquire(
+        self, key: str, resolve: Callable[[str], str], immutable: bool = False
+    ) -> OpenFile:
+        """key 의 열린 파일 (없으면 resolve(key) 경로를 열어 추가)
+
+        파일이 없거나 일반 파일이 아니면 FileNotFoundError
+        """
+        entry = self._files.get(key)
+        if entry is not None:
+            if immutable or time.monotonic() - entry.checked_at < self.ttl:
+                return self._hit(key, entry)
+            try:
+                current = await asyncio.to_thread(os.stat, entry.path)
+            except FileNotFoundError:
+                current = None
+            # stat 을 기다리는 동안 다른 요청이 항목을 바꿨을 수 있음
+            if self._files.get(key) is entry:
+                if current is not None and _unchanged(current, entry.stat):
+                    entry.checked_at = time.monotonic()
+                    return self._hit(key, entry)
+                self._evict(key)
+
+        def load() -> tuple[str, int, os.stat_result]:
+            path = resolve(key)
+            return (path, *_open(path))
+
+        path, fd, stat_result = await asyncio.to_thread(load)
+        self.misses += 1
+        existing = self._files.get(key)
+        if existing is not None:
+            # 동시에 같은 파일을 연 요청이 먼저 등록함
+            os.close(fd)
+            existing.refs += 1
+            return existing
+        entry = self._files[key] = OpenFile(path, fd, stat_result)
+        entry.refs += 1
+        while len(self._files) > self.maxsize:
+            self._evict(next(iter(self._files)))
+        return entry
+
+    def release(self, entry: OpenFile) -> None:
+        entry.refs -= 1
+        if entry.evicted and entry.refs == 0:
+            os.close(entry.fd)
+
+    def _evict(self, key: str) -> None:
+        entry = self._files.pop(key)
+        entry.evicted = True
+        if entry.refs == 0:
+            os.close(entry.fd)
+
+    def clear(self) -> None:
+        for key in list(self._files):
+            self._evict(key)
+
+
+def parse_ranges(header: str, size: int) -> list[tuple[int, int]] | None:
+    """Range 헤더 -> 정렬하고 합친 [start, end) 목록
+
+    형식이 틀리면 None (헤더 무시, 전체 전송), 만족하는 구간이 없으면 [] (416)
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes":
+        return None
+    ranges: list[tuple[int, int]] = []
+    parts = [part.strip() for part in spec.split(",") if part.strip()]
+    if not parts:
+        return None
+    for part in parts:
+        match = _RANGE.fullmatch(part)
+        if match is None:
+            return None
+        first, last = match.groups()
+        if first:
+            start = int(first)
+            if last and int(last) < start:
+                return None
+            end = min(int(last) + 1, size) if last else size
+        elif last:
+            # bytes=-N: 마지막 N 바이트
+            start, end = max(size - int(last), 0), size
+        else:
+            return None
+        if start < end:
+            ranges.append((start, end))
+
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(end, merged[-1][1]))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class MediaResponse(Response):
+    """캐시한 fd 로 전체/구간 전송, 끝나면 release() 호출"""
+
+    def __init__(
+        self,
+        file: OpenFile,
+        release: Callable[[OpenFile], None],
+        ranges: list[tuple[int, int]] | None = None,
+        headers: dict[str, str] | None = None,
+        media_type: str = "application/octet-stream",
+        chunk_size: int = 256 * 1024,
+    ):
+        self.file = file
+        self.release = release
+        self.ranges = ranges or [(0, file.size)]
+        self.chunk_size = chunk_size
+        self.background = None
+        self.status_code = 206 if ranges else 200
+        self.media_type = media_type
+        self.init_headers(headers)
+
+        if len(self.ranges) == 1:
+            start, end = self.ranges[0]
+            self.parts = [(b"", start, end)]
+            self.trailer = b""
+            if ranges:
+                self.headers["content-range"] = f"bytes {start}-{end - 1}/{file.size}"
+        else:
+            boundary = secrets.token_hex(13)
+            self.parts = [
+                (
+                    (
+                        ("\r\n" if i else "") + f"--{boundary}\r\n"
+                        f"Content-Type: {media_type}\r\n"
+                        f"Content-Range: bytes {start}-{end - 1}/{file.size}\r\n\r\n"
+                    ).encode("latin-1"),
+                    start,
+                    end,
+                )
+                for i, (start, end) in enumerate(self.ranges)
+            ]
+            self.trailer = f"\r\n--{boundary}--\r\n".encode("latin-1")
+            self.headers["content-type"] = f"multipart/byteranges; boundary={boundary}"
+        self.headers["content-length"] = str(
+            sum(len(head) + end - start for head, start, end in self.parts)
+            + len(self.trailer)
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        disconnected = asyncio.Event()
+
+        async def watch() -> None:
+            while (await receive())["type"] != "http.disconnect":
+                pass
+            disconnected.set()
+
+        watcher = asyncio.create_task(watch())
+        try:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": self.status_code,
+                    "headers": self.raw_headers,
+                }
+            )
+            if scope["method"] == "HEAD":
+                await send({"type": "http.response.body", "body": b""})
+            else:
+                await self._send_body(scope, send, disconnected)
+        finally:
+            watcher.cancel()
+            self.release(self.file)
+
+    async def _send_body(
+        self, scope: Scope, send: Send, disconnected: asyncio.Event
+    ) -> None:
+        extensions = scope.get("extensions") or {}
+        if "http.response.zerocopysend" in extensions:
+            # 서버가 fd 로 sendfile (파일 위치를 쓰지 않도록 offset 지정)
+            with io.FileIO(self.file.fd, "rb", closefd=False) as fileobj:
+                for head, start, end in self.parts:
+                    if head:
+                        await send(
+                            {
+                                "type": "http.response.body",
+                                "body": head,
+                                "more_body": True,
+                            }
+                        )
+                    await send(
+                        {
+                            "type": "http.response.zerocopysend",
+                            "file": fileobj,
+                            "offset": start,
+                            "count": end - start,
+                            "more_body": True,
+                        }
+                    )
+            await send({"type": "http.response.body", "body": self.trailer})
+            return
+        if self.status_code == 200 and "http.response.pathsend" in extensions:
+            await send({"type": "http.response.pathsend", "path": self.file.path})
+            return
+
+        for head, start, end in self.parts:
+            if head:
+                await send(
+                    {"type": "http.response.body", "body": head, "more_body": True}
+                )
+            offset = start
+            while offset < end:
+                if disconnected.is_set():
+                    return
+                data = await asyncio.to_thread(
+                    os.pread, self.file.fd, min(self.chunk_size, end - offset), offset
+                )
+                if not data:  # 전송 중 파일이 잘림
+                    raise RuntimeError(f"{self.file.path} truncated while streaming")
+                offset += len(data)
+                await send(
+                    {"type": "http.response.body", "body": data, "more_body": True}
+                )
+        await send({"type": "http.response.body", "body": self.trailer})
+
+
+class MediaFiles(StaticFiles):
+    """GET/HEAD 전용 미디어 파일 앱 (Range + 열린 파일 캐시)"""
+
+    def __init__(
+        self,
+        *args,
+        open_files: OpenFileCache | None = None,
+        chunk_size: int = 256 * 1024,
+        max_ranges: int = 16,
+        cache_control: str = "no-cache",
+        inline_types: tuple[str, ...] = INLINE_TYPES,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.open_files = open_files if open_files is not None else OpenFileCache()
+        self.chunk_size = chunk_size
+        self.max_ranges = max_ranges
+        self.cache_control = cache_control  # 내용 주소 경로가 아닌 파일
+        self.inline_types = inline_types
+
+    def resolve(self, path: str) -> str:
+        full_path, stat_result = self.lookup_path(path)
+        if stat_result is None:
+            raise FileNotFoundError(path)
+        return full_path
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if scope["method"] not in ("GET", "HEAD"):
+            raise HTTPException(status_code=405, headers={"Allow": "GET, HEAD"})
+        # 업로드 중인 .uploads/ 등 숨김 경로는 노출하지 않음
+        if any(part.startswith(".") for part in path.split(os.sep)):
+            raise HTTPException(status_code=404)
+
+        immutable = path.startswith(_CONTENT_ADDRESSED)
+        try:
+            file = await self.open_files.acquire(path, self.resolve, immutable)
+        except (FileNotFoundError, NotADirectoryError, ValueError):
+            raise HTTPException(status_code=404) from None
+        except PermissionError:
+            raise HTTPException(status_code=401) from None
+
+        try:
+            return self.file_response_for(file, scope, immutable)
+        except BaseException:
+            self.open_files.release(file)
+            raise
+
+    def file_response_for(
+        self, file: OpenFile, scope: Scope, immutable: bool
+    ) -> Response:
+        media_type = mimetypes.guess_type(file.path)[0] or "application/octet-stream"
+        headers = {
+            "accept-ranges": "bytes",
+            "etag": file.etag,
+            "last-modified": file.last_modified,
+            "cache-control": IMMUTABLE if immutable else self.cache_control,
+            "x-content-type-options": "nosniff",
+        }
+        if not media_type.startswith(self.inline_types):
+            headers["content-disposition"] = "attachment"
+        request_headers = Headers(scope=scope)
+        if self.is_not_modified(Headers(headers), request_headers):
+            self.open_files.release(file)
+            return NotModifiedResponse(Headers(headers))
+
+        ranges = None
+        http_range = request_headers.get("range")
+        if_range = request_headers.get("if-range")
+        if http_range and if_range in (None, file.etag, file.last_modified):
+            ranges = parse_ranges(http_range, file.size)
+            if ranges is not None and len(ranges) > self.max_ranges:
+                ranges = None  # 구간이 너무 많으면 전체 전송
+            if ranges == []:
+                self.open_files.release(file)
+                return Response(
+                    status_code=416,
+                    headers={"content-range": f"bytes */{file.size}"},
+                )
+
+        return MediaResponse(
+            file,
+            self.open_files.release,
+            ranges,
+            headers=headers,
+            media_type=media_type,
+            chunk_size=self.chunk_size,
+        )
@@ -0,0 +1,5 @@
+"""
+Media Tests 패키지
+
+업로드 저장/후처리 테스트를 제공합니다.
+"""
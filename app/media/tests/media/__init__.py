@@ -0,0 +1,3 @@
+"""
+Media 단위 테스트 패키지
+"""
@@ -0,0 +1,265 @@
+import asyncio
+import os
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.media.streaming import MediaFiles, OpenFileCache, parse_ranges
+from app.utils.static import IMMUTABLE
+
+DATA = bytes(range(256)) * 40  # 10240 바이트
+
+
+@pytest.fixture
+def root(tmp_path):
+    (tmp_path / "song.mp3").write_bytes(DATA)
+    (tmp_path / "files" / "ab").mkdir(parents=True)
+    (tmp_path / "files" / "ab" / "abcd.wav").write_bytes(DATA)
+    (tmp_path / ".uploads").mkdir()
+    (tmp_path / ".uploads" / "x.part").write_bytes(b"partial")
+    return tmp_path
+
+
+@pytest.fixture
+def media(root):
+    files = MediaFiles(
+        directory=root, open_files=OpenFileCache(maxsize=2, ttl=60), chunk_size=1000
+    )
+    yield files
+    files.open_files.clear()
+
+
+@pytest.fixture
+async def client(media):
+    app = FastAPI()
+    app.mount("/media", media)
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as http:
+        yield http
+
+
+def test_parse_ranges():
+    assert parse_ranges("bytes=0-99", 1000) == [(0, 100)]
+    assert parse_ranges("bytes=900-", 1000) == [(900, 1000)]
+    assert parse_ranges("bytes=-100", 1000) == [(900, 1000)]
+    assert parse_ranges("bytes=0-5000", 1000) == [(0, 1000)]
+    # 겹치거나 붙은 구간은 합침
+    assert parse_ranges("bytes=50-99, 0-49, 200-299, 250-399", 1000) == [
+        (0, 100),
+        (200, 400),
+    ]
+    assert parse_ranges("bytes=1000-", 1000) == []
+    for invalid in ("items=0-1", "bytes=", "bytes=5-1", "bytes=-", "bytes=a-b"):
+        assert parse_ranges(invalid, 1000) is None
+
+
+async def test_full_response_headers(client):
+    response = await client.get("/media/song.mp3")
+    assert response.status_code == 200
+    assert response.content == DATA
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["content-type"] == "audio/mpeg"
+    assert response.headers["content-length"] == str(len(DATA))
+    assert response.headers["etag"].startswith('"')
+    assert "last-modified" in response.headers
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.headers["x-content-type-options"] == "nosniff"
+    assert "content-disposition" not in response.headers
+
+    head = await client.head("/media/song.mp3")
+    assert head.status_code == 200
+    assert head.content == b""
+    assert head.headers["content-length"] == str(len(DATA))
+
+
+async def test_content_addressed_file_is_immutable(client):
+    response = await client.get("/media/files/ab/abcd.wav")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == IMMUTABLE
+
+
+async def test_other_types_are_served_as_attachment(client, root):
+    (root / "page.html").write_text("<script>alert(1)</script>")
+    response = await client.get("/media/page.html")
+    assert response.status_code == 200
+    assert response.headers["content-disposition"] == "attachment"
+    assert response.headers["x-content-type-options"] == "nosniff"
+
+
+async def test_single_range(client):
+    response = await client.get("/media/song.mp3", headers={"range": "bytes=100-2599"})
+    assert response.status_code == 206
+    assert response.content == DATA[100:2600]
+    assert response.headers["content-range"] == f"bytes 100-2599/{len(DATA)}"
+    assert response.headers["content-length"] == "2500"
+
+    suffix = await client.get("/media/song.mp3", headers={"range": "bytes=-10"})
+    assert suffix.content == DATA[-10:]
+
+
+async def test_multiple_ranges(client):
+    response = await client.get(
+        "/media/song.mp3", headers={"range": "bytes=0-9, 5000-5009"}
+    )
+    assert response.status_code == 206
+    content_type = response.headers["content-type"]
+    assert content_type.startswith("multipart/byteranges; boundary=")
+    boundary = content_type.split("=", 1)[1]
+    assert int(response.headers["content-length"]) == len(response.content)
+
+    body = response.content.decode("latin-1")
+    parts = body.split(f"--{boundary}")
+    assert parts[-1] == "--\r\n"
+    first, second = parts[1:3]
+    assert f"Content-Range: bytes 0-9/{len(DATA)}" in first
+    assert first.endswith(DATA[:10].decode("latin-1") + "\r\n")
+    assert f"Content-Range: bytes 5000-5009/{len(DATA)}" in second
+    assert second.endswith(DATA[5000:5010].decode("latin-1") + "\r\n")
+
+
+async def test_unsatisfiable_range(client, media):
+    response = await client.get("/media/song.mp3", headers={"range": "bytes=99999-"})
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{len(DATA)}"
+    # 416 응답도 fd 참조를 돌려줌
+    assert all(entry.refs == 0 for entry in media.open_files._files.values())
+
+
+async def test_too_many_ranges_sends_full_file(client, media):
+    media.max_ranges = 2
+    response = await client.get(
+        "/media/song.mp3", headers={"range": "bytes=0-1, 10-11, 20-21"}
+    )
+    assert response.status_code == 200
+    assert response.content == DATA
+
+
+async def test_conditional_requests(client):
+    first = await client.get("/media/song.mp3")
+    etag = first.headers["etag"]
+
+    not_modified = await client.get("/media/song.mp3", headers={"if-none-match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    # If-Range 가 현재 ETag 면 구간, 다르면 전체
+    ranged = await client.get(
+        "/media/song.mp3", headers={"range": "bytes=0-9", "if-range": etag}
+    )
+    assert ranged.status_code == 206
+    stale = await client.get(
+        "/media/song.mp3", headers={"range": "bytes=0-9", "if-range": '"old"'}
+    )
+    assert stale.status_code == 200
+    assert stale.content == DATA
+
+
+async def test_hidden_and_missing_paths(client):
+    assert (await client.get("/media/.uploads/x.part")).status_code == 404
+    assert (await client.get("/media/missing.mp3")).status_code == 404
+    assert (await client.get("/media/files")).status_code == 404
+    assert (await client.get("/media/../song.mp3")).status_code == 404
+    assert (await client.post("/media/song.mp3")).status_code == 405
+
+
+async def test_open_files_are_reused(client, media):
+    for _ in range(3):
+        await client.get("/media/song.mp3", headers={"range": "bytes=0-9"})
+    cache = media.open_files
+    assert (cache.misses, cache.hits) == (1, 2)
+
+
+async def test_changed_file_is_reopened(client, media, root):
+    await client.get("/media/song.mp3")
+    old = media.open_files._files["song.mp3"]
+
+    replacement = root / "song.new"
+    replacement.write_bytes(b"new content")
+    os.replace(replacement, root / "song.mp3")
+    media.open_files.ttl = 0  # 다음 요청에서 stat 재확인
+
+    response = await client.get("/media/song.mp3")
+    assert response.content == b"new content"
+    assert old.evicted
+    assert media.open_files._files["song.mp3"] is not old
+
+
+async def test_eviction_waits_for_active_responses(root):
+    cache = OpenFileCache(maxsize=1)
+
+    def resolve(key):
+        return str(root / key)
+
+    first = await cache.acquire("song.mp3", resolve)
+    second = await cache.acquire("files/ab/abcd.wav", resolve)
+    assert len(cache) == 1
+    assert first.evicted
+    os.fstat(first.fd)  # 전송 중인 응답이 있으므로 아직 열려 있음
+
+    cache.release(first)
+    with pytest.raises(OSError):
+        os.fstat(first.fd)
+    cache.release(second)
+    cache.clear()
+
+
+async def test_zerocopysend_uses_cached_fd(media):
+    messages = []
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/song.mp3",
+        "root_path": "",
+        "headers": [(b"range", b"bytes=10-19")],
+        "query_string": b"",
+        "extensions": {"http.response.zerocopysend": {}},
+    }
+
+    received = asyncio.Event()
+
+    async def receive():
+        if received.is_set():
+            await asyncio.Event().wait()  # 연결이 끊길 때까지 대기
+        received.set()
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.zerocopysend":
+            file = message["file"]
+            data = os.pread(file.fileno(), message["count"], message["offset"])
+            message = {**message, "data": data, "fd": file.fileno()}
+        messages.append(message)
+
+    await media(scope, receive, send)
+    assert messages[0]["status"] == 206
+    zerocopy = [m for m in messages if m["type"] == "http.response.zerocopysend"]
+    assert [m["data"] for m in zerocopy] == [DATA[10:20]]
+    assert zerocopy[0]["fd"] == media.open_files._files["song.mp3"].fd
+    assert messages[-1] == {"type": "http.response.body", "body": b""}
+
+
+async def test_disconnect_stops_reading(media):
+    messages = []
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/song.mp3",
+        "root_path": "",
+        "headers": [],
+        "query_string": b"",
+    }
+    requests = iter([{"type": "http.request", "body": b"", "more_body": False}])
+
+    async def receive():
+        # 탐색으로 바로 끊긴 요청
+        return next(requests, {"type": "http.disconnect"})
+
+    async def send(message):
+        messages.append(message)
+
+    await media(scope, receive, send)
+    bodies = [m for m in messages if m["type"] == "http.response.body"]
+    assert 0 < len(bodies) < len(DATA) // media.chunk_size
+    assert media.open_files._files["song.mp3"].refs == 0
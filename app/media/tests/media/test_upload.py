@@ -0,0 +1,202 @@
+import asyncio
+import base64
+import hashlib
+import importlib
+import io
+import json
+import os
+import time
+import wave
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.dependencies.auth import CurrentUser, get_current_active_user
+from app.dependencies.rate_limit import MemoryBackend, RateLimiter
+from app.media.api.routers.v1 import router as router_module
+from app.media.processing import ProcessingPool, extract_audio_info
+from app.media.storage import UploadLocked, UploadNotFound, UploadStore
+
+# app.dependencies 가 같은 이름의 rate_limit 함수를 다시 내보내므로 모듈을 직접 가져옴
+rate_limit_module = importlib.import_module("app.dependencies.rate_limit")
+
+
+def _wav(seconds: float = 0.5, rate: int = 8000) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as audio:
+        audio.setnchannels(1)
+        audio.setsampwidth(2)
+        audio.setframerate(rate)
+        audio.writeframes(b"\x01\x00" * int(seconds * rate))
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return UploadStore(tmp_path, chunk_size=1024, max_size=1024 * 1024)
+
+
+@pytest.fixture
+async def pool():
+    pool = ProcessingPool(concurrency=1)
+    pool.register("audio/", extract_audio_info)
+    pool.start()
+    yield pool
+    await pool.stop()
+
+
+@pytest.fixture
+def app(store, pool, monkeypatch):
+    monkeypatch.setattr(router_module, "upload_store", store)
+    monkeypatch.setattr(router_module, "processing_pool", pool)
+    monkeypatch.setattr(rate_limit_module, "rate_limiter", RateLimiter(MemoryBackend()))
+    app = FastAPI()
+    app.include_router(router_module.router)
+    editor = CurrentUser.from_claims({"sub": "1", "roles": ["editor"]})
+    app.dependency_overrides[get_current_active_user] = lambda: editor
+    return app
+
+
+@pytest.fixture
+async def client(app):
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as http:
+        yield http
+
+
+async def _chunks(data: bytes):
+    yield data
+
+
+async def _create(client, data: bytes, **extra) -> str:
+    response = await client.post(
+        "/uploads",
+        json={"filename": "song.wav", "size": len(data)} | extra,
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+async def test_resumable_upload_is_hashed_and_processed(client, store, pool, tmp_path):
+    data = _wav()
+    upload_id = await _create(client, data, sha256=hashlib.sha256(data).hexdigest())
+    half = len(data) // 2
+
+    first = await client.patch(
+        f"/uploads/{upload_id}", content=data[:half], headers={"upload-offset": "0"}
+    )
+    assert first.json()["offset"] == half
+    head = await client.head(f"/uploads/{upload_id}")
+    assert head.headers["upload-offset"] == str(half)
+
+    # 다른 워커에서 재개한 것처럼 진행 중 해시 상태가 없어도 다시 계산
+    store._hashers.clear()
+    done = await client.patch(
+        f"/uploads/{upload_id}",
+        content=data[half:],
+        headers={"upload-offset": str(half)},
+    )
+    result = done.json()
+    digest = hashlib.sha256(data).hexdigest()
+    assert result["complete"] and result["sha256"] == digest
+    assert result["url"] == f"/media/files/{digest[:2]}/{digest}.wav"
+
+    stored = tmp_path / "files" / digest[:2] / f"{digest}.wav"
+    assert stored.read_bytes() == data
+    assert not list((tmp_path / ".uploads").iterdir())
+
+    await pool.join()
+    info = json.loads(stored.with_name(stored.name + ".json").read_text())
+    assert info["duration"] == pytest.approx(0.5)
+
+    # 같은 내용은 새로 저장하지 않음
+    again = await _create(client, data)
+    dup = await client.patch(
+        f"/uploads/{again}", content=data, headers={"upload-offset": "0"}
+    )
+    assert dup.json()["deduplicated"] is True
+
+
+async def test_upload_rejections(client):
+    data = b"x" * 3000
+    upload_id = await _create(client, data)
+    url = f"/uploads/{upload_id}"
+
+    wrong_offset = await client.patch(url, content=data, headers={"upload-offset": "5"})
+    too_large = await client.patch(
+        url, content=data + b"y", headers={"upload-offset": "0"}
+    )
+    bad_digest = base64.b64encode(hashlib.sha256(b"other").digest()).decode()
+    bad_checksum = await client.patch(
+        url,
+        content=data[:100],
+        headers={"upload-offset": "0", "upload-checksum": f"sha256 {bad_digest}"},
+    )
+    head = await client.head(url)
+    missing = await client.head("/uploads/" + "0" * 32)
+
+    assert wrong_offset.status_code == 409
+    assert too_large.status_code == 413
+    assert bad_checksum.status_code == 460
+    assert head.headers["upload-offset"] == "0"  # 체크섬 불일치분은 되돌림
+    assert missing.status_code == 404
+
+    declared = await _create(client, b"abc", sha256="0" * 64)
+    mismatch = await client.patch(
+        f"/uploads/{declared}", content=b"abc", headers={"upload-offset": "0"}
+    )
+    assert mismatch.status_code == 460
+
+
+async def test_upload_requires_permission_and_allowed_type(app, client):
+    html = await client.post("/uploads", json={"filename": "evil.html", "size": 10})
+    assert html.status_code == 415
+
+    viewer = CurrentUser.from_claims({"sub": "2", "roles": ["viewer"]})
+    app.dependency_overrides[get_current_active_user] = lambda: viewer
+    forbidden = await client.post("/uploads", json={"filename": "a.wav", "size": 10})
+    assert forbidden.status_code == 403
+
+    app.dependency_overrides.clear()
+    anonymous = await client.post("/uploads", json={"filename": "a.wav", "size": 10})
+    assert anonymous.status_code == 401
+
+
+async def test_upload_creation_is_rate_limited(client):
+    statuses = [
+        (
+            await client.post("/uploads", json={"filename": "a.wav", "size": 10})
+        ).status_code
+        for _ in range(11)
+    ]
+    assert statuses == [201] * 10 + [429]
+
+
+async def test_concurrent_completion_finalizes_once(client, store):
+    data = b"lyrics" * 100
+    upload_id = await _create(client, data, filename="song.lrc")
+    session = await store.get(upload_id)
+    await store.append(session, 0, _chunks(data))
+
+    first, second = await asyncio.gather(
+        store.finalize(session), store.finalize(session), return_exceptions=True
+    )
+    results = sorted([first, second], key=lambda r: isinstance(r, Exception))
+    assert results[0].content_type == "text/plain"
+    assert isinstance(results[1], (UploadLocked, UploadNotFound))
+    with pytest.raises(UploadNotFound):
+        await store.finalize(session)
+
+
+async def test_abandoned_uploads_expire(client, store, tmp_path):
+    stale = await _create(client, b"x" * 100)
+    fresh = await _create(client, b"x" * 100)
+    old = time.time() - store.expiry - 1
+    for suffix in (".part", ".json"):
+        os.utime(tmp_path / ".uploads" / f"{stale}{suffix}", (old, old))
+
+    assert await store.expire() == 1
+    assert (await client.head(f"/uploads/{stale}")).status_code == 404
+    assert (await client.head(f"/uploads/{fresh}")).status_code == 200
@@ -4,6 +4,15 @@ Utils 패키지
 공통 유틸리티 함수들을 제공합니다.
 """
 
-from .cors import get_cors_config
+from .compression import CompressionMiddleware, get_compression_config
+from .cors import CORSMiddleware, get_cors_config
+from .static import HashedStaticFiles, PrecompressedStaticFiles
 
-__all__ = ["get_cors_config"]
+__all__ = [
+    "CompressionMiddleware",
+    "CORSMiddleware",
+    "get_compression_config",
+    "get_cors_config",
+    "HashedStaticFiles",
+    "PrecompressedStaticFiles",
+]
@@ -0,0 +1,45 @@
+"""
+Bloom 필터
+
+"확실히 없음" 과 "아마 있음" 만 답하는 비트 배열 집합입니다. 거짓 음성은 없고,
+거짓 양성 비율은 capacity 개를 넣었을 때 error_rate 정도입니다.
+
+    bloom = BloomFilter(capacity=100_000, error_rate=0.001)  # 약 180KB
+    bloom.add("jti-1")
+    "jti-2" in bloom  # False 면 확실히 없음
+"""
+
+import hashlib
+import math
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(1, capacity)
+        # 최적 비트 수 m = -n ln p / (ln 2)^2, 해시 수 k = m/n ln 2
+        self.size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.capacity = capacity
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> list[int]:
+        # 해시 1회로 두 값을 얻어 k 개 위치 생성 (Kirsch-Mitzenmacher)
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
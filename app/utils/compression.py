@@ -0,0 +1,336 @@
+"""
+응답 압축 (gzip / brotli / zstd)
+
+CompressionMiddleware 는 응답 본문을 버퍼링하지 않고 청크 단위로 압축합니다.
+- 본문이 한 번에 오는 응답: minimum_size 미만이면 그대로, 이상이면 한 번에 압축
+- 스트리밍 응답 (StreamingTemplates 등): 청크마다 압축 후 sync flush 해서
+  브라우저가 받은 만큼 바로 그릴 수 있게 함
+- content-type 허용 목록에 있는 응답만, 이미 Content-Encoding 이 있거나
+  부분 응답(206)이면 건드리지 않음
+
+코덱은 COMPRESSION_ENCODINGS 순서로 선호하며, 클라이언트 Accept-Encoding 의
+q 값이 같으면 앞의 것을 고릅니다. gzip 은 표준 라이브러리, brotli/zstd 는
+패키지가 설치된 경우에만 사용합니다 (pip install brotli zstandard).
+
+정적 파일은 요청 시 압축하지 않도록 배포 때 미리 압축해 둡니다.
+
+    python -m app.utils.compression static    # static/**/*.css -> .css.gz/.br/.zst
+
+미리 압축된 파일은 PrecompressedStaticFiles (app.utils.static) 가 골라 보냅니다.
+"""
+
+import argparse
+import mimetypes
+import os
+import zlib
+from collections.abc import Callable, Collection, Iterator, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Protocol
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.middleware.base import ASGIMiddleware, append_vary, header_value
+from config import compression_settings
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:
+    zstd = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class Encoder(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes:
+        """지금까지 넣은 데이터를 모두 내보냄 (스트림은 계속)"""
+        ...
+
+    def finish(self) -> bytes: ...
+
+
+class _GzipEncoder:
+    def __init__(self, level: int):
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+class _BrotliEncoder:
+    def __init__(self, level: int):
+        self._obj = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.process(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+class _ZstdEncoder:
+    def __init__(self, level: int):
+        if zstd is not None:
+            self._obj = zstd.ZstdCompressor(level)
+            self._block, self._frame = zstd.ZstdCompressor.FLUSH_BLOCK, None
+        else:
+            self._obj = zstandard.ZstdCompressor(level).compressobj()
+            self._block = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+            self._frame = zstandard.COMPRESSOBJ_FLUSH_FINISH
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(self._block)
+
+    def finish(self) -> bytes:
+        return (
+            self._obj.flush() if self._frame is None else self._obj.flush(self._frame)
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Codec:
+    name: str  # Content-Encoding 값
+    suffix: str  # 미리 압축한 파일 확장자
+    encoder: Callable[[int], Encoder]
+    max_level: int  # 빌드 단계에서 쓰는 최고 압축률
+
+    def compress(self, data: bytes, level: int) -> bytes:
+        encoder = self.encoder(level)
+        return encoder.compress(data) + encoder.finish()
+
+
+# 설치된 코덱만 등록
+CODECS: dict[str, Codec] = {"gzip": Codec("gzip", ".gz", _GzipEncoder, 9)}
+if brotli is not None:
+    CODECS["br"] = Codec("br", ".br", _BrotliEncoder, 11)
+if zstd is not None or zstandard is not None:
+    CODECS["zstd"] = Codec("zstd", ".zst", _ZstdEncoder, 19)
+
+
+@lru_cache(maxsize=256)
+def negotiate(accept_encoding: str, available: tuple[str, ...]) -> str | None:
+    """Accept-Encoding 과 서버 선호 순서(available)로 코덱 선택 (없으면 None)"""
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+
+    best, best_q = None, 0.0
+    for name in available:
+        q = weights.get(name, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+def is_compressible(content_type: str, allowed: Collection[str]) -> bool:
+    """content-type 이 허용 목록에 있는지 ("text/" 처럼 / 로 끝나면 접두어)"""
+    media_type = content_type.partition(";")[0].strip().lower()
+    return any(
+        media_type.startswith(entry) if entry.endswith("/") else media_type == entry
+        for entry in allowed
+    )
+
+
+def get_compression_config() -> dict:
+    """CompressionSettings 를 CompressionMiddleware 인자 형태로 변환"""
+    return {
+        "minimum_size": compression_settings.COMPRESSION_MINIMUM_SIZE,
+        "content_types": compression_settings.COMPRESSION_CONTENT_TYPES,
+        "encodings": compression_settings.COMPRESSION_ENCODINGS,
+        "levels": {
+            "gzip": compression_settings.COMPRESSION_GZIP_LEVEL,
+            "br": compression_settings.COMPRESSION_BROTLI_QUALITY,
+            "zstd": compression_settings.COMPRESSION_ZSTD_LEVEL,
+        },
+    }
+
+
+class CompressionMiddleware(ASGIMiddleware):
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        content_types: Collection[str] = ("text/", "application/json"),
+        encodings: Sequence[str] = ("zstd", "br", "gzip"),
+        levels: dict[str, int] | None = None,
+    ):
+        super().__init__(app)
+        self.minimum_size = minimum_size
+        self.content_types = tuple(t.lower() for t in content_types)
+        self.encodings = tuple(e for e in encodings if e in CODECS)
+        self.levels = {"gzip": 6, "br": 4, "zstd": 3, **(levels or {})}
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        accept = header_value(scope, b"accept-encoding")
+        encoding = (
+            negotiate(accept.decode("latin-1"), self.encodings) if accept else None
+        )
+        responder = _CompressingSend(self, send, encoding)
+        await self.app(scope, receive, responder.send)
+
+    def should_compress(self, message: Message) -> bool:
+        status = message["status"]
+        if status < 200 or status in (204, 206, 304):
+            return False
+        content_type = content_encoding = None
+        for name, value in message.get("headers", ()):
+            name = name.lower()
+            if name == b"content-type":
+                content_type = value.decode("latin-1")
+            elif name == b"content-encoding":
+                content_encoding = value
+        return (
+            content_encoding is None
+            and content_type is not None
+            and is_compressible(content_type, self.content_types)
+        )
+
+
+class _CompressingSend:
+    """http.response.start 를 첫 본문이 올 때까지 보류했다가 압축 여부 결정"""
+
+    def __init__(self, middleware: CompressionMiddleware, send: Send, encoding):
+        self.middleware = middleware
+        self._send = send
+        self.encoding: str | None = encoding
+        self.start: Message | None = None
+        self.encoder: Encoder | None = None
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            if self.middleware.should_compress(message):
+                # 압축 여부가 Accept-Encoding 에 따라 달라지는 응답
+                append_vary(message, b"Accept-Encoding")
+                if self.encoding is not None:
+                    self.start = message
+                    return
+            await self._send(message)
+            return
+
+        if self.encoder is not None and message["type"] == "http.response.body":
+            body = self.encoder.compress(message.get("body", b""))
+            if message.get("more_body", False):
+                body += self.encoder.flush()
+            else:
+                body += self.encoder.finish()
+            await self._send({**message, "body": body})
+            return
+
+        start, self.start = self.start, None
+        if start is None:
+            await self._send(message)
+            return
+        if message["type"] != "http.response.body":
+            # pathsend 등 본문이 없는 응답은 그대로
+            await self._send(start)
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if not more_body and len(body) < self.middleware.minimum_size:
+            await self._send(start)
+            await self._send(message)
+            return
+
+        codec = CODECS[self.encoding]
+        headers = MutableHeaders(scope=start)
+        headers["content-encoding"] = codec.name
+        etag = headers.get("etag")
+        if etag is not None and not etag.startswith("W/"):
+            # 표현(바이트)이 바뀌므로 강한 ETag 는 약한 ETag 로
+            headers["etag"] = "W/" + etag
+        if more_body:
+            del headers["content-length"]
+            self.encoder = codec.encoder(self.middleware.levels[codec.name])
+            body = self.encoder.compress(body) + self.encoder.flush()
+        else:
+            body = codec.compress(body, self.middleware.levels[codec.name])
+            headers["content-length"] = str(len(body))
+        await self._send(start)
+        await self._send({**message, "body": body})
+
+
+def precompress_directory(
+    root: str | Path,
+    encodings: Sequence[str] = ("zstd", "br", "gzip"),
+    minimum_size: int = compression_settings.COMPRESSION_MINIMUM_SIZE,
+    content_types: Collection[str] = compression_settings.COMPRESSION_CONTENT_TYPES,
+) -> Iterator[str]:
+    """root 아래 압축 대상 파일마다 최고 압축률의 형제 파일(.gz/.br/.zst) 생성
+
+    원본보다 새로운 형제 파일은 건너뛰고, 원본보다 작아지지 않으면 만들지 않습니다.
+    """
+    codecs = [CODECS[e] for e in encodings if e in CODECS]
+    suffixes = tuple(codec.suffix for codec in CODECS.values())
+    for path in sorted(Path(root).rglob("*")):
+        if not path.is_file() or path.name.endswith(suffixes):
+            continue
+        content_type, _ = mimetypes.guess_type(path.name)
+        if content_type is None or not is_compressible(content_type, content_types):
+            continue
+        stat = path.stat()
+        if stat.st_size < minimum_size:
+            continue
+
+        data = None
+        for codec in codecs:
+            target = path.with_name(path.name + codec.suffix)
+            if target.exists() and target.stat().st_mtime >= stat.st_mtime:
+                continue
+            if data is None:
+                data = path.read_bytes()
+            compressed = codec.compress(data, codec.max_level)
+            if len(compressed) >= len(data):
+                target.unlink(missing_ok=True)
+                continue
+            target.write_bytes(compressed)
+            # 원본과 같은 mtime (정적 파일 핸들러가 최신 여부를 비교)
+            os.utime(target, (stat.st_atime, stat.st_mtime))
+            yield f"{target} ({len(data)} -> {len(compressed)} bytes)"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="정적 파일 사전 압축")
+    parser.add_argument("root", help="정적 파일 디렉터리 (예: static)")
+    parser.add_argument(
+        "--encodings", nargs="+", default=compression_settings.COMPRESSION_ENCODINGS
+    )
+    args = parser.parse_args()
+
+    for line in precompress_directory(args.root, args.encodings):
+        print(line)
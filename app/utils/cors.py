@@ -1,24 +1,227 @@
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+"""
+CORS 미들웨어 (순수 ASGI)
 
+Starlette CORSMiddleware 와 같은 규칙으로 동작하되 요청마다 하던 계산을 줄였습니다.
+- 허용 출처: 정확한 목록은 set 조회, "https://*.example.com" 같은 와일드카드와
+  CORS_ALLOW_ORIGIN_REGEX 는 정규식 하나로 합쳐 컴파일
+- 응답 헤더: 시작 시 bytes 로 미리 만들어 두고 응답에 이어 붙이기만 함
+- preflight: (origin, method, 요청 헤더) 별 응답을 LRU 로 캐시
+- Origin 헤더가 없는 요청(같은 출처, 서버 간 호출)은 send 를 감싸지 않음
+"""
+
+import re
+from collections import OrderedDict
+from collections.abc import Collection
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.middleware.base import ASGIMiddleware, append_vary, on_response_start
 from config import cors_settings
 
-# sys.path.append(
-#     os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-# )  # root 경로 추가
+ALL_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+SAFELISTED_HEADERS = {"Accept", "Accept-Language", "Content-Language", "Content-Type"}
+
+Header = tuple[bytes, bytes]
+# 캐시된 preflight 응답: (상태 코드, 헤더, 본문)
+Preflight = tuple[int, list[Header], bytes]
+
+
+def get_cors_config() -> dict:
+    """CORSSettings 를 CORSMiddleware 인자 형태로 변환"""
+    return {
+        "allow_origins": cors_settings.CORS_ALLOW_ORIGINS,
+        "allow_origin_regex": cors_settings.CORS_ALLOW_ORIGIN_REGEX,
+        "allow_credentials": cors_settings.CORS_ALLOW_CREDENTIALS,
+        "allow_methods": cors_settings.CORS_ALLOW_METHODS,
+        "allow_headers": cors_settings.CORS_ALLOW_HEADERS,
+        "expose_headers": cors_settings.CORS_EXPOSE_HEADERS,
+        "max_age": cors_settings.CORS_MAX_AGE,
+    }
+
+
+def compile_origin_patterns(
+    origins: Collection[str], origin_regex: str | None = None
+) -> re.Pattern | None:
+    """와일드카드 출처(*)와 정규식을 fullmatch 용 정규식 하나로 합침"""
+    patterns = [
+        re.escape(origin).replace(r"\*", r"[^./]+")
+        for origin in origins
+        if "*" in origin and origin != "*"
+    ]
+    if origin_regex:
+        patterns.append(f"(?:{origin_regex})")
+    return re.compile("|".join(patterns)) if patterns else None
+
 
+def _header(name: str, value: str) -> Header:
+    return name.lower().encode("latin-1"), value.encode("latin-1")
 
-class CustomCORSMiddleware:
-    def __init__(self, app: FastAPI):
-        self.app = app
 
-    def configure_cors(self):
-        self.app.add_middleware(
-            CORSMiddleware,
-            allow_origins=cors_settings.CORS_ALLOW_ORIGINS,
-            allow_credentials=cors_settings.CORS_ALLOW_CREDENTIALS,
-            allow_methods=cors_settings.CORS_ALLOW_METHODS,
-            allow_headers=cors_settings.CORS_ALLOW_HEADERS,
-            expose_headers=cors_settings.CORS_EXPOSE_HEADERS,
-            max_age=cors_settings.CORS_MAX_AGE,
+class CORSMiddleware(ASGIMiddleware):
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Collection[str] = (),
+        allow_methods: Collection[str] = ("GET",),
+        allow_headers: Collection[str] = (),
+        allow_credentials: bool = False,
+        allow_origin_regex: str | None = None,
+        expose_headers: Collection[str] = (),
+        max_age: int = 600,
+        preflight_cache_size: int = 1024,
+    ):
+        super().__init__(app)
+        self.allow_all_origins = "*" in allow_origins
+        self.exact_origins = frozenset(o for o in allow_origins if "*" not in o)
+        self.origin_pattern = compile_origin_patterns(allow_origins, allow_origin_regex)
+        self.allow_methods = (
+            ALL_METHODS if "*" in allow_methods else tuple(allow_methods)
         )
+        self.allow_all_headers = "*" in allow_headers
+        self.allow_headers = frozenset(
+            h.lower() for h in SAFELISTED_HEADERS | set(allow_headers)
+        )
+        self.allow_credentials = allow_credentials
+        # 출처를 그대로 돌려줘야 하는 경우 (응답이 Origin 에 따라 달라짐)
+        self.explicit_origin = not self.allow_all_origins or allow_credentials
+
+        simple: list[Header] = []
+        if self.allow_all_origins and not allow_credentials:
+            simple.append(_header("Access-Control-Allow-Origin", "*"))
+        if allow_credentials:
+            simple.append(_header("Access-Control-Allow-Credentials", "true"))
+        if expose_headers:
+            simple.append(
+                _header("Access-Control-Expose-Headers", ", ".join(expose_headers))
+            )
+        self.simple_headers = simple
+
+        preflight = [
+            _header(
+                "Vary",
+                "Origin, Access-Control-Request-Method, Access-Control-Request-Headers",
+            ),
+            _header("Access-Control-Allow-Methods", ", ".join(self.allow_methods)),
+            _header("Access-Control-Max-Age", str(max_age)),
+        ]
+        if not self.explicit_origin:
+            preflight.append(_header("Access-Control-Allow-Origin", "*"))
+        if not self.allow_all_headers:
+            preflight.append(
+                _header(
+                    "Access-Control-Allow-Headers",
+                    ", ".join(sorted(SAFELISTED_HEADERS | set(allow_headers))),
+                )
+            )
+        if allow_credentials:
+            preflight.append(_header("Access-Control-Allow-Credentials", "true"))
+        self.preflight_headers = preflight
+
+        self.preflight_cache_size = preflight_cache_size
+        self._preflight_cache: OrderedDict[tuple, Preflight] = OrderedDict()
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        if self.allow_all_origins or origin in self.exact_origins:
+            return True
+        return self.origin_pattern is not None and bool(
+            self.origin_pattern.fullmatch(origin)
+        )
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        origin = request_method = request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value.decode("latin-1")
+            elif name == b"access-control-request-method":
+                request_method = value.decode("latin-1")
+            elif name == b"access-control-request-headers":
+                request_headers = value.decode("latin-1")
+
+        if origin is None:
+            if not self.explicit_origin:
+                await self.app(scope, receive, send)
+                return
+            # 공유 캐시가 CORS 헤더 없는 응답을 다른 출처에 돌려주지 않도록
+            await self.app(scope, receive, on_response_start(send, _vary_origin))
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._send_preflight(
+                send, self.preflight(origin, request_method, request_headers)
+            )
+            return
+
+        await self.app(scope, receive, self._simple(send, origin))
+
+    def preflight(
+        self, origin: str, method: str, request_headers: str | None
+    ) -> Preflight:
+        key = (origin, method, request_headers)
+        cached = self._preflight_cache.get(key)
+        if cached is not None:
+            self._preflight_cache.move_to_end(key)
+            return cached
+
+        response = self._build_preflight(origin, method, request_headers)
+        self._preflight_cache[key] = response
+        if len(self._preflight_cache) > self.preflight_cache_size:
+            self._preflight_cache.popitem(last=False)
+        return response
+
+    def _build_preflight(
+        self, origin: str, method: str, request_headers: str | None
+    ) -> Preflight:
+        headers = list(self.preflight_headers)
+        failures = []
+
+        if self.is_allowed_origin(origin):
+            if self.explicit_origin:
+                headers.append(_header("Access-Control-Allow-Origin", origin))
+        else:
+            failures.append("origin")
+
+        if method not in self.allow_methods:
+            failures.append("method")
+
+        if request_headers is not None:
+            if self.allow_all_headers:
+                headers.append(_header("Access-Control-Allow-Headers", request_headers))
+            elif any(
+                h.strip().lower() not in self.allow_headers
+                for h in request_headers.split(",")
+            ):
+                failures.append("headers")
+
+        if failures:
+            return 400, headers, ("Disallowed CORS " + ", ".join(failures)).encode()
+        return 200, headers, b"OK"
+
+    @staticmethod
+    async def _send_preflight(send: Send, preflight: Preflight) -> None:
+        status, headers, body = preflight
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    *headers,
+                    (b"content-type", b"text/plain; charset=utf-8"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    def _simple(self, send: Send, origin: str) -> Send:
+        extra = list(self.simple_headers)
+        if self.explicit_origin and self.is_allowed_origin(origin):
+            extra.append(_header("Access-Control-Allow-Origin", origin))
+
+        def add_cors_headers(message: Message) -> None:
+            append_vary(message, b"Origin").extend(extra)
+
+        return on_response_start(send, add_cors_headers)
+
+
+def _vary_origin(message: Message) -> None:
+    append_vary(message, b"Origin")
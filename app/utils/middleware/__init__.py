@@ -0,0 +1,20 @@
+"""
+순수 ASGI 미들웨어 패키지
+
+- base: ASGIMiddleware 기반 클래스와 send/헤더 헬퍼
+- registry: MiddlewareEntry 순서 목록을 앱에 등록
+- stack: 프로젝트 미들웨어 순서 (main.py 에서 install)
+"""
+
+from .base import ASGIMiddleware, append_vary, header_value, on_response_start
+from .registry import MiddlewareEntry, build, install
+
+__all__ = [
+    "ASGIMiddleware",
+    "MiddlewareEntry",
+    "append_vary",
+    "build",
+    "header_value",
+    "install",
+    "on_response_start",
+]
@@ -0,0 +1,73 @@
+"""
+순수 ASGI 미들웨어 기반 클래스
+
+BaseHTTPMiddleware 는 요청마다 태스크를 만들고 응답 본문을 스트림으로 다시 감싸지만,
+ASGIMiddleware 는 scope/receive/send 를 그대로 넘기고 필요한 메시지만 들여다봅니다.
+본문을 버퍼링하지 않으므로 스트리밍 응답(StreamingTemplates 등)도 그대로 흘러갑니다.
+
+    class TimingMiddleware(ASGIMiddleware):
+        async def handle(self, scope, receive, send):
+            started = time.perf_counter()
+
+            def add_header(message):
+                elapsed = time.perf_counter() - started
+                MutableHeaders(scope=message)["x-elapsed"] = f"{elapsed:.4f}"
+
+            await self.app(scope, receive, on_response_start(send, add_header))
+"""
+
+from collections.abc import Callable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+Header = tuple[bytes, bytes]
+
+
+class ASGIMiddleware:
+    # 처리할 scope 종류, 그 외(lifespan, websocket 등)는 그대로 통과
+    scope_types: frozenset[str] = frozenset({"http"})
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in self.scope_types:
+            await self.app(scope, receive, send)
+            return
+        await self.handle(scope, receive, send)
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """하위 클래스에서 구현 (기본은 그대로 통과)"""
+        await self.app(scope, receive, send)
+
+
+def header_value(scope: Scope, name: bytes) -> bytes | None:
+    """요청 헤더 값 (name 은 소문자 bytes), Headers 객체를 만들지 않고 조회"""
+    for key, value in scope["headers"]:
+        if key == name:
+            return value
+    return None
+
+
+def on_response_start(send: Send, callback: Callable[[Message], None]) -> Send:
+    """http.response.start 메시지만 callback 으로 수정한 뒤 전달하는 send"""
+
+    async def wrapped(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            callback(message)
+        await send(message)
+
+    return wrapped
+
+
+def append_vary(message: Message, value: bytes) -> list[Header]:
+    """응답 헤더 목록에 Vary 값을 합치고 (수정 가능한) 헤더 목록 반환"""
+    headers = list(message.get("headers", ()))
+    for i, (name, existing) in enumerate(headers):
+        if name.lower() == b"vary":
+            headers[i] = (name, existing + b", " + value)
+            break
+    else:
+        headers.append((b"vary", value))
+    message["headers"] = headers
+    return headers
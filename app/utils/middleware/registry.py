@@ -0,0 +1,37 @@
+"""
+미들웨어 등록
+
+MiddlewareEntry 목록을 바깥쪽(요청을 먼저 받는 쪽)부터 적어 두면 install() 이
+Starlette 의 add_middleware 순서(나중에 추가한 것이 바깥)에 맞게 역순으로 등록합니다.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from starlette.applications import Starlette
+
+
+@dataclass(frozen=True, slots=True)
+class MiddlewareEntry:
+    cls: type
+    options: dict[str, Any] = field(default_factory=dict)
+    enabled: bool = True
+
+    @property
+    def name(self) -> str:
+        return self.cls.__name__
+
+
+def install(app: Starlette, entries: Sequence[MiddlewareEntry]) -> None:
+    for entry in reversed(entries):
+        if entry.enabled:
+            app.add_middleware(entry.cls, **entry.options)
+
+
+def build(app, entries: Sequence[MiddlewareEntry]):
+    """ASGI 앱을 entries 로 직접 감싼 스택 반환 (벤치마크/테스트용)"""
+    for entry in reversed(entries):
+        if entry.enabled:
+            app = entry.cls(app, **entry.options)
+    return app
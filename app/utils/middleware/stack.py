@@ -0,0 +1,31 @@
+"""
+프로젝트 미들웨어 순서 (위가 바깥쪽, 요청을 먼저 받음)
+
+새 미들웨어는 main.py 에서 add_middleware 를 직접 부르지 말고 여기에 추가합니다.
+"""
+
+from app.core.context import RequestContextMiddleware
+from app.core.http_metrics import HTTPMetricsMiddleware
+from app.database.routing import ReadYourWritesMiddleware
+from app.database.session import db_router
+from app.utils.compression import CompressionMiddleware, get_compression_config
+from app.utils.cors import CORSMiddleware, get_cors_config
+from app.utils.middleware.registry import MiddlewareEntry
+from config import compression_settings, metrics_settings
+
+MIDDLEWARE: list[MiddlewareEntry] = [
+    # 이후 코드(로그, DB 풀 이벤트 등)가 요청 ID / 라우트를 알 수 있도록 가장 바깥
+    MiddlewareEntry(RequestContextMiddleware),
+    # 요청 수/지연/응답 크기, preflight 와 거절된 요청도 포함해 측정
+    MiddlewareEntry(HTTPMetricsMiddleware, enabled=metrics_settings.METRICS_ENABLED),
+    # preflight 는 여기서 바로 응답
+    MiddlewareEntry(CORSMiddleware, get_cors_config()),
+    # 메트릭의 응답 크기가 전송 바이트가 되도록 메트릭 안쪽에서 압축
+    MiddlewareEntry(
+        CompressionMiddleware,
+        get_compression_config(),
+        enabled=compression_settings.COMPRESSION_ENABLED,
+    ),
+    # 쓰기 직후 읽기를 primary 로 고정 (복제본이 없으면 통과)
+    MiddlewareEntry(ReadYourWritesMiddleware, {"router": db_router}),
+]
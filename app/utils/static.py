@@ -0,0 +1,151 @@
+"""
+정적 파일 핸들러
+
+PrecompressedStaticFiles 는 `python -m app.utils.compression static` 으로 만든
+.gz/.br/.zst 형제 파일을 Accept-Encoding 에 맞춰 그대로 보냅니다 (요청 시 압축 없음).
+형제 파일 목록은 시작 시 한 번 디렉터리를 훑어 만들고, 원본이 형제 파일보다
+새로우면 (빌드 후 원본만 바뀐 경우) 원본을 보냅니다.
+
+HashedStaticFiles 는 여기에 지문 파일(app.core.assets) 제공을 더합니다.
+매니페스트의 해시 파일은 시작 시 stat 결과까지 메모리 색인에 담아 요청마다
+파일 시스템을 확인하지 않고 1년 immutable 로 보냅니다. 해시가 없는 경로는
+directory 에서 찾아 (요청마다 stat) 재검증이 필요한 캐시 헤더로 보냅니다.
+"""
+
+import logging
+import mimetypes
+import os
+from collections.abc import Sequence
+
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, PathLike, StaticFiles
+from starlette.types import Scope
+
+from app.core.assets import AssetManifest
+from app.utils.compression import CODECS, negotiate
+
+logger = logging.getLogger(__name__)
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    def __init__(
+        self,
+        *args,
+        encodings: Sequence[str] = ("zstd", "br", "gzip"),
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.encodings = tuple(e for e in encodings if e in CODECS)
+        # 원본 절대 경로 -> {코덱: (형제 파일 경로, stat)}
+        self.variants: dict[str, dict[str, tuple[str, os.stat_result]]] = {}
+        self.scan()
+
+    def variant_directories(self) -> list[PathLike]:
+        return list(self.all_directories)
+
+    def scan(self) -> int:
+        """디렉터리를 훑어 미리 압축된 형제 파일 목록을 다시 만듦, 원본 수 반환"""
+        suffixes = {CODECS[e].suffix: e for e in self.encodings}
+        variants: dict[str, dict[str, tuple[str, os.stat_result]]] = {}
+        for directory in self.variant_directories():
+            # lookup_path() 가 돌려주는 경로와 같은 형태 (realpath) 로 저장
+            directory = os.path.realpath(directory)
+            if not os.path.isdir(directory):
+                continue
+            for dirpath, _, filenames in os.walk(directory):
+                names = set(filenames)
+                for filename in filenames:
+                    stem, suffix = os.path.splitext(filename)
+                    if suffix not in suffixes or stem not in names:
+                        continue
+                    original = os.path.join(dirpath, stem)
+                    path = os.path.join(dirpath, filename)
+                    variants.setdefault(original, {})[suffixes[suffix]] = (
+                        path,
+                        os.stat(path),
+                    )
+        self.variants = variants
+        return len(variants)
+
+    def file_response(
+        self,
+        full_path: PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        available = self.variants.get(str(full_path))
+        if not available:
+            return super().file_response(full_path, stat_result, scope, status_code)
+
+        request_headers = Headers(scope=scope)
+        encoding = negotiate(
+            request_headers.get("accept-encoding", ""),
+            tuple(e for e in self.encodings if e in available),
+        )
+        headers = {"vary": "Accept-Encoding"}
+        path, stat = full_path, stat_result
+        if encoding is not None:
+            variant_path, variant_stat = available[encoding]
+            if variant_stat.st_mtime >= stat_result.st_mtime:
+                path, stat = variant_path, variant_stat
+                headers["content-encoding"] = encoding
+
+        response = FileResponse(
+            path,
+            status_code=status_code,
+            stat_result=stat,
+            headers=headers,
+            media_type=mimetypes.guess_type(str(full_path))[0] or "text/plain",
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+class HashedStaticFiles(PrecompressedStaticFiles):
+    def __init__(
+        self,
+        *args,
+        manifest: AssetManifest,
+        cache_control: str = "no-cache",
+        **kwargs,
+    ):
+        self.manifest = manifest
+        self.cache_control = cache_control  # 해시가 없는 파일
+        super().__init__(*args, **kwargs)
+        # 요청 경로(get_path 결과) -> (파일 경로, stat)
+        self.assets: dict[str, tuple[str, os.stat_result]] = {}
+        if manifest.directory is not None:
+            root = os.path.realpath(manifest.directory)
+            for hashed in manifest.entries.values():
+                path = os.path.join(root, *hashed.split("/"))
+                try:
+                    self.assets[os.path.normpath(hashed)] = (path, os.stat(path))
+                except FileNotFoundError:
+                    logger.warning("hashed asset missing from build: %s", path)
+
+    def variant_directories(self) -> list[PathLike]:
+        directories = super().variant_directories()
+        if self.manifest.directory is not None:
+            directories.append(self.manifest.directory)
+        return directories
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        asset = self.assets.get(path)
+        if asset is None:
+            response = await super().get_response(path, scope)
+            response.headers.setdefault("cache-control", self.cache_control)
+            return response
+
+        if scope["method"] not in ("GET", "HEAD"):
+            raise HTTPException(status_code=405, headers={"Allow": "GET, HEAD"})
+        full_path, stat_result = asset
+        response = self.file_response(full_path, stat_result, scope)
+        # URL 에 내용 해시가 있으므로 바뀔 일이 없음
+        response.headers["cache-control"] = IMMUTABLE
+        return response
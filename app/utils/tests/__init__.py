@@ -0,0 +1,5 @@
+"""
+Utils Tests 패키지
+
+CORS 등 공통 유틸리티 테스트를 제공합니다.
+"""
@@ -0,0 +1,3 @@
+"""
+Utils 단위 테스트 패키지
+"""
@@ -0,0 +1,11 @@
+from app.utils.bloom import BloomFilter
+
+
+def test_no_false_negatives_and_bounded_false_positives():
+    bloom = BloomFilter(capacity=5000, error_rate=0.01)
+    for i in range(5000):
+        bloom.add(f"member-{i}")
+
+    assert all(f"member-{i}" in bloom for i in range(5000))
+    false_positives = sum(f"other-{i}" in bloom for i in range(20000))
+    assert false_positives / 20000 < 0.02
@@ -0,0 +1,151 @@
+import gzip
+import os
+import zlib
+
+from fastapi import FastAPI
+from fastapi.responses import HTMLResponse, PlainTextResponse, Response
+from httpx import ASGITransport, AsyncClient
+
+from app.utils.compression import (
+    CompressionMiddleware,
+    negotiate,
+    precompress_directory,
+)
+from app.utils.static import PrecompressedStaticFiles
+
+BIG = "<p>" + "hello compression " * 100 + "</p>"
+
+
+def test_negotiate():
+    available = ("zstd", "br", "gzip")
+    assert negotiate("gzip, deflate", available) == "gzip"
+    assert negotiate("gzip;q=0.5, br", ("gzip",)) == "gzip"
+    assert negotiate("gzip;q=0, identity", available) is None
+    assert negotiate("*", ("gzip",)) == "gzip"
+    assert negotiate("gzip;q=0.8, *;q=0.9", ("br", "gzip")) == "br"
+    assert negotiate("", available) is None
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/big")
+    async def big():
+        return HTMLResponse(BIG)
+
+    @app.get("/small")
+    async def small():
+        return HTMLResponse("<p>hi</p>")
+
+    @app.get("/binary")
+    async def binary():
+        return Response(b"\0" * 2000, media_type="image/png")
+
+    @app.get("/encoded")
+    async def encoded():
+        body = gzip.compress(BIG.encode())
+        return PlainTextResponse(body, headers={"content-encoding": "gzip"})
+
+    app.add_middleware(CompressionMiddleware, encodings=("gzip",))
+    return app
+
+
+async def test_compresses_allowed_responses():
+    async with AsyncClient(
+        transport=ASGITransport(app=_app()), base_url="http://test"
+    ) as client:
+        big = await client.get("/big", headers={"accept-encoding": "gzip"})
+        plain = await client.get("/big", headers={"accept-encoding": "identity"})
+        small = await client.get("/small", headers={"accept-encoding": "gzip"})
+        binary = await client.get("/binary", headers={"accept-encoding": "gzip"})
+        encoded = await client.get("/encoded", headers={"accept-encoding": "gzip"})
+
+    assert big.headers["content-encoding"] == "gzip"
+    assert big.headers["vary"] == "Accept-Encoding"
+    assert int(big.headers["content-length"]) < len(BIG)
+    assert big.text == BIG
+
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["vary"] == "Accept-Encoding"
+    assert "content-encoding" not in small.headers
+    assert "content-encoding" not in binary.headers
+    assert "vary" not in binary.headers
+    assert encoded.text == BIG  # 이중 압축하지 않음
+
+
+async def test_streaming_chunks_are_flushed():
+    chunks = [b"<li>" + b"item " * 200 + b"</li>" for _ in range(3)]
+
+    async def app(scope, receive, send):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"text/html; charset=utf-8")],
+            }
+        )
+        for i, chunk in enumerate(chunks):
+            more = i < len(chunks) - 1
+            await send({"type": "http.response.body", "body": chunk, "more_body": more})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(b"accept-encoding", b"gzip")],
+    }
+    await CompressionMiddleware(app, encodings=("gzip",))(scope, None, send)
+
+    headers = dict(sent[0]["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+    # 청크마다 sync flush 되므로 받은 만큼 바로 풀 수 있음
+    decoder = zlib.decompressobj(31)
+    for message, chunk in zip(sent[1:], chunks):
+        assert decoder.decompress(message["body"]) == chunk
+
+
+async def test_precompressed_static_files(tmp_path):
+    css = tmp_path / "site.css"
+    css.write_text("body { color: red; }\n" * 100)
+    (tmp_path / "logo.png").write_bytes(b"\0" * 2000)
+
+    built = list(precompress_directory(tmp_path, encodings=("gzip",)))
+    assert len(built) == 1
+    assert (tmp_path / "site.css.gz").exists()
+    assert list(precompress_directory(tmp_path, encodings=("gzip",))) == []
+
+    app = FastAPI()
+    app.mount("/static", PrecompressedStaticFiles(directory=tmp_path), name="static")
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        encoded = await client.get("/static/site.css")
+        identity = await client.get(
+            "/static/site.css", headers={"accept-encoding": "identity"}
+        )
+        not_modified = await client.get(
+            "/static/site.css", headers={"if-none-match": encoded.headers["etag"]}
+        )
+        # 빌드 후 원본만 바뀌면 원본 전송
+        stat = css.stat()
+        os.utime(css, (stat.st_atime, stat.st_mtime + 10))
+        stale = await client.get("/static/site.css")
+
+    assert encoded.headers["content-encoding"] == "gzip"
+    assert encoded.headers["content-type"].startswith("text/css")
+    assert encoded.headers["vary"] == "Accept-Encoding"
+    assert encoded.text == css.read_text()
+    assert (
+        int(encoded.headers["content-length"])
+        == (tmp_path / "site.css.gz").stat().st_size
+    )
+    assert "content-encoding" not in identity.headers
+    assert identity.headers["etag"] != encoded.headers["etag"]
+    assert not_modified.status_code == 304
+    assert "content-encoding" not in stale.headers
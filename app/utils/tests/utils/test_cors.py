@@ -0,0 +1,120 @@
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.utils.cors import CORSMiddleware
+
+
+def _client(**options) -> tuple[AsyncClient, FastAPI]:
+    app = FastAPI()
+
+    @app.get("/items")
+    async def items():
+        return []
+
+    app.add_middleware(CORSMiddleware, **options)
+    client = AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+    return client, app
+
+
+def _preflight(origin: str, method: str = "GET", headers: str | None = None) -> dict:
+    request = {"origin": origin, "access-control-request-method": method}
+    if headers is not None:
+        request["access-control-request-headers"] = headers
+    return request
+
+
+@pytest.mark.parametrize(
+    ("origin", "allowed"),
+    [
+        ("https://example.com", True),
+        ("https://api.example.com", True),
+        ("https://a.b.example.com", False),
+        ("https://example.com.evil.io", False),
+        ("https://shop.example.net", True),
+        ("http://other.io", False),
+    ],
+)
+def test_origin_matching(origin, allowed):
+    middleware = CORSMiddleware(
+        None,
+        allow_origins=["https://example.com", "https://*.example.com"],
+        allow_origin_regex=r"https://[a-z]+\.example\.net",
+    )
+    assert middleware.is_allowed_origin(origin) is allowed
+
+
+async def test_preflight_is_cached():
+    client, app = _client(
+        allow_origins=["https://app.example.com"],
+        allow_methods=["GET", "POST"],
+        allow_headers=["Authorization"],
+        allow_credentials=True,
+        max_age=600,
+    )
+    async with client:
+        ok = await client.options(
+            "/items",
+            headers=_preflight("https://app.example.com", "POST", "authorization"),
+        )
+        again = await client.options(
+            "/items",
+            headers=_preflight("https://app.example.com", "POST", "authorization"),
+        )
+        bad = await client.options(
+            "/items", headers=_preflight("https://evil.io", "DELETE", "x-secret")
+        )
+
+    assert ok.status_code == 200
+    assert ok.headers["access-control-allow-origin"] == "https://app.example.com"
+    assert ok.headers["access-control-allow-credentials"] == "true"
+    assert ok.headers["access-control-max-age"] == "600"
+    assert "Authorization" in ok.headers["access-control-allow-headers"]
+    assert again.headers == ok.headers
+    assert bad.status_code == 400
+    assert bad.text == "Disallowed CORS origin, method, headers"
+    assert "access-control-allow-origin" not in bad.headers
+
+    cors = app.middleware_stack
+    while not isinstance(cors, CORSMiddleware):
+        cors = cors.app
+    assert len(cors._preflight_cache) == 2
+
+
+async def test_simple_request_headers():
+    client, _ = _client(
+        allow_origins=["https://app.example.com"],
+        expose_headers=["X-Total-Count"],
+    )
+    async with client:
+        allowed = await client.get(
+            "/items", headers={"origin": "https://app.example.com"}
+        )
+        denied = await client.get("/items", headers={"origin": "https://evil.io"})
+        same_origin = await client.get("/items")
+
+    assert allowed.headers["access-control-allow-origin"] == "https://app.example.com"
+    assert allowed.headers["access-control-expose-headers"] == "X-Total-Count"
+    assert allowed.headers["vary"] == "Origin"
+    assert "access-control-allow-origin" not in denied.headers
+    assert "access-control-allow-origin" not in same_origin.headers
+    assert same_origin.headers["vary"] == "Origin"
+
+
+async def test_allow_all_with_credentials_echoes_origin():
+    client, _ = _client(
+        allow_origins=["*"],
+        allow_methods=["*"],
+        allow_headers=["*"],
+        allow_credentials=True,
+    )
+    async with client:
+        simple = await client.get("/items", headers={"origin": "https://a.io"})
+        preflight = await client.options(
+            "/items", headers=_preflight("https://a.io", "PATCH", "X-Custom")
+        )
+
+    assert simple.headers["access-control-allow-origin"] == "https://a.io"
+    assert preflight.status_code == 200
+    assert preflight.headers["access-control-allow-origin"] == "https://a.io"
+    assert preflight.headers["access-control-allow-headers"] == "X-Custom"
@@ -0,0 +1,108 @@
+import asyncio
+
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from app.utils.middleware import (
+    ASGIMiddleware,
+    MiddlewareEntry,
+    append_vary,
+    header_value,
+    install,
+    on_response_start,
+)
+
+
+class TagMiddleware(ASGIMiddleware):
+    """요청 헤더 x-trace 에 이름을 덧붙이고 응답 헤더로 돌려줌"""
+
+    def __init__(self, app, name: str):
+        super().__init__(app)
+        self.name = name
+
+    async def handle(self, scope, receive, send):
+        trace = header_value(scope, b"x-trace") or b""
+        scope["headers"] = [
+            *(h for h in scope["headers"] if h[0] != b"x-trace"),
+            (b"x-trace", trace + self.name.encode()),
+        ]
+
+        def add_vary(message):
+            append_vary(message, self.name.encode())
+
+        await self.app(scope, receive, on_response_start(send, add_vary))
+
+
+async def test_install_order_and_streaming_passthrough():
+    app = FastAPI()
+    chunks_seen: list[int] = []
+
+    @app.get("/trace")
+    async def trace(request: Request):
+        return {"trace": request.headers["x-trace"]}
+
+    @app.get("/stream")
+    async def stream():
+        async def body():
+            for i in range(3):
+                chunks_seen.append(i)
+                yield f"{i},"
+
+        return StreamingResponse(body())
+
+    install(
+        app,
+        [
+            MiddlewareEntry(TagMiddleware, {"name": "a"}),
+            MiddlewareEntry(TagMiddleware, {"name": "skip"}, enabled=False),
+            MiddlewareEntry(TagMiddleware, {"name": "b"}),
+        ],
+    )
+
+    messages = []
+
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if requests:
+            return requests.pop()
+        await asyncio.Event().wait()  # 연결 종료 없음
+
+    async def send(message):
+        # 본문 조각이 생성되는 즉시 (버퍼링 없이) 전달되는지 확인
+        if message["type"] == "http.response.body" and message.get("body"):
+            messages.append((message["body"], len(chunks_seen)))
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/trace")
+
+    # 목록 위쪽(a)이 바깥: 요청은 a -> b, 응답 헤더는 b -> a 순서로 처리
+    assert response.json() == {"trace": "ab"}
+    assert response.headers["vary"] == "b, a"
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/stream",
+        "query_string": b"",
+        "headers": [],
+    }
+    await app(scope, receive, send)
+    assert messages == [(b"0,", 1), (b"1,", 2), (b"2,", 3)]
+
+
+async def test_non_http_scope_passes_through():
+    seen = []
+
+    async def inner(scope, receive, send):
+        seen.append(scope["type"])
+
+    class Fail(ASGIMiddleware):
+        async def handle(self, scope, receive, send):
+            raise AssertionError("http 만 처리해야 함")
+
+    await Fail(inner)({"type": "lifespan"}, None, None)
+    assert seen == ["lifespan"]
@@ -0,0 +1,57 @@
+import os
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.core.assets import AssetManifest, build_assets
+from app.utils import static as static_module
+from app.utils.compression import precompress_directory
+from app.utils.static import IMMUTABLE, HashedStaticFiles
+
+
+async def test_hashed_assets_served_from_memory_index(tmp_path, monkeypatch):
+    source, build = tmp_path / "static", tmp_path / "build"
+    source.mkdir()
+    (source / "site.css").write_text("body { color: red; }\n" * 100)
+    (source / "robots.txt").write_text("User-agent: *\n")
+    entries = build_assets(source, build)
+    list(precompress_directory(build, encodings=("gzip",)))
+
+    files = HashedStaticFiles(
+        directory=source,
+        manifest=AssetManifest.load(build, "/static"),
+        encodings=("gzip",),
+    )
+    app = FastAPI()
+    app.mount("/static", files, name="static")
+    hashed_url = f"/static/{entries['site.css']}"
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        await client.get("/static/robots.txt")  # check_config 1회 (디렉터리 확인)
+
+        stat_calls = []
+        real_stat = os.stat
+        monkeypatch.setattr(
+            static_module.os,
+            "stat",
+            lambda *a, **k: stat_calls.append(a) or real_stat(*a, **k),
+        )
+        hashed = await client.get(hashed_url)
+        revalidated = await client.get(
+            hashed_url, headers={"if-none-match": hashed.headers["etag"]}
+        )
+        assert stat_calls == []  # 해시 파일은 stat 없이 제공
+
+        plain = await client.get("/static/robots.txt")
+        posted = await client.post(hashed_url)
+
+    assert hashed.status_code == 200
+    assert hashed.headers["cache-control"] == IMMUTABLE
+    assert hashed.headers["content-encoding"] == "gzip"
+    assert hashed.text == (source / "site.css").read_text()
+    assert revalidated.status_code == 304
+    assert plain.headers["cache-control"] == "no-cache"
+    assert plain.text == "User-agent: *\n"
+    assert posted.status_code == 405
@@ -0,0 +1,5 @@
+"""
+성능 벤치마크 스크립트 모음
+
+각 모듈은 `python -m benchmarks.<이름>` 으로 실행합니다.
+"""
@@ -0,0 +1,255 @@
+"""
+앱 전체 부하 테스트 (경로별 p50/p95/p99 지연과 처리량, 기준 대비 회귀 검사)
+
+    python -m benchmarks.bench_app --requests 1000 --concurrency 16 --output app.json
+    python -m benchmarks.bench_app --save-baseline baseline_app.json
+    python -m benchmarks.bench_app --baseline baseline_app.json --threshold 0.25
+
+main.app 을 임시 SQLite (DB_URL) 와 메모리 FakeRedis 로 띄워 MySQL/Redis 없이
+/, /db, /lyrics/, 관리자 목록, 정적 파일을 두 가지 방식으로 측정합니다.
+
+- asgi: httpx ASGITransport 로 앱을 직접 호출 (서버/소켓 비용 제외)
+- http: 같은 프로세스에 uvicorn 을 127.0.0.1 로 띄우고 --concurrency 개 연결로 요청
+  (부하 생성기와 서버가 이벤트 루프를 나눠 쓰므로 절대값보다 변화량을 봅니다)
+
+결과는 JSON 으로 저장하고, --baseline 을 주면 경로별 p95 가 threshold 비율 이상
+느려지거나 처리량이 그만큼 줄면 종료 코드 1. 기준은 같은 장비에서 만든 것과만
+비교하세요.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+
+MODES = ("asgi", "http")
+WARMUP = 20
+
+
+def _configure(workdir: Path, url: str | None) -> None:
+    """환경변수 설정 (.env 보다 우선)
+
+    설정은 config import 시점에 고정되므로 app/main 모듈은 이 함수 뒤에 import 합니다.
+    """
+    static = workdir / "static"
+    static.mkdir()
+    (static / "site.css").write_text("body { margin: 0; }\n" * 200)
+    (workdir / "media").mkdir()
+    os.environ.update(
+        DB_URL=url or f"sqlite+aiosqlite:///{workdir / 'app.sqlite3'}",
+        DB_SCHEMA_CHECK="create_all",
+        STATIC_DIR=str(static),
+        MEDIA_DIR=str(workdir / "media"),
+        LOG_LEVEL="WARNING",
+        TEMPLATE_AUTO_RELOAD="False",
+    )
+
+
+def _routes() -> list[str]:
+    from app.lyrics.api.routers.lyrics_admin import (
+        LyricsSongResultsAllAdmin,
+        LyricsStoreDefaultInfoAdmin,
+    )
+    from config import prj_settings
+
+    admin = prj_settings.ADMIN_BASE_URL
+    return [
+        "/",
+        "/db",
+        "/lyrics/",
+        f"{admin}/{LyricsSongResultsAllAdmin.identity}/list",
+        f"{admin}/{LyricsStoreDefaultInfoAdmin.identity}/list",
+        "/static/site.css",
+    ]
+
+
+async def _seed(rows: int) -> None:
+    from sqlalchemy import func, insert, select
+
+    from app.database.session import engine
+    from app.lyrics.models import SongResultsAll
+    from benchmarks.bench_pagination import _row
+
+    async with engine.begin() as conn:
+        count = await conn.scalar(select(func.count()).select_from(SongResultsAll))
+        base = datetime(2025, 1, 1)
+        batch = [_row(i, base) for i in range(count, rows)]
+        if batch:
+            await conn.execute(insert(SongResultsAll), batch)
+
+
+async def measure(
+    client: httpx.AsyncClient, path: str, requests: int, concurrency: int
+) -> dict:
+    """concurrency 개 작업이 path 를 나눠 requests 번 요청"""
+    for _ in range(WARMUP):
+        await client.get(path)
+
+    samples: list[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            response = await client.get(path)
+            samples.append((time.perf_counter() - started) * 1000)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    cuts = statistics.quantiles(samples, n=100)
+    return {
+        "p50_ms": round(cuts[49], 3),
+        "p95_ms": round(cuts[94], 3),
+        "p99_ms": round(cuts[98], 3),
+        "rps": round(len(samples) / elapsed, 1),
+        "errors": errors,
+    }
+
+
+async def _serve(app) -> tuple[object, asyncio.Task, int]:
+    import uvicorn
+
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    # lifespan 은 run() 에서 이미 실행 중
+    config = uvicorn.Config(app, lifespan="off", access_log=False, log_level="warning")
+    server = uvicorn.Server(config)
+    task = asyncio.create_task(server.serve(sockets=[sock]))
+    while not server.started:
+        await asyncio.sleep(0.01)
+    return server, task, sock.getsockname()[1]
+
+
+async def run(args) -> dict:
+    from app.database.redis import redis_manager
+    from app.database.tests.fake_redis import override_all
+    from main import app
+
+    override_all(redis_manager)
+
+    results: dict[str, dict] = {mode: {} for mode in args.modes}
+    async with app.router.lifespan_context(app):
+        await _seed(args.rows)
+        routes = _routes()
+
+        for mode in args.modes:
+            if mode == "asgi":
+                server = task = None
+                client = httpx.AsyncClient(
+                    transport=httpx.ASGITransport(app=app), base_url="http://bench"
+                )
+            else:
+                server, task, port = await _serve(app)
+                limits = httpx.Limits(max_connections=args.concurrency)
+                client = httpx.AsyncClient(
+                    base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=30
+                )
+            async with client:
+                for path in routes:
+                    results[mode][path] = await measure(
+                        client, path, args.requests, args.concurrency
+                    )
+            if server is not None:
+                server.should_exit = True
+                await task
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """기준 대비 회귀 목록 (p95 증가, 처리량 감소, 오류 발생)"""
+    regressions = []
+    for mode, routes in results.items():
+        for path, current in routes.items():
+            if current["errors"]:
+                regressions.append(f"{mode} {path}: {current['errors']} errors")
+            previous = baseline.get(mode, {}).get(path)
+            if previous is None:
+                continue
+            if current["p95_ms"] > previous["p95_ms"] * (1 + threshold):
+                regressions.append(
+                    f"{mode} {path}: p95 {previous['p95_ms']} -> {current['p95_ms']} ms"
+                )
+            if current["rps"] < previous["rps"] * (1 - threshold):
+                regressions.append(
+                    f"{mode} {path}: rps {previous['rps']} -> {current['rps']}"
+                )
+    return regressions
+
+
+def _print(results: dict, baseline: dict) -> None:
+    print(f"{'mode':<5} {'path':<34} {'p50':>8} {'p95':>8} {'p99':>8} {'rps':>9}  vs")
+    for mode, routes in results.items():
+        for path, r in routes.items():
+            previous = baseline.get(mode, {}).get(path)
+            delta = ""
+            if previous:
+                delta = f"p95 {(r['p95_ms'] / previous['p95_ms'] - 1) * 100:+.0f}%"
+            print(
+                f"{mode:<5} {path:<34} {r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} "
+                f"{r['p99_ms']:>8.2f} {r['rps']:>9.1f}  {delta}"
+            )
+
+
+async def main(args) -> int:
+    with tempfile.TemporaryDirectory() as workdir:
+        _configure(Path(workdir), args.url)
+        results = await run(args)
+
+    report = {
+        "meta": {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "rows": args.rows,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+    baseline = {}
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())["results"]
+    _print(results, baseline)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+    if args.save_baseline:
+        Path(args.save_baseline).write_text(json.dumps(report, indent=2))
+        print(f"baseline saved to {args.save_baseline}")
+
+    regressions = compare(results, baseline, args.threshold)
+    for line in regressions:
+        print("REGRESSION", line)
+    print("FAIL" if regressions else "PASS", f"(threshold {args.threshold:.0%})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", help="async DB URL (기본: 임시 SQLite 파일)")
+    parser.add_argument("--requests", type=int, default=1000, help="경로당 요청 수")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--rows", type=int, default=500, help="song_results_all 행 수")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--output", help="결과 JSON 경로")
+    parser.add_argument("--baseline", help="비교할 기준 JSON")
+    parser.add_argument("--save-baseline", help="이번 결과를 기준 JSON 으로 저장")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args)))
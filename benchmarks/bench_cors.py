@@ -0,0 +1,115 @@
+"""
+CORS 미들웨어 오버헤드 비교
+
+    python -m benchmarks.bench_cors --requests 50000
+
+기존 구성 (Starlette CORSMiddleware 2개: CORSSettings + 하드코딩 max_age=-1) 과
+app.utils.cors.CORSMiddleware 1개를 같은 ASGI 앱 앞에 두고 preflight / 단순 요청 /
+Origin 없는 요청의 요청당 처리 시간을 측정합니다. DB/네트워크 없이 ASGI 호출만 합니다.
+"""
+
+import argparse
+import asyncio
+import time
+
+from starlette.middleware.cors import CORSMiddleware as StarletteCORSMiddleware
+
+from app.utils.cors import CORSMiddleware, get_cors_config
+
+ORIGINS = ["https://app.example.com", "https://*.example.com"]
+
+
+async def endpoint(scope, receive, send) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        }
+    )
+    await send({"type": "http.response.body", "body": b"[]"})
+
+
+def legacy_stack(config: dict):
+    # 기존 main.py: configure_cors() 로 한 번, 하드코딩으로 한 번 더 (바깥쪽)
+    inner = StarletteCORSMiddleware(endpoint, **config)
+    return StarletteCORSMiddleware(
+        inner,
+        allow_origins=["*"],
+        allow_methods=["*"],
+        allow_headers=["*"],
+        allow_credentials=True,
+        max_age=-1,
+    )
+
+
+def _scope(method: str, headers: dict[str, str]) -> dict:
+    return {
+        "type": "http",
+        "method": method,
+        "path": "/items",
+        "headers": [(k.encode(), v.encode()) for k, v in headers.items()],
+    }
+
+
+SCENARIOS = {
+    "preflight": _scope(
+        "OPTIONS",
+        {
+            "origin": "https://api.example.com",
+            "access-control-request-method": "POST",
+            "access-control-request-headers": "content-type",
+            "user-agent": "bench",
+        },
+    ),
+    "simple": _scope(
+        "GET", {"origin": "https://api.example.com", "user-agent": "bench"}
+    ),
+    "no-origin": _scope("GET", {"user-agent": "bench"}),
+}
+
+
+async def measure(app, scope: dict, requests: int) -> float:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - started) / requests
+
+
+async def main(requests: int) -> None:
+    config = {
+        **get_cors_config(),
+        "allow_origins": ORIGINS[:1],
+        "allow_origin_regex": r"https://[^./]+\.example\.com",
+        "allow_methods": ["GET", "POST"],
+        "allow_headers": ["Content-Type", "Authorization"],
+    }
+    stacks = {
+        "legacy (2x starlette)": legacy_stack(config),
+        "single precomputed": CORSMiddleware(
+            endpoint, **{**config, "allow_origins": ORIGINS, "allow_origin_regex": None}
+        ),
+    }
+
+    print(f"{'scenario':<12} {'stack':<24} {'us/request':>12}")
+    for scenario, scope in SCENARIOS.items():
+        results = {}
+        for name, app in stacks.items():
+            await measure(app, scope, requests // 10)  # 워밍업
+            results[name] = await measure(app, scope, requests)
+            print(f"{scenario:<12} {name:<24} {results[name] * 1e6:>12.2f}")
+        legacy, single = results.values()
+        print(f"{'':<12} {'speedup':<24} {legacy / single:>11.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=50_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
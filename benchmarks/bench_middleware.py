@@ -0,0 +1,110 @@
+"""
+미들웨어 계층별 오버헤드 (µs/request)
+
+    python -m benchmarks.bench_middleware --requests 20000
+
+app/utils/middleware/stack.py 의 MIDDLEWARE 를 안쪽부터 한 겹씩 쌓으며 요청당 시간을
+재고, 직전 단계와의 차이를 해당 계층의 비용으로 출력합니다. 비교용으로 아무것도 하지
+않는 BaseHTTPMiddleware 한 겹의 비용도 함께 측정합니다. DB/네트워크 없이 ASGI 호출만
+합니다.
+
+다른 미들웨어 목록도 measure_layers(entries) 로 같은 방식으로 잴 수 있습니다.
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Sequence
+
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.utils.middleware import MiddlewareEntry, build
+from app.utils.middleware.stack import MIDDLEWARE
+
+BODY = b"x" * 2048
+
+
+async def endpoint(scope, receive, send) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"text/plain")],
+        }
+    )
+    await send({"type": "http.response.body", "body": BODY})
+
+
+class NoopHTTPMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        return await call_next(request)
+
+
+def make_scope(headers: dict[str, str] | None = None) -> dict:
+    headers = headers or {"user-agent": "bench", "origin": "https://app.example.com"}
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/bench",
+        "raw_path": b"/bench",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(k.encode(), v.encode()) for k, v in headers.items()],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+
+
+async def measure(app, scope: dict, requests: int) -> float:
+    """요청당 평균 시간 (초)"""
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    for _ in range(requests // 10):  # 워밍업
+        await app(dict(scope), receive, send)
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - started) / requests
+
+
+async def measure_layers(
+    entries: Sequence[MiddlewareEntry], requests: int, scope: dict | None = None
+) -> list[tuple[str, float, float]]:
+    """[(계층 이름, 누적 µs, 해당 계층 µs)], 안쪽 계층부터"""
+    scope = scope or make_scope()
+    enabled = [entry for entry in entries if entry.enabled]
+    baseline = await measure(endpoint, scope, requests)
+    rows = [("(endpoint)", baseline * 1e6, baseline * 1e6)]
+    previous = baseline
+    for i in range(len(enabled) - 1, -1, -1):
+        elapsed = await measure(build(endpoint, enabled[i:]), scope, requests)
+        rows.append((enabled[i].name, elapsed * 1e6, (elapsed - previous) * 1e6))
+        previous = elapsed
+    return rows
+
+
+async def main(requests: int) -> None:
+    print(f"{'layer (inner -> outer)':<28} {'total us':>10} {'layer us':>10}")
+    for name, total, layer in await measure_layers(MIDDLEWARE, requests):
+        print(f"{name:<28} {total:>10.2f} {layer:>10.2f}")
+
+    scope = make_scope()
+    baseline = await measure(endpoint, scope, requests)
+    noop = await measure(NoopHTTPMiddleware(endpoint), scope, requests)
+    layer = (noop - baseline) * 1e6
+    print(f"\n{'BaseHTTPMiddleware (no-op)':<28} {'':>10} {layer:>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
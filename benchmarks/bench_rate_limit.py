@@ -0,0 +1,54 @@
+"""
+메모리 속도 제한 검사 지연 (목표: p99 < 100µs)
+
+    python -m benchmarks.bench_rate_limit --checks 200000 --keys 10000
+
+RateLimiter.hit() 를 MemoryBackend 로 호출해 알고리즘별 p50/p99/max 를 µs 로
+출력합니다. 키는 무작위로 골라 허용/거절이 섞이도록 하고, 목표를 넘으면 종료 코드 1.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+
+from app.dependencies.rate_limit import MemoryBackend, RateLimit, RateLimiter
+
+TARGET_P99_US = 100.0
+
+
+async def measure(rule: RateLimit, checks: int, keys: int) -> list[float]:
+    limiter = RateLimiter(MemoryBackend())
+    names = [f"/lyrics/generate:10.0.{i // 256}.{i % 256}" for i in range(keys)]
+    picks = [random.choice(names) for _ in range(checks)]
+    timings = []
+    for key in picks:
+        started = time.perf_counter_ns()
+        await limiter.hit(key, rule)
+        timings.append((time.perf_counter_ns() - started) / 1000)
+    return timings
+
+
+async def main(checks: int, keys: int) -> int:
+    failed = False
+    print(f"{'algorithm':<16} {'p50 us':>8} {'p99 us':>8} {'max us':>8}")
+    for algorithm in ("sliding_window", "token_bucket"):
+        rule = RateLimit(100, 60, algorithm)
+        await measure(rule, checks // 10, keys)  # 워밍업
+        timings = sorted(await measure(rule, checks, keys))
+        p50 = statistics.median(timings)
+        p99 = timings[int(len(timings) * 0.99)]
+        failed |= p99 >= TARGET_P99_US
+        print(f"{algorithm:<16} {p50:>8.2f} {p99:>8.2f} {timings[-1]:>8.2f}")
+    print("FAIL" if failed else "PASS", f"(p99 target {TARGET_P99_US:.0f}us)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--checks", type=int, default=200_000)
+    parser.add_argument("--keys", type=int, default=10_000)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.checks, args.keys)))
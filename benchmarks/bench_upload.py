@@ -0,0 +1,113 @@
+"""
+스트리밍 업로드 최대 RSS (목표: 파일 크기와 무관하게 증가분 < 64MiB)
+
+    python -m benchmarks.bench_upload --size-mb 1024 --parts 4
+
+/uploads API 로 size-mb 크기 파일을 parts 번의 PATCH 로 나눠 올리면서 (재개 업로드)
+프로세스 RSS 를 5ms 마다 측정해 시작 대비 최대 증가분과 처리량을 출력합니다.
+본문은 64KiB 조각으로 만들어 보내므로 업로드 경로가 버퍼링하면 증가분이 커집니다.
+목표를 넘으면 종료 코드 1.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.dependencies.auth import CurrentUser, get_current_active_user
+from app.media.api.routers.v1 import router as router_module
+from app.media.processing import ProcessingPool
+from app.media.storage import UploadStore
+
+PIECE = 64 * 1024
+TARGET_MIB = 64
+_PAGE = os.sysconf("SC_PAGE_SIZE")
+
+
+def rss() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * _PAGE
+
+
+class PeakSampler(threading.Thread):
+    def __init__(self, interval: float = 0.005):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = rss()
+        self._stop = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, rss())
+
+    def stop(self) -> int:
+        self._stop.set()
+        self.join()
+        return self.peak
+
+
+async def body(size: int):
+    piece = os.urandom(PIECE)
+    sent = 0
+    while sent < size:
+        chunk = piece[: min(PIECE, size - sent)]
+        sent += len(chunk)
+        yield chunk
+
+
+async def main(size_mb: int, parts: int) -> int:
+    size = size_mb * 1024 * 1024
+    with tempfile.TemporaryDirectory() as root:
+        router_module.upload_store = UploadStore(root, max_size=size)
+        router_module.processing_pool = ProcessingPool()
+        app = FastAPI()
+        app.include_router(router_module.router)
+        editor = CurrentUser.from_claims({"sub": "bench", "roles": ["editor"]})
+        app.dependency_overrides[get_current_active_user] = lambda: editor
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://bench", timeout=None
+        ) as client:
+            created = await client.post(
+                "/uploads", json={"filename": "bench.wav", "size": size}
+            )
+            upload_id = created.json()["id"]
+
+            baseline = rss()
+            sampler = PeakSampler()
+            sampler.start()
+            started = time.perf_counter()
+            offset = 0
+            for i in range(parts):
+                length = size // parts if i < parts - 1 else size - offset
+                response = await client.patch(
+                    f"/uploads/{upload_id}",
+                    content=body(length),
+                    headers={"upload-offset": str(offset)},
+                )
+                offset = response.json()["offset"]
+            elapsed = time.perf_counter() - started
+            peak = sampler.stop()
+
+    growth = (peak - baseline) / 1024 / 1024
+    failed = growth >= TARGET_MIB or not response.json()["complete"]
+    print(f"uploaded      {size_mb} MiB in {parts} parts")
+    print(f"throughput    {size_mb / elapsed:.0f} MiB/s")
+    print(f"rss baseline  {baseline / 1024 / 1024:.1f} MiB")
+    print(f"rss peak      {peak / 1024 / 1024:.1f} MiB (+{growth:.1f} MiB)")
+    print("FAIL" if failed else "PASS", f"(growth target {TARGET_MIB}MiB)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=1024)
+    parser.add_argument("--parts", type=int, default=4)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.size_mb, args.parts)))
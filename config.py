@@ -1,9 +1,16 @@
+import logging
 from pathlib import Path
+from typing import Literal
 
 from fastapi.templating import Jinja2Templates
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from app.core.assets import AssetManifest
+from app.core.templating import build_template_env
+
+logger = logging.getLogger(__name__)
+
 PROJECT_DIR = Path(__file__).resolve().parent
 
 _base_config = SettingsConfigDict(
@@ -29,8 +36,13 @@ class CORSSettings(BaseSettings):
     # 요청을 허용할 출처(Origin) 목록
     # ["*"]: 모든 출처 허용 (개발 환경용, 프로덕션에서는 구체적인 도메인 지정 권장)
     # 예: ["https://example.com", "https://app.example.com"]
+    # 와일드카드 서브도메인 지정 가능: ["https://*.example.com"]
     CORS_ALLOW_ORIGINS: list[str] = ["*"]
 
+    # 목록으로 표현하기 어려운 출처 정규식 (전체 일치)
+    # 예: r"https://.*\.example\.(com|net)"
+    CORS_ALLOW_ORIGIN_REGEX: str | None = None
+
     # 자격 증명(쿠키, Authorization 헤더 등) 포함 요청 허용 여부
     # True: 클라이언트가 credentials: 'include'로 요청 시 쿠키/인증 정보 전송 가능
     # 주의: CORS_ALLOW_ORIGINS가 ["*"]일 때는 보안상 False 권장
@@ -67,10 +79,40 @@ class DatabaseSettings(BaseSettings):
     MYSQL_USER: str = Field(default="test")
     MYSQL_PASSWORD: str = Field(default="")  # 환경변수에서 로드
     MYSQL_DB: str = Field(default="poc")
+    # 지정하면 MYSQL_* 대신 이 URL 로 primary 연결 (로컬/벤치마크용 sqlite+aiosqlite 등)
+    DB_URL: str = ""
+
+    # 시작 시 스키마 처리 방식
+    # "revision": alembic_version 1회 조회로 head 여부만 확인 (운영 기본값)
+    # "create_all": Base.metadata.create_all 실행 (로컬 개발용, 테이블마다 왕복 발생)
+    # "skip": 아무것도 하지 않음
+    DB_SCHEMA_CHECK: Literal["revision", "create_all", "skip"] = "revision"
+
+    # 커넥션 풀 (엔진마다, /metrics 의 db_pool_* 로 확인 후 조정)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 5.0  # 미지정 시 session-prod.py 는 30초
+    # 대기 시간 p95 가 목표(초)를 넘으면 max_overflow 를 LIMIT 까지 자동 증감
+    DB_POOL_ADAPTIVE: bool = False
+    DB_POOL_TARGET_WAIT: float = 0.05
+    DB_POOL_MAX_OVERFLOW_LIMIT: int = 50
+
+    # 읽기 복제본 ("host" 또는 "host:port", 계정/DB 는 primary 와 동일)
+    # 비어 있으면 읽기 세션도 primary 사용
+    MYSQL_REPLICA_HOSTS: list[str] = []
+    DB_READ_STRATEGY: Literal["round_robin", "least_connections"] = "round_robin"
+    # 쓰기 커밋 후 이 시간(초) 동안 같은 클라이언트의 읽기도 primary 로 (복제 지연 대비)
+    DB_STICKY_SECONDS: float = 3.0
 
     # Redis 설정
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
+    # 논리 DB(풀) 하나당 최대 연결 수, 모두 사용 중이면 REDIS_POOL_TIMEOUT 초 대기
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT: float = 5.0
+    REDIS_SOCKET_TIMEOUT: float = 2.0
+    # 유휴 연결을 재사용하기 전 PING 확인 주기(초)
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30
 
     model_config = _base_config
 
@@ -79,14 +121,197 @@ class DatabaseSettings(BaseSettings):
         """비동기 MySQL URL 생성 (asyncmy 드라이버 사용, SQLAlchemy 통합 최적화)"""
         return f"mysql+asyncmy://{self.MYSQL_USER}:{self.MYSQL_PASSWORD}@{self.MYSQL_HOST}:{self.MYSQL_PORT}/{self.MYSQL_DB}"
 
+    @property
+    def DATABASE_URL(self) -> str:
+        """primary 비동기 URL (DB_URL 이 비어 있으면 MYSQL_URL)"""
+        return self.DB_URL or self.MYSQL_URL
+
+    @property
+    def MYSQL_REPLICA_URLS(self) -> list[str]:
+        """읽기 복제본 비동기 URL 목록"""
+        urls = []
+        for replica in self.MYSQL_REPLICA_HOSTS:
+            host, _, port = replica.partition(":")
+            urls.append(
+                f"mysql+asyncmy://{self.MYSQL_USER}:{self.MYSQL_PASSWORD}"
+                f"@{host}:{port or self.MYSQL_PORT}/{self.MYSQL_DB}"
+            )
+        return urls
+
     def REDIS_URL(self, db: int = 0) -> str:
         """Redis URL 생성 (db 인수로 기본값 지원)"""
         return f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/{db}"
 
 
+class CacheSettings(BaseSettings):
+    # 페이지 응답 캐시 (Redis)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_TTL: int = 300  # 초, 태그 무효화가 누락돼도 이 시간 후 만료
+    RESPONSE_CACHE_REDIS_DB: int = 2
+
+    # 컴파일된 프롬프트 템플릿 캐시 (프로세스 메모리)
+    # MAX_AGE(초): 다른 프로세스에서 한 관리자 수정이 반영되기까지의 최대 지연
+    PROMPT_CACHE_SIZE: int = 256
+    PROMPT_CACHE_MAX_AGE: float = 60.0
+
+    model_config = _base_config
+
+
+class WorkerSettings(BaseSettings):
+    # 가사 생성 워커 (python -m app.lyrics.worker)
+    WORKER_CONCURRENCY: int = 8  # 프로세스당 동시 처리 작업 수
+    WORKER_MAX_RETRIES: int = 3  # 초과 시 dead-letter 로 이동
+    WORKER_BACKOFF_BASE: float = 1.0  # 재시도 지연(초) = base * 2^시도횟수 (지터 포함)
+    WORKER_BACKOFF_MAX: float = 60.0
+    WORKER_BACKEND: str = "stub"  # 생성 백엔드 이름 (app.lyrics.worker.backends)
+    WORKER_REDIS_DB: int = 3
+
+    model_config = _base_config
+
+
+class RateLimitSettings(BaseSettings):
+    # 요청 속도 제한 (app.dependencies.rate_limit)
+    RATE_LIMIT_ENABLED: bool = True
+    # memory: 워커별로 셈 (워커 N 개면 실제 허용량 N 배) / redis: 워커 간 공유
+    RATE_LIMIT_BACKEND: Literal["memory", "redis"] = "memory"
+    RATE_LIMIT_REDIS_DB: int = 5
+    RATE_LIMIT_DEFAULT: str = "60/minute"  # rate_limit() 에 limit 을 생략했을 때
+    RATE_LIMIT_API_KEY_HEADER: str = "X-API-Key"  # by_api_key 가 읽는 헤더
+    # by_api_key 가 따로 세는 키의 SHA-256 hex (없는 키는 IP 기준)
+    RATE_LIMIT_API_KEYS: set[str] = set()
+    RATE_LIMIT_MEMORY_MAX_KEYS: int = 100_000
+
+    model_config = _base_config
+
+
+class LogSettings(BaseSettings):
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: Literal["json", "text"] = "json"
+    # 큐가 가득 차면 이벤트 루프를 막지 않고 레코드를 버림 (log_records_dropped_total)
+    LOG_QUEUE_SIZE: int = 10000
+    # DEBUG 레코드 중 남길 비율 (개별 로그는 extra={"sample_rate": ...} 로 지정)
+    LOG_DEBUG_SAMPLE_RATE: float = 1.0
+
+    model_config = _base_config
+
+
+class MetricsSettings(BaseSettings):
+    # /metrics (Prometheus 텍스트 형식)
+    METRICS_ENABLED: bool = True  # HTTP 요청 메트릭 미들웨어
+    # uvicorn --workers N 일 때 프로세스별 값을 모을 공유 디렉터리 (배포 시 비우기)
+    METRICS_MULTIPROC_DIR: str = ""
+    METRICS_FLUSH_INTERVAL: float = 1.0  # 초, 다른 워커 값이 /metrics 에 반영되는 지연
+
+    model_config = _base_config
+
+
+class TemplateSettings(BaseSettings):
+    # 운영: TEMPLATE_AUTO_RELOAD=False + 바이트코드 캐시 + (선택) 사전 컴파일
+    TEMPLATE_AUTO_RELOAD: bool = True  # 렌더링마다 파일 mtime 확인 (개발용)
+    TEMPLATE_BYTECODE_CACHE: Literal["none", "filesystem", "redis"] = "none"
+    TEMPLATE_BYTECODE_CACHE_DIR: str = ""  # 비우면 시스템 임시 디렉터리
+    TEMPLATE_BYTECODE_REDIS_DB: int = 4
+    TEMPLATE_PRECOMPILED_DIR: str = ""  # python -m app.core.templating 결과 경로
+    TEMPLATE_WARMUP: bool = True  # 시작 시 모든 템플릿 미리 로드
+
+    model_config = _base_config
+
+
+class CompressionSettings(BaseSettings):
+    # 응답 압축 (CompressionMiddleware), brotli/zstd 는 패키지가 설치된 경우에만 사용
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 500  # 바이트, 이보다 작은 응답은 그대로
+    COMPRESSION_ENCODINGS: list[str] = ["zstd", "br", "gzip"]  # 서버 선호 순서
+    # "/" 로 끝나면 접두어로 비교
+    COMPRESSION_CONTENT_TYPES: list[str] = [
+        "text/",
+        "application/json",
+        "application/javascript",
+        "application/xml",
+        "image/svg+xml",
+    ]
+    # 요청 시 압축은 속도 위주 (정적 파일 사전 압축은 최고 압축률 사용)
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
+
+    model_config = _base_config
+
+
+class StaticSettings(BaseSettings):
+    STATIC_URL: str = "/static"
+    STATIC_DIR: str = "static"
+    # python -m app.core.assets static build/static 결과 (manifest.json 포함)
+    # 비우면 (개발) static_url() 이 원래 경로를 돌려주고 해시 파일 제공 없음
+    STATIC_BUILD_DIR: str = ""
+    # 해시가 없는 파일의 Cache-Control (해시 파일은 항상 1년 immutable)
+    STATIC_CACHE_CONTROL: str = "no-cache"
+
+    model_config = _base_config
+
+
+class MediaSettings(BaseSettings):
+    MEDIA_DIR: str = "media"
+    MEDIA_URL: str = "/media"
+    # 재개 가능한 업로드 (/uploads), 본문은 이 크기 단위로 모아 디스크에 씀
+    MEDIA_UPLOAD_CHUNK_SIZE: int = 1024 * 1024
+    MEDIA_MAX_UPLOAD_SIZE: int = 4 * 1024**3  # 바이트
+    # 업로드 허용 확장자 -> Content-Type (음원/가사만, 그 외 확장자는 415)
+    MEDIA_UPLOAD_TYPES: dict[str, str] = {
+        ".mp3": "audio/mpeg",
+        ".wav": "audio/wav",
+        ".ogg": "audio/ogg",
+        ".m4a": "audio/mp4",
+        ".flac": "audio/flac",
+        ".txt": "text/plain",
+        ".lrc": "text/plain",
+    }
+    MEDIA_UPLOAD_RATE_LIMIT: str = "10/minute"  # 업로드 생성(POST /uploads) 횟수
+    # 이 시간(초) 동안 이어 쓰지 않은 업로드는 정리 (MEDIA_UPLOAD_SWEEP_INTERVAL 마다)
+    MEDIA_UPLOAD_EXPIRY: float = 24 * 3600
+    MEDIA_UPLOAD_SWEEP_INTERVAL: float = 3600
+    # 업로드 완료 후처리 (프로세스 내 태스크 풀)
+    MEDIA_PROCESSING_CONCURRENCY: int = 2
+    MEDIA_PROCESSING_QUEUE_SIZE: int = 1000
+    # /media 스트리밍: 열린 파일(fd + stat) LRU, stat 재확인 주기(초)
+    MEDIA_OPEN_FILES: int = 128
+    MEDIA_STAT_TTL: float = 2.0
+    MEDIA_STREAM_CHUNK_SIZE: int = 256 * 1024
+    MEDIA_MAX_RANGES: int = 16  # multipart/byteranges 최대 구간 수
+
+    model_config = _base_config
+
+
 class SecuritySettings(BaseSettings):
     JWT_SECRET: str = "your-jwt-secret-key"  # 기본값 추가 (필수 필드 안전)
     JWT_ALGORITHM: str = "HS256"  # 기본값 추가 (필수 필드 안전)
+    JWT_LEEWAY: int = 0  # exp/nbf 검사 허용 오차 (초)
+
+    # 검증된 토큰 클레임 캐시 (프로세스 메모리, 토큰 해시 키)
+    AUTH_TOKEN_CACHE_SIZE: int = 10_000
+    AUTH_TOKEN_CACHE_TTL: float = 300.0  # 초, 토큰 exp 보다 길게 캐시하지 않음
+
+    # JTI 블랙리스트 로컬 Bloom 필터 (Redis 와 전체 동기화 주기, 초)
+    AUTH_BLACKLIST_SYNC_INTERVAL: float = 60.0
+    AUTH_BLACKLIST_CAPACITY: int = 100_000
+    AUTH_BLACKLIST_ERROR_RATE: float = 0.001
+
+    model_config = _base_config
+
+
+class PermissionSettings(BaseSettings):
+    # 역할 -> 권한 목록 (시작 시 비트마스크 표로 컴파일, "*" 는 전체 권한)
+    # 환경변수는 JSON: PERMISSION_POLICY='{"admin": ["*"], "viewer": ["lyrics:read"]}'
+    PERMISSION_POLICY: dict[str, list[str]] = {
+        "admin": ["*"],
+        "editor": ["lyrics:read", "lyrics:write", "media:upload"],
+        "viewer": ["lyrics:read"],
+    }
+    # 사용자 역할 출처: 토큰 roles 클레임 / groups 테이블 (user_group_association)
+    PERMISSION_ROLE_SOURCE: Literal["claims", "groups"] = "claims"
+    # 사용자별 유효 권한 캐시 (그룹 변경 시 invalidate_user_permissions 로 즉시 무효화)
+    PERMISSION_CACHE_SIZE: int = 10_000
+    PERMISSION_CACHE_TTL: float = 300.0
 
     model_config = _base_config
 
@@ -115,7 +340,25 @@ db_settings = DatabaseSettings()
 security_settings = SecuritySettings()
 notification_settings = NotificationSettings()
 cors_settings = CORSSettings()
+cache_settings = CacheSettings()
+worker_settings = WorkerSettings()
+template_settings = TemplateSettings()
+metrics_settings = MetricsSettings()
+log_settings = LogSettings()
+rate_limit_settings = RateLimitSettings()
+permission_settings = PermissionSettings()
+compression_settings = CompressionSettings()
+static_settings = StaticSettings()
+media_settings = MediaSettings()
 
 templates_dir = PROJECT_DIR / "app" / "templates"
-templates = Jinja2Templates(directory=str(templates_dir))
-print(f"templates path : {templates}")
+templates = Jinja2Templates(
+    env=build_template_env(templates_dir, template_settings, db_settings)
+)
+logger.debug("templates path: %s", templates_dir)
+
+# 템플릿에서 {{ static_url("css/site.css") }} -> 매니페스트의 해시 URL
+asset_manifest = AssetManifest.load(
+    static_settings.STATIC_BUILD_DIR, static_settings.STATIC_URL
+)
+templates.env.globals["static_url"] = asset_manifest.url
@@ -1,14 +1,28 @@
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 
 from app.admin_manager import init_admin
 from app.core.common import lifespan
+from app.core.logging import setup_logging
+from app.core.metrics import router as metrics_router
 from app.database.session import engine
 from app.home.api.routers.v1.router import router as home_router
 from app.lyrics.api.routers.v1.router import router as lyrics_router
-from app.utils.cors import CustomCORSMiddleware
-from config import prj_settings
+from app.media.api.routers.v1.router import router as media_router
+from app.media.streaming import MediaFiles, OpenFileCache
+from app.utils.middleware import install
+from app.utils.middleware.stack import MIDDLEWARE
+from app.utils.static import HashedStaticFiles
+from config import (
+    asset_manifest,
+    compression_settings,
+    log_settings,
+    media_settings,
+    prj_settings,
+    static_settings,
+)
+
+# 로그 출력은 QueueListener 스레드에서 (이벤트 루프가 stdout 쓰기로 막히지 않도록)
+setup_logging(log_settings)
 
 app = FastAPI(
     title=prj_settings.PROJECT_NAME,
@@ -19,20 +33,37 @@ app = FastAPI(
 
 init_admin(app, engine)
 
-custom_cors_middleware = CustomCORSMiddleware(app)
-custom_cors_middleware.configure_cors()
-
-app.mount("/static", StaticFiles(directory="static"), name="static")
-app.mount("/media", StaticFiles(directory="media"), name="media")
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_methods=["*"],
-    allow_headers=["*"],
-    allow_credentials=True,
-    max_age=-1,
+# 해시 파일(STATIC_BUILD_DIR)은 메모리 색인으로 immutable 캐시,
+# 미리 압축한 .gz/.br/.zst 가 있으면 그대로 전송
+app.mount(
+    static_settings.STATIC_URL,
+    HashedStaticFiles(
+        directory=static_settings.STATIC_DIR,
+        manifest=asset_manifest,
+        cache_control=static_settings.STATIC_CACHE_CONTROL,
+        encodings=compression_settings.COMPRESSION_ENCODINGS,
+    ),
+    name="static",
+)
+# 미디어는 Range 탐색이 잦으므로 열린 파일(fd + stat)을 재사용
+app.mount(
+    media_settings.MEDIA_URL,
+    MediaFiles(
+        directory=media_settings.MEDIA_DIR,
+        open_files=OpenFileCache(
+            maxsize=media_settings.MEDIA_OPEN_FILES,
+            ttl=media_settings.MEDIA_STAT_TTL,
+        ),
+        chunk_size=media_settings.MEDIA_STREAM_CHUNK_SIZE,
+        max_ranges=media_settings.MEDIA_MAX_RANGES,
+    ),
+    name="media",
 )
 
+# 미들웨어 순서는 app/utils/middleware/stack.py 한 곳에서 관리
+install(app, MIDDLEWARE)
+
+app.include_router(metrics_router)
 app.include_router(home_router)
 app.include_router(lyrics_router)
+app.include_router(media_router)